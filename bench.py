@@ -0,0 +1,399 @@
+"""Benchmarks for the appliance finder: the recommender in-process and every endpoint over HTTP
+
+For each catalog size a synthetic database is generated and bulk loaded
+(see `dtbs.py generate-catalog` / `load-catalog`), a server is started
+against it and driven by a closed-loop load generator. Results, including
+latency percentiles, throughput and server RSS, are written as JSON so runs
+can be compared across releases:
+
+    python bench.py --sizes seed 10000 100000 --concurrency 8 --duration 10
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DTBS = os.path.join(HERE, 'dtbs.py')
+IMAGE_DIR = os.path.join(HERE, 'appliance_images')
+
+# Request name -> relative weight; override with --mix name=weight,...
+DEFAULT_MIX = {'recommend': 60, 'categories': 10, 'subcategories': 10, 'index': 10, 'image': 10}
+BUDGETS = (5000, 15000, 30000, 50000, 100000)
+
+
+# Catalogs
+def catalog_db(size, workdir):
+    """Database path for a catalog size, generating and loading it on first use
+
+    'seed' is the sample catalog a fresh database is migrated with.
+    """
+    path = os.path.join(workdir, f'catalog-{size}.db')
+    if os.path.exists(path):
+        return path
+    if size == 'seed':
+        # Importing dtbs migrates a fresh database, seeding the sample catalog
+        subprocess.run([sys.executable, '-c', 'import dtbs'], cwd=HERE, check=True,
+                       env={**os.environ, 'APPLIANCES_DB': path})
+        return path
+    records = os.path.join(workdir, f'catalog-{size}.csv')
+    run_dtbs(['generate-catalog', '--count', str(size), '--output', records], path)
+    run_dtbs(['load-catalog', records, '--db', path, '--replace'], path)
+    os.remove(records)
+    return path
+
+
+def run_dtbs(args, db_path):
+    subprocess.run([sys.executable, DTBS, *args], cwd=HERE, check=True, stdout=subprocess.DEVNULL,
+                   env={**os.environ, 'APPLIANCES_DB': db_path})
+
+
+# Direct benchmark
+def bench_direct(db_path, iterations, seed):
+    """Time recommend_appliances in a child process importing dtbs against `db_path`"""
+    output = subprocess.run(
+        [sys.executable, __file__, 'direct', '--db', db_path, '--iterations', str(iterations),
+         '--seed', str(seed)],
+        cwd=HERE, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def direct_main(args):
+    os.environ['APPLIANCES_DB'] = args.db
+    sys.path.insert(0, HERE)
+    import dtbs
+
+    started = time.perf_counter()
+    catalog = dtbs.get_catalog()
+    load_seconds = time.perf_counter() - started
+    rng = random.Random(args.seed)
+    categories = sorted(set(catalog.category_id.tolist()))
+    latencies = []
+    for _ in range(args.iterations):
+        category_id = rng.choice([None] + categories)
+        started = time.perf_counter()
+        dtbs.recommend_appliances(category_id, None, float(rng.choice(BUDGETS)), rng.randint(0, 100) / 100)
+        latencies.append(time.perf_counter() - started)
+    print(json.dumps({"catalog_rows": len(catalog), "snapshot_load_s": round(load_seconds, 4),
+                      **summarize(latencies, sum(latencies))}))
+    return 0
+
+
+# HTTP load generator
+class Target:
+    """Requests the load generator can issue, built from the running server's own data"""
+
+    def __init__(self, port):
+        self.port = port
+        categories = self.get_json('/api/categories')
+        self.category_ids = [category['id'] for category in categories]
+        self.images = self.image_paths()
+
+    def image_paths(self):
+        """Image URLs the server actually serves
+
+        Recommendations carry hashed URLs after `dtbs.py build-images`, and
+        otherwise the stored ones, whose names need not match the files on
+        disk; without any that resolve, the originals under appliance_images/
+        are requested by name.
+        """
+        sample = self.get_json('/api/recommend', {'budget': 100000, 'eco_priority': 0.5, 'limit': 20})
+        paths = {'/' + product['image_url'].lstrip('/') for product in sample['recommendations']
+                 if product['image_url']}
+        found = [path for path in sorted(paths) if self.status(path) < 300]
+        if not found and os.path.isdir(IMAGE_DIR):
+            paths = (f'/appliance_images/{name}' for name in sorted(os.listdir(IMAGE_DIR))
+                     if os.path.isfile(os.path.join(IMAGE_DIR, name)))
+            found = [path for path in paths if self.status(path) < 300]
+        return found
+
+    def status(self, path):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+        try:
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+    def get_json(self, path, body=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+        try:
+            if body is None:
+                connection.request('GET', path)
+            else:
+                connection.request('POST', path, json.dumps(body), {'Content-Type': 'application/json'})
+            return json.loads(connection.getresponse().read())
+        finally:
+            connection.close()
+
+    def request(self, name, rng):
+        """(method, path, body) for one request of the given kind"""
+        if name == 'recommend':
+            return 'POST', '/api/recommend', json.dumps({
+                'category_id': rng.choice([None] + self.category_ids),
+                'budget': rng.choice(BUDGETS),
+                'eco_priority': rng.randint(0, 100) / 100,
+            })
+        if name == 'categories':
+            return 'GET', '/api/categories', None
+        if name == 'subcategories':
+            return 'GET', f'/api/subcategories/{rng.choice(self.category_ids)}', None
+        if name == 'index':
+            return 'GET', '/', None
+        if name == 'image':
+            return 'GET', rng.choice(self.images), None
+        raise ValueError(f'unknown request kind {name!r}')
+
+
+def generate_load(target, mix, concurrency, duration, seed):
+    """Closed-loop load: each worker sends its next request as soon as the last one completes
+
+    Returns {request kind: [(latency seconds, ok), ...]} and the measured wall time,
+    where `ok` means a 2xx response.
+    """
+    names, weights = zip(*mix.items())
+    samples = {name: [] for name in names}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(worker_seed):
+        rng = random.Random(worker_seed)
+        connection = http.client.HTTPConnection('127.0.0.1', target.port, timeout=30)
+        local = {name: [] for name in names}
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            method, path, body = target.request(name, rng)
+            headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip, br'} if body else \
+                {'Accept-Encoding': 'gzip, br'}
+            started = time.perf_counter()
+            try:
+                connection.request(method, path, body, headers)
+                response = connection.getresponse()
+                response.read()
+                ok = 200 <= response.status < 300
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', target.port, timeout=30)
+                ok = False
+            local[name].append((time.perf_counter() - started, ok))
+        connection.close()
+        with lock:
+            for name, values in local.items():
+                samples[name].extend(values)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(seed + i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - started
+
+
+def summarize(latencies, elapsed, errors=0):
+    """Percentiles of successful requests' latencies; failed requests only count towards `errors`"""
+    latencies_ms = np.asarray(latencies, dtype=np.float64) * 1000
+    if not len(latencies_ms):
+        return {"requests": 0, "errors": errors}
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "rps": round(len(latencies_ms) / elapsed, 1),
+        "mean_ms": round(float(latencies_ms.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(latencies_ms.max()), 3),
+    }
+
+
+# Server process
+def tree_rss_bytes(pid):
+    """Resident set size of a process and its descendants (e.g. gunicorn workers), Linux only"""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/status') as f:
+                total += next(int(line.split()[1]) * 1024 for line in f if line.startswith('VmRSS:'))
+            with open(f'/proc/{current}/task/{current}/children') as f:
+                pending.extend(int(child) for child in f.read().split())
+        except (OSError, StopIteration):
+            continue
+    return total or None
+
+
+class RssSampler(threading.Thread):
+    """Peak server RSS, sampled in the background while load runs"""
+
+    def __init__(self, pid, interval=0.1):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak = None
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.is_set():
+            rss = tree_rss_bytes(self.pid)
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+            self.stopping.wait(self.interval)
+
+    def stop(self):
+        self.stopping.set()
+        self.join()
+        return self.peak
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(db_path, server, workers):
+    port = free_port()
+    env = {**os.environ, 'APPLIANCES_DB': db_path}
+    if server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-w', str(workers), '--threads', '4',
+                   '-b', f'127.0.0.1:{port}', 'dtbs:app']
+    else:
+        command = [sys.executable, DTBS, 'serve', '--port', str(port)]
+    process = subprocess.Popen(command, cwd=HERE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'server exited with status {process.returncode}')
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError('server did not start listening')
+
+
+def bench_http(db_path, args):
+    process, port = start_server(db_path, args.server, args.workers)
+    try:
+        target = Target(port)
+        mix = {name: weight for name, weight in args.mix.items() if name != 'image' or target.images}
+        # Warm the snapshot, page and caches so the measured window is steady state
+        generate_load(target, mix, args.concurrency, args.warmup, args.seed)
+        idle_rss = tree_rss_bytes(process.pid)
+        sampler = RssSampler(process.pid)
+        sampler.start()
+        samples, elapsed = generate_load(target, mix, args.concurrency, args.duration, args.seed)
+        peak_rss = sampler.stop()
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    def summarize_samples(values):
+        return summarize([latency for latency, ok in values if ok], elapsed, sum(not ok for _, ok in values))
+
+    return {
+        "endpoints": {name: summarize_samples(values) for name, values in samples.items()},
+        "total": summarize_samples([sample for values in samples.values() for sample in values]),
+        "server_rss_mb": {"idle": idle_rss and round(idle_rss / 2 ** 20, 1),
+                          "peak": peak_rss and round(peak_rss / 2 ** 20, 1)},
+    }
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise argparse.ArgumentTypeError(f'unknown request kinds: {", ".join(sorted(unknown))}')
+    return mix
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+    direct = commands.add_parser('direct', help='(internal) time recommend_appliances in-process')
+    direct.add_argument('--db', required=True)
+    direct.add_argument('--iterations', type=int, default=2000)
+    direct.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sizes', nargs='+', default=['seed', '10000', '100000'],
+                        help="catalog sizes to run, 'seed' for the sample catalog")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10, help='measured seconds per catalog size')
+    parser.add_argument('--warmup', type=float, default=2)
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='request weights, e.g. recommend=80,image=20')
+    parser.add_argument('--iterations', type=int, default=2000, help='direct recommend_appliances calls')
+    parser.add_argument('--server', choices=['flask', 'gunicorn'], default='flask')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    parser.add_argument('--workdir', default=os.path.join(tempfile.gettempdir(), 'dtbs-bench'),
+                        help='where generated catalogs are kept between runs')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_results.json')
+    args = parser.parse_args(argv)
+
+    if args.command == 'direct':
+        return direct_main(args)
+
+    os.makedirs(args.workdir, exist_ok=True)
+    runs = []
+    for size in args.sizes:
+        size = size if size == 'seed' else int(size)
+        db_path = catalog_db(size, args.workdir)
+        run = {"catalog_size": size,
+               "direct": bench_direct(db_path, args.iterations, args.seed),
+               "http": bench_http(db_path, args)}
+        runs.append(run)
+        total, direct = run["http"]["total"], run["direct"]
+        print(f'{size}: recommend_appliances p50 {direct["p50_ms"]} ms p99 {direct["p99_ms"]} ms | '
+              f'HTTP {total.get("rps")} req/s p50 {total.get("p50_ms")} ms p95 {total.get("p95_ms")} ms '
+              f'p99 {total.get("p99_ms")} ms errors {total["errors"]} | '
+              f'peak RSS {run["http"]["server_rss_mb"]["peak"]} MB', file=sys.stderr)
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "server": args.server,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "mix": args.mix,
+        },
+        "runs": runs,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,413 @@
+"""Build step for the front-end assets the index page links to
+
+Vendors Bootstrap, Font Awesome and the background photo, tree-shakes the
+CSS down to the selectors the page uses, subsets the icon font to the
+glyphs that CSS still names and writes everything content-hashed under
+assets/ with a manifest that dtbs.py serves from:
+
+    python build_assets.py [--vendor DIR]
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+
+from dtbs import ASSET_DIR, ASSET_MANIFEST_PATH, HTML_TEMPLATE, Blob
+
+# Pristine third-party files; downloaded on first build, or copied in by hand for air-gapped hosts
+ASSET_VENDOR_DIR = os.path.join(ASSET_DIR, 'vendor')
+VENDOR_ASSETS = {
+    'bootstrap.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/css/bootstrap.min.css',
+    'fontawesome.min.css': 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.2.0/css/all.min.css',
+    'fa-solid-900.woff2': 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.2.0/webfonts/fa-solid-900.woff2',
+    'background.jpg': 'https://images.unsplash.com/photo-1476231682828-37e571bc172f'
+                      '?ixlib=rb-1.2.1&auto=format&fit=crop&w=1350&q=80',
+}
+# The background sits under a 92% white overlay, so heavy compression is invisible
+BACKGROUND_WIDTH = 1350
+BACKGROUND_FORMATS = {
+    'jpeg': ('jpg', {'quality': 60, 'optimize': True, 'progressive': True}),
+    'webp': ('webp', {'quality': 55, 'method': 6}),
+}
+# At-rules whose block holds further rules rather than declarations
+NESTED_AT_RULES = ('@media', '@supports', '@container', '@layer')
+
+
+def fetch_vendor_assets(vendor_dir=ASSET_VENDOR_DIR):
+    """Path of every vendored file, downloading the ones not already on disk"""
+    import urllib.request
+
+    os.makedirs(vendor_dir, exist_ok=True)
+    paths = {}
+    for name, url in VENDOR_ASSETS.items():
+        path = paths[name] = os.path.join(vendor_dir, name)
+        if not os.path.exists(path):
+            with urllib.request.urlopen(url, timeout=30) as response:
+                body = response.read()
+            with open(f'{path}.tmp', 'wb') as f:
+                f.write(body)
+            os.replace(f'{path}.tmp', path)
+    return paths
+
+
+def parse_css(text):
+    """Rules of a stylesheet as (prelude, body) pairs
+
+    The body is a list of rules for @media-like blocks, the raw block text for
+    style rules and @keyframes/@font-face, and None for statements such as
+    @charset and /*! license */ comments.
+    """
+    rules, _ = _parse_css_rules(text, 0)
+    return rules
+
+
+def _parse_css_rules(text, i):
+    rules = []
+    start = i
+    while i < len(text):
+        char = text[i]
+        if text.startswith('/*', i):
+            close = text.find('*/', i + 2)
+            close = len(text) if close < 0 else close + 2
+            if text.startswith('/*!', i):
+                rules.append((text[i:close], None))
+            i = start = close
+        elif char in '"\'':
+            i = _skip_string(text, i)
+        elif char == ';':
+            rules.append((text[start:i].strip(), None))
+            i = start = i + 1
+        elif char == '{':
+            prelude = text[start:i].strip()
+            if prelude.lower().startswith(NESTED_AT_RULES):
+                body, i = _parse_css_rules(text, i + 1)
+            else:
+                close = _block_end(text, i)
+                body, i = text[i + 1:close].strip(), close
+            rules.append((prelude, body))
+            i = start = i + 1
+        elif char == '}':
+            return rules, i
+        else:
+            i += 1
+    return rules, i
+
+
+def _skip_string(text, i):
+    quote = text[i]
+    i += 1
+    while i < len(text) and text[i] != quote:
+        i += 2 if text[i] == '\\' else 1
+    return i + 1
+
+
+def _block_end(text, i):
+    """Index of the brace closing the block opened at text[i]"""
+    depth = 0
+    while i < len(text):
+        if text[i] in '"\'':
+            i = _skip_string(text, i)
+            continue
+        if text[i] == '{':
+            depth += 1
+        elif text[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return i
+
+
+def serialize_css(rules):
+    parts = []
+    for prelude, body in rules:
+        if body is None:
+            parts.append(prelude if prelude.startswith('/*') else f'{prelude};')
+        elif isinstance(body, list):
+            parts.append(f'{prelude}{{{serialize_css(body)}}}')
+        else:
+            parts.append(f'{prelude}{{{body}}}')
+    return ''.join(parts)
+
+
+def _declarations(body):
+    """Split a declaration block on top-level semicolons"""
+    declarations, depth, start, i = [], 0, 0, 0
+    while i < len(body):
+        char = body[i]
+        if char in '"\'':
+            i = _skip_string(body, i)
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ';' and depth == 0:
+            declarations.append(body[start:i].strip())
+            start = i + 1
+        i += 1
+    declarations.append(body[start:].strip())
+    return [declaration for declaration in declarations if declaration]
+
+
+def _selector_used(selector, classes, ids, tags):
+    """Whether every class, id and element named by a selector occurs in the page"""
+    selector = re.sub(r'\[[^\]]*\]|::?[\w-]+(\([^)]*\))?', ' ', selector)
+    if any(name not in classes for name in re.findall(r'\.(-?[_a-zA-Z][\w-]*)', selector)):
+        return False
+    if any(name not in ids for name in re.findall(r'#(-?[_a-zA-Z][\w-]*)', selector)):
+        return False
+    selector = re.sub(r'[.#]-?[_a-zA-Z][\w-]*', ' ', selector)
+    return all(name.lower() in tags for name in re.findall(r'[a-zA-Z][\w-]*', selector))
+
+
+def _shake_rules(rules, classes, ids, tags):
+    kept = []
+    for prelude, body in rules:
+        if body is None:
+            if prelude.startswith('/*!'):
+                kept.append((prelude, body))
+        elif isinstance(body, list):
+            body = _shake_rules(body, classes, ids, tags)
+            if body:
+                kept.append((prelude, body))
+        elif prelude.startswith('@'):
+            kept.append((prelude, body))
+        else:
+            selectors = [selector.strip() for selector in prelude.split(',')
+                         if _selector_used(selector, classes, ids, tags)]
+            if selectors:
+                kept.append((','.join(selectors), body))
+    return kept
+
+
+def tree_shake_css(text, classes, ids, tags, references='', fonts=None):
+    """Drop the rules, custom properties, keyframes and font faces a page never uses
+
+    `references` is extra text (the page's own CSS and JS) searched for
+    var(), animation and font-family names. `fonts` maps a font file name to
+    the URL it is served from; @font-face sources not in it are dropped.
+    """
+    rules = _shake_rules(parse_css(text), classes, ids, tags)
+    fonts = fonts or {}
+
+    def walk(rules):
+        for prelude, body in rules:
+            if isinstance(body, list):
+                yield from walk(body)
+            elif body is not None:
+                yield prelude, body
+
+    def styles():
+        return ' '.join(body for prelude, body in walk(rules) if not prelude.startswith('@')) + references
+
+    # Custom properties can reference each other, so prune until nothing changes
+    while True:
+        used = styles()
+        changed = False
+
+        def prune(rules):
+            nonlocal changed
+            pruned = []
+            for prelude, body in rules:
+                if isinstance(body, list):
+                    body = prune(body)
+                    if not body:
+                        continue
+                elif body is not None and not prelude.startswith('@'):
+                    declarations = [declaration for declaration in _declarations(body)
+                                    if not declaration.startswith('--')
+                                    or f'var({declaration.split(":", 1)[0].strip()}' in used]
+                    changed |= len(declarations) != len(_declarations(body))
+                    if not declarations:
+                        continue
+                    body = ';'.join(declarations)
+                pruned.append((prelude, body))
+            return pruned
+
+        rules = prune(rules)
+        if not changed:
+            break
+
+    used = styles()
+
+    def finish(rules):
+        finished = []
+        for prelude, body in rules:
+            if isinstance(body, list):
+                body = finish(body)
+                if not body:
+                    continue
+            elif prelude.lower().startswith(('@keyframes', '@-webkit-keyframes')):
+                if not re.search(rf'(?<![\w-]){re.escape(prelude.split()[-1])}(?![\w-])', used):
+                    continue
+            elif prelude.lower() == '@font-face':
+                body = _localize_font_face(body, used, fonts)
+                if body is None:
+                    continue
+            finished.append((prelude, body))
+        return finished
+
+    return serialize_css(finish(rules))
+
+
+def _localize_font_face(body, used, fonts):
+    declarations = dict(declaration.split(':', 1) for declaration in _declarations(body))
+    family = declarations.get('font-family', '').strip().strip('"\'')
+    if not family or family not in used:
+        return None
+    sources = []
+    for source in re.split(r',(?![^(]*\))', declarations.get('src', '')):
+        match = re.search(r'url\(\s*["\']?([^"\')]+)', source)
+        if match and os.path.basename(match.group(1)) in fonts:
+            sources.append(f'url({fonts[os.path.basename(match.group(1))]}) format("woff2")')
+    if not sources:
+        return None
+    declarations['src'] = ','.join(sources)
+    return ';'.join(f'{name}:{value}' for name, value in declarations.items())
+
+
+def css_codepoints(text):
+    """Code points named by CSS `content` escapes such as "\\f00c" """
+    return {int(code, 16) for code in re.findall(r'"\\([0-9a-fA-F]{4,6})"', text)}
+
+
+def page_selectors(html):
+    """(classes, ids, tags) named anywhere in a page, and those in its static markup alone
+
+    Class names built by scripts cannot be found reliably, so every word in
+    the page counts for the full stylesheet; only markup outside <script>
+    counts for the critical CSS inlined into the first response.
+    """
+    markup = re.sub(r'<(script|style)\b.*?</\1>', '', html, flags=re.S)
+    words = set(re.findall(r'[\w-]+', html))
+    tags = set(re.findall(r'<([a-z][a-z0-9]*)', html)) | set(re.findall(r'createElement\([\'"](\w+)', html))
+    everything = (words, words, tags | {'html', 'body'})
+    critical = (
+        {name for value in re.findall(r'class="([^"]*)"', markup) for name in value.split()},
+        set(re.findall(r'id="([^"]*)"', markup)),
+        set(re.findall(r'<([a-z][a-z0-9]*)', markup)) | {'html', 'body'},
+    )
+    return everything, critical
+
+
+def subset_font(data, codepoints):
+    """WOFF2 font cut down to the given code points, or unchanged without fontTools"""
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return data
+    # Keep the original timestamp so an unchanged build hashes to the same file name
+    font = TTFont(io.BytesIO(data), recalcTimestamp=False)
+    options = subset.Options()
+    options.flavor = 'woff2'
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    font.save(buffer)
+    return buffer.getvalue()
+
+
+def build_frontend_assets(vendor_dir=ASSET_VENDOR_DIR, manifest_path=ASSET_MANIFEST_PATH):
+    """Vendor, tree-shake and fingerprint the page's CSS, icon font and background image
+
+    Writes content-hashed files (with gzip/brotli siblings for CSS) and a
+    manifest holding the critical CSS that the index page inlines.
+    """
+    from PIL import Image, ImageOps  # build-time only dependency
+
+    paths = fetch_vendor_assets(vendor_dir)
+    output_dir = os.path.dirname(manifest_path)
+    os.makedirs(output_dir, exist_ok=True)
+    files = {}
+
+    def write(stem, extension, body, mimetype):
+        name = f'{stem}.{hashlib.sha256(body).hexdigest()[:10]}.{extension}'
+        entry = files[name] = {"size": len(body), "type": mimetype, "variants": {}}
+        with open(os.path.join(output_dir, name), 'wb') as f:
+            f.write(body)
+        if mimetype.startswith('text/'):
+            for coding, blob in Blob(body).compressed().items():
+                variant = f'{name}.{"gz" if coding == "gzip" else coding}'
+                entry["variants"][coding] = {"file": variant, "size": len(blob.body)}
+                with open(os.path.join(output_dir, variant), 'wb') as f:
+                    f.write(blob.body)
+        return name
+
+    def read(name):
+        with open(paths[name], 'rb') as f:
+            return f.read()
+
+    page = HTML_TEMPLATE
+    everything, critical = page_selectors(page)
+    vendor_css = read('bootstrap.min.css').decode() + read('fontawesome.min.css').decode()
+    # Page CSS and JS decide which custom properties, animations and fonts are live
+    references = ' '.join(re.findall(r'<(?:style|script)\b.*?</(?:style|script)>', page, flags=re.S))
+
+    stylesheet = tree_shake_css(vendor_css, *everything, references)
+    font = subset_font(read('fa-solid-900.woff2'), css_codepoints(stylesheet + references))
+    font_name = write('fa-solid-900', 'woff2', font, 'font/woff2')
+    fonts = {'fa-solid-900.woff2': f'/{ASSET_DIR}/{font_name}'}
+    stylesheet = tree_shake_css(vendor_css, *everything, references, fonts)
+    critical_css = tree_shake_css(vendor_css, *critical, references, fonts)
+    stylesheet_name = write('app', 'css', stylesheet.encode(), 'text/css')
+
+    with Image.open(paths['background.jpg']) as source:
+        image = ImageOps.exif_transpose(source).convert('RGB')
+    if image.width > BACKGROUND_WIDTH:
+        image = image.resize((BACKGROUND_WIDTH, round(image.height * BACKGROUND_WIDTH / image.width)),
+                             Image.LANCZOS)
+    background = {}
+    for fmt, (extension, options) in BACKGROUND_FORMATS.items():
+        buffer = io.BytesIO()
+        image.save(buffer, fmt.upper(), **options)
+        # WebP is only offered when it actually beats the JPEG fallback
+        if fmt != 'jpeg' and buffer.tell() >= files[background['jpeg'].rsplit('/', 1)[1]]["size"]:
+            continue
+        background[fmt] = f'/{ASSET_DIR}/' + write('background', extension, buffer.getvalue(), f'image/{fmt}')
+
+    referenced = set(files) | {variant["file"] for entry in files.values() for variant in entry["variants"].values()}
+    for name in os.listdir(output_dir):
+        path = os.path.join(output_dir, name)
+        if os.path.isfile(path) and name not in referenced and name != os.path.basename(manifest_path):
+            os.remove(path)
+
+    manifest = {"critical_css": critical_css, "stylesheet": f'/{ASSET_DIR}/{stylesheet_name}',
+                "background": background, "files": files}
+    tmp_path = f'{manifest_path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return {"vendor_css_bytes": len(vendor_css.encode()), "css_bytes": len(stylesheet.encode()),
+            "critical_css_bytes": len(critical_css.encode()), "font_bytes": len(font),
+            "vendor_font_bytes": len(read('fa-solid-900.woff2')),
+            "background_bytes": {fmt: files[url.rsplit('/', 1)[1]]["size"] for fmt, url in background.items()}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vendor', default=ASSET_VENDOR_DIR,
+                        help='directory of vendored files; missing ones are downloaded')
+    args = parser.parse_args(argv)
+
+    try:
+        fetch_vendor_assets(args.vendor)
+    except OSError as e:
+        print(f'cannot fetch vendor assets ({e}); copy {", ".join(VENDOR_ASSETS)} into {args.vendor}',
+              file=sys.stderr)
+        return 1
+    stats = build_frontend_assets(args.vendor)
+    print(f"CSS {stats['vendor_css_bytes'] / 1e3:.0f} kB -> {stats['css_bytes'] / 1e3:.0f} kB "
+          f"({stats['critical_css_bytes'] / 1e3:.0f} kB critical, inlined); "
+          f"icon font {stats['vendor_font_bytes'] / 1e3:.0f} kB -> {stats['font_bytes'] / 1e3:.0f} kB; "
+          f"background {', '.join(f'{fmt} {size / 1e3:.0f} kB' for fmt, size in stats['background_bytes'].items())}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,902 +1,824 @@
-from flask import Flask, render_template_string, request, jsonify, send_from_directory
+from flask import Flask, render_template_string, request, jsonify, send_from_directory, abort, g, has_request_context
+from werkzeug.wsgi import wrap_file
 from datetime import datetime
 import random
 import sqlite3
 import os
-from contextlib import closing
+import sys
+import re
+import argparse
+import io
+import csv
+import multiprocessing
+import collections
+import gzip
+import mimetypes
+import ast
+import json
+import threading
+import time
+import queue
+import heapq
+import hashlib
+import hmac
+import cProfile
+import pstats
+import functools
+import itertools
+import base64
+import bisect
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import brotli
+except ImportError:  # optional: pages are still served raw and gzip-encoded
+    brotli = None
 
 app = Flask(__name__)
 
 
+# Catalog ingest: raw seed strings are parsed once here so requests never have to
+ENERGY_TIER_NA = 0
+
+# Recommender energy score per tier; unrated (NA) appliances get 2, anything else 1
+ENERGY_SCORES = {5: 5, 4: 4, 3: 3, ENERGY_TIER_NA: 2}
+
+PARSED_COLUMNS = [
+    ('energy_tier', 'INTEGER'),
+    ('annual_kwh', 'REAL'),
+    ('features_json', 'TEXT'),
+]
+
+
+def parse_energy_tier(rating):
+    """Star count of an energy rating ('5 Star', '4 star', ...), ENERGY_TIER_NA when unrated"""
+    match = re.search(r'(\d+)\s*star', rating or '', re.IGNORECASE)
+    return int(match.group(1)) if match else ENERGY_TIER_NA
+
+
+def parse_annual_kwh(consumption):
+    match = re.match(r'\s*(\d+(?:\.\d+)?)', consumption or '')
+    return float(match.group(1)) if match else None
+
+
+def parse_features(raw):
+    """Feature list from the stored string, tolerating the unescaped quotes in some seed rows"""
+    if not raw:
+        return []
+    try:
+        return json.loads(raw)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return [f.strip(' "') for f in raw.strip().strip('[]').split('", "')]
+
+
+def migrate_parsed_columns(cursor):
+    """Add the typed columns derived from the raw appliance strings"""
+    existing = {row[1] for row in cursor.execute('PRAGMA table_info(appliances)')}
+    for name, sql_type in PARSED_COLUMNS:
+        if name not in existing:
+            cursor.execute(f'ALTER TABLE appliances ADD COLUMN {name} {sql_type}')
+
+
+# Rows whose typed columns are missing: new rows, and rows whose raw strings changed (see create_ingest_triggers)
+PENDING_INGEST = 'energy_tier IS NULL OR features_json IS NULL'
+INGEST_ROWS_QUERY = f'''
+SELECT rowid, energy_rating, annual_consumption, features
+FROM appliances
+WHERE {PENDING_INGEST}
+'''
+PENDING_INGEST_QUERY = f'SELECT EXISTS (SELECT 1 FROM appliances WHERE {PENDING_INGEST})'
+
+
+def ingest_appliances(cursor):
+    """Fill the typed columns for every appliance that has not been ingested yet"""
+    rows = cursor.execute(INGEST_ROWS_QUERY).fetchall()
+    cursor.executemany(
+        'UPDATE appliances SET energy_tier = ?, annual_kwh = ?, features_json = ? WHERE rowid = ?',
+        [(parse_energy_tier(rating), parse_annual_kwh(consumption),
+          json.dumps(parse_features(features)), rowid)
+         for rowid, rating, consumption, features in rows]
+    )
+    return len(rows)
+
+
 # SQLite Database Setup
-def init_db():
-    with closing(sqlite3.connect('../appliances.db')) as db:
-        cursor = db.cursor()
+DB_PATH = os.environ.get('APPLIANCES_DB', '../appliances.db')
 
-        # Drop tables if they exist to start fresh
-        cursor.execute('DROP TABLE IF EXISTS appliances')
-        cursor.execute('DROP TABLE IF EXISTS subcategories')
-        cursor.execute('DROP TABLE IF EXISTS categories')
-
-        # Create tables
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS categories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS subcategories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            FOREIGN KEY (category_id) REFERENCES categories (id)
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS appliances (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            brand TEXT NOT NULL,
-            price REAL NOT NULL,
-            energy_rating TEXT NOT NULL,
-            annual_consumption TEXT,
-            features TEXT,
-            image_url TEXT,
-            category_id INTEGER NOT NULL,
-            subcategory_id INTEGER NOT NULL,
-            FOREIGN KEY (category_id) REFERENCES categories (id),
-            FOREIGN KEY (subcategory_id) REFERENCES subcategories (id)
-        )
-        ''')
-
-        # Insert sample data if tables are empty
-        if not cursor.execute('SELECT COUNT(*) FROM categories').fetchone()[0]:
-            # Insert categories
-            categories = [
-                ('Kitchen Appliances',),
-                ('Laundry & Cleaning Appliances',),
-                ('Heating, Cooling, & Air Quality',),
-                ('Home Entertainment & Smart Devices',),
-                ('Smart Home & Security',),
-                ('Personal Care & Grooming',),
-                ('Miscellaneous Home Appliances',)
-            ]
-            cursor.executemany('INSERT INTO categories (name) VALUES (?)', categories)
-
-            # Insert subcategories
-            subcategories = [
-                # Kitchen Appliances (1)
-                (1, 'Refrigerator'), (1, 'Microwave Oven'),
-                (1, 'Electric Stove'), (1, 'Dishwasher'),
-                (1, 'Blender'), (1, 'Coffee Maker'),
-                (1, 'Rice Cooker'), (1, 'Pressure Cooker'),
-                (1, 'Air Fryer'), (1, 'Water Purifier'),
-
-                # Laundry & Cleaning (2)
-                (2, 'Washing Machine (Top Load)'), (2, 'Vacuum Cleaner'),
-                (2, 'Robotic Vacuum'), (2, 'Steam Iron'),
-
-                # Heating/Cooling (3)
-                (3, 'Air Conditioner (Split)'), (3, 'Ceiling Fan'),
-                (3, 'Space Heater'), (3, 'Air Purifier'),
-                (3, 'Water Heater'),
-
-                # Entertainment (4)
-                (4, 'Smart TV'), (4, 'Soundbar'),
-                (4, 'Smart Speaker'), (4, 'Gaming Console'),
-
-                # Smart Home (5)
-                (5, 'Security Camera'), (5, 'Smart Lock'),
-                (5, 'Smart Thermostat'), (5, 'Smoke Detector'),
-
-                # Personal Care (6)
-                (6, 'Hair Dryer'), (6, 'Electric Shaver'),
-                (6, 'Electric Toothbrush'),
-
-                # Miscellaneous (7)
-                (7, 'Treadmill'), (7, 'Air Compressor'),
-                (7, 'Water Softener')
-            ]
-            cursor.executemany('INSERT INTO subcategories (category_id, name) VALUES (?, ?)', subcategories)
-            sample_appliances = [
-                # Kitchen Appliances
-                # refrigerators
-                ('RF001', 'LG 260L Smart Inverter', 'LG', 28990, '5 Star', '180 kWh',
-                 '["Smart Inverter", "Hygiene Fresh+"]', 'appliance_images/RF001.jpg', 1, 1),
-
-                ('RF002', 'Samsung 253L Frost Free', 'Samsung', 31990, '4 Star', '210 kWh',
-                 '["Digital Inverter", "Twin Cooling"]', 'appliance_images/RF002.jpg', 1, 1),
-
-                ('RF003', 'Whirlpool 240L Frost Free', 'Whirlpool', 26990, '3 Star', '220 kWh',
-                 '["IntelliSense Inverter"]', 'appliance_images/RF003.jpg', 1, 1),
-
-                ('RF004', 'Haier 258L Bottom Freezer', 'Haier', 27990, '4 Star', '190 kWh',
-                 '["Twin Inverter", "Fast Cooling"]', 'appliance_images/RF004.jpg', 1, 1),
-
-                ('RF005', 'Godrej 210L Direct Cool', 'Godrej', 19990, '3 Star', '210 kWh', '["Aroma Lock"]',
-                 'appliance_images/RF005.jpg', 1, 1),
-
-                ('RF006', 'Panasonic 380L Side-by-Side', 'Panasonic', 58990, '5 Star', '250 kWh',
-                 '["Econavi", "Jewel Box"]', 'appliance_images/RF006.jpg', 1, 1),
-
-                ('RF007', 'Bosch 300L VitaFresh', 'Bosch', 45990, '5 Star', '200 kWh', '["MultiAirflow", "FreshSense"]',
-                 'appliance_images/RF007.jpg', 1, 1),
-
-                ('RF008', 'Voltas 185L Direct Cool', 'Voltas', 16990, '2 Star', '230 kWh', '["Stabilizer Free"]',
-                 'appliance_images/RF008.jpg', 1, 1),
-
-                ('RF009', 'IFB 265L Frost Free', 'IFB', 33990, '4 Star', '195 kWh', '["Smart Cooling"]',
-                 'appliance_images/RF009.jpg', 1, 1),
-
-                ('RF010', 'Hitachi 320L Glass Door', 'Hitachi', 52990, '5 Star', '210 kWh', '["Eco Thermo Sensor"]',
-                 'appliance_images/RF010.jpg', 1, 1),
-
-
-                # microwaves
-                ('MW001', 'Samsung 28L Convection', 'Samsung', 14990, '4 Star', '200 kWh', '["HotBlast", "Slim Fry"]',
-                 'appliance_images/MW001.jpg', 1, 2),
-
-                ('MW002', 'LG 32L Smart Inverter', 'LG', 16990, '5 Star', '220 kWh',
-                 '["Auto Cook", "Charcoal Lighting"]', 'appliance_images/MW002.jpg', 1, 2),
-
-                ('MW003', 'IFB 30L Convection', 'IFB', 15990, '4 Star', '210 kWh', '["Steam Clean", "Multi-Stage"]',
-                 'appliance_images/MW003.jpg', 1, 2),
-
-                ('MW004', 'Panasonic 27L Solo', 'Panasonic', 10990, '3 Star', '180 kWh', '["Auto Reheat"]',
-                 'appliance_images/MW004.jpg', 1, 2),
-
-                ('MW005', 'Bajaj 20L Grill', 'Bajaj', 8990, 'NA', '170 kWh', '["Grill & Bake"]',
-                 'appliance_images/MW005.jpg', 1, 2),
-
-                (
-                'MW006', 'Godrej 23L Convection', 'Godrej', 12990, '4 Star', '190 kWh', '["Healthy Fry", "Pizza Mode"]',
-                'appliance_images/MW006.jpg', 1, 2),
-
-                ('MW007', 'Haier 25L Solo', 'Haier', 9990, '3 Star', '175 kWh', '["Express Cooking"]',
-                 'appliance_images/MW007.jpg', 1, 2),
-
-                ('MW008', 'Whirlpool 30L Convection', 'Whirlpool', 15990, '5 Star', '210 kWh',
-                 '["Magic Cook", "Rotisserie"]', 'appliance_images/MW008.jpg', 1, 2),
-
-                ('MW009', 'Bosch 32L Grill', 'Bosch', 17990, '5 Star', '230 kWh', '["Auto Defrost", "Child Lock"]',
-                 'appliance_images/MW009.jpg', 1, 2),
-
-                ('MW010', 'Voltas 20L Solo', 'Voltas', 7990, 'NA', '160 kWh', '["Quick Start"]',
-                 'appliance_images/MW010.jpg', 1, 2),
-
-
-                # Electric Stoves
-                ('ES001', 'Prestige 4-Burner Glass Top', 'Prestige', 15990, '5 star', '350 kWh', '["Auto Ignition"]',
-                 'appliance_images/ES001.jpg', 1, 3),
-
-                ('ES002', 'Bajaj 2-Burner', 'Bajaj', 11990, '5 star', '320 kWh', '["Ceramic Plates"]',
-                 'appliance_images/ES002.jpg', 1, 3),
-
-                ('ES003', 'Philips Induction Cooker', 'Philips', 8990, '5 Star', '300 kWh',
-                 '["Feather Touch", "Preset Menu"]', 'appliance_images/ES003.jpg', 1, 3),
-
-                ('ES004', 'Pigeon 2-Burner Glass Top', 'Pigeon', 10990, '4 Star', '310 kWh',
-                 '["Toughened Glass", "Auto Ignition"]', 'appliance_images/ES004.jpg.jpg', 1, 3),
-
-                ('ES005', 'Havells Infrared Cooker', 'Havells', 9490, '5 Star', '290 kWh',
-                 '["Infrared Heating", "Digital Timer"]', 'appliance_images/ES005.jpg', 1, 3),
-
-                ('ES006', 'Usha 3-Burner Gas Stove', 'Usha', 12990, '4 Star', '330 kWh',
-                 '["Brass Burners", "Toughened Glass"]', 'appliance_images/ES006.jpg', 1, 3),
-
-                ('ES007', 'Butterfly Smart Induction', 'Butterfly', 7990, '3 Star', '280 kWh',
-                 '["7 Preset Modes", "Overheat Protection"]', 'appliance_images/ES007.jpg', 1, 3),
-
-                ('ES008', 'Bosch 4-Burner Hob', 'Bosch', 19990, '4 Star', '360 kWh',
-                 '["Auto Cut-Off", "Flame Failure Safety"]', 'appliance_images/ES008.jpg', 1, 3),
-
-                ('ES009', 'Wonderchef Induction Cooktop', 'Wonderchef', 8590, '5 Star', '295 kWh',
-                 '["Ceramic Plate", "Touch Panel"]', 'appliance_images/ES009.jpg', 1, 3),
-
-                ('ES010', 'Surya 2-Burner Gas Stove', 'Surya', 9990, '4 Star', '310 kWh',
-                 '["Heat Resistant Pan Supports"]', 'appliance_images/ES010.jpg', 1, 3),
-
-            # Dishwashers
-                ('DW001', 'Bosch 12 Place', 'Bosch', 36990, '5 Star', '280 kWh', '["Eco Silence"]',
-                 'appliance_images/DW001.jpg', 1, 4),
-                ('DW002', 'IFB 15 Place', 'IFB', 31990, '5 Star', '300 kWh', '["Auto Program"]',
-                 'appliance_images/DW002.jpg',
-                 1, 4),
-                ('DW003', 'Samsung 13 Place', 'Samsung', 33990, '5 Star', '290 kWh', '["Hygiene Wash"]',
-                 'appliance_images/DW003.jpg', 1, 4),
-                ('DW004', 'Whirlpool 14 Place', 'Whirlpool', 29990, '4 Star', '310 kWh', '["Power Dry"]',
-                 'appliance_images/DW004.jpg', 1, 4),
-                ('DW005', 'Voltas Beko 12 Place', 'Voltas Beko', 27990, '4 Star', '295 kWh', '["Aqua Flex"]',
-                 'appliance_images/DW005.jpg', 1, 4),
-                ('DW006', 'Hafele 15 Place', 'Hafele', 34990, '5 Star', '280 kWh', '["Inverter Drive"]',
-                 'appliance_images/DW006.jpg', 1, 4),
-                ('DW007', 'Elica 12 Place', 'Elica', 25990, '4 Star', '300 kWh', '["Intensive Mode"]',
-                 'appliance_images/DW007.jpg', 1, 4),
-                ('DW008', 'Siemens 13 Place', 'Siemens', 35990, '5 Star', '285 kWh', '["Vario Speed Plus"]',
-                 'appliance_images/DW008.jpg', 1, 4),
-                ('DW009', 'Haier 14 Place', 'Haier', 27990, '4 Star', '310 kWh', '["Quick Wash"]',
-                 'appliance_images/DW009.jpg', 1, 4),
-                ('DW010', 'Godrej 12 Place', 'Godrej', 26990, '4 Star', '290 kWh', '["Auto Door Open"]',
-                 'appliance_images/DW0010.jpg', 1, 4),
-
-                # blenders
-                (
-                    'BL001', 'Philips 600W', 'Philips', 3990, '5 star', '60 kWh', '["Multi-Speed"]',
-                    'appliance_images/BL001.jpg',
-                    1, 5),
-                ('BL002', 'Bajaj 500W', 'Bajaj', 2990, '4 star', '50 kWh', '["Overload Protection"]',
-                 'appliance_images/BL002.jpg', 1, 5),
-                ('BL003', 'Prestige 750W', 'Prestige', 4490, '3 star', '65 kWh', '["Stainless Steel Blades"]',
-                 'appliance_images/BL003.jpg', 1, 5),
-                ('BL004', 'Panasonic 600W', 'Panasonic', 3790, '5 star', '55 kWh', '["2 Jars Included"]',
-                 'appliance_images/BL004.jpg', 1, 5),
-                ('BL005', 'Bosch 800W', 'Bosch', 5290, '4 star', '70 kWh', '["Ice Crushing"]',
-                 'appliance_images/BL005.jpg', 1,
-                 5),
-                ('BL006', 'Usha 700W', 'Usha', 4190, '3 star', '60 kWh', '["Variable Speed"]',
-                 'appliance_images/BL006.jpg', 1,
-                 5),
-                ('BL007', 'Kent 600W', 'Kent', 3690, '5 star', '58 kWh', '["Compact Design"]',
-                 'appliance_images/BL007.jpg', 1,
-                 5),
-                ('BL008', 'Havells 900W', 'Havells', 5590, '4 star', '75 kWh', '["Digital Display"]',
-                 'appliance_images/BL008.jpg', 1, 5),
-                ('BL009', 'Wonderchef 500W', 'Wonderchef', 2990, '5 star', '50 kWh', '["1.5L Jar"]',
-                 'appliance_images/BL009.jpg', 1, 5),
-                ('BL010', 'Sujata 1000W', 'Sujata', 5990, '3 star', '80 kWh', '["Heavy-Duty Motor"]',
-                 'appliance_images/BL010.jpg', 1, 5),
-
-            # Coffee Makers
-            ('CM001', 'Philips 1200W', 'Philips', 4490, '5 star', '90 kWh', '["Auto Shutoff"]',
-             'appliance_images/CM001.jpg', 1, 6),
-            ('CM002', 'Bajaj 800W', 'Bajaj', 2990, '5 star', '70 kWh', '["Anti-Drip"]', 'appliance_images/CM002.jpg', 1, 6),
-            ('CM003', 'Morphy Richards 900W', 'Morphy Richards', 3690, '5 star', '80 kWh', '["Milk Frother"]',
-             'appliance_images/CM003.jpg', 1, 6),
-            (
-            'CM004', 'Prestige 750W', 'Prestige', 3290, '5 star', '75 kWh', '["Keep Warm"]', 'appliance_images/CM004.jpg',
-            1, 6),
-            ('CM005', 'Panasonic 1000W', 'Panasonic', 4990, '5 star', '100 kWh', '["Digital Timer"]',
-             'appliance_images/CM005.jpg', 1, 6),
-            ('CM006', 'Havells 850W', 'Havells', 3490, '5 star', '78 kWh', '["Adjustable Strength"]',
-             'appliance_images/CM006.jpg', 1, 6),
-            (
-            'CM007', 'Usha 700W', 'Usha', 2790, '4 star', '68 kWh', '["Thermal Carafe"]', 'appliance_images/CM007.jpg', 1, 6),
-            ('CM008', 'Kent 950W', 'Kent', 3990, '5 star', '85 kWh', '["Auto Clean"]', 'appliance_images/CM008.jpg', 1, 6),
-            ('CM009', 'Wonderchef 800W', 'Wonderchef', 3190, '5 star', '72 kWh', '["Stainless Steel Filter"]',
-             'appliance_images/CM009.jpg', 1, 6),
-            ('CM010', 'Bosch 1100W', 'Bosch', 5490, '5 star', '110 kWh', '["Aroma Control"]', 'appliance_images/CM010.jpg',
-             1, 6),
-
-
-                # Rice Cookers
-            ('RC001', 'Prestige 2L', 'Prestige', 2490, '5 star', '70 kWh', '["Auto Cooking"]', 'appliance_images/RC001.jpg',
-             1, 5),
-            ('RC002', 'Panasonic 1.8L', 'Panasonic', 3290, '3 star', '80 kWh', '["Keep Warm"]',
-             'appliance_images/RC002.jpg', 1, 3),
-            (
-            'RC003', 'Bajaj 1.5L', 'Bajaj', 2790, '4 star', '75 kWh', '["Non-Stick Pot"]', 'appliance_images/RC003.jpg', 1, 4),
-            ('RC004', 'Philips 2.2L', 'Philips', 3490, '4 star', '85 kWh', '["One-Touch Operation"]',
-             'appliance_images/RC004.jpg', 1, 4),
-            ('RC005', 'Havells 2L', 'Havells', 2890, '5 star', '78 kWh', '["Auto Shutoff"]', 'appliance_images/RC005.jpg', 1,
-             5),
-            ('RC006', 'Usha 1.8L', 'Usha', 3190, '3 star', '80 kWh', '["Multi-Function"]', 'appliance_images/RC006.jpg', 1, 3),
-            ('RC007', 'Kent 2.5L', 'Kent', 3690, '4 star', '90 kWh', '["Stainless Steel Inner Pot"]',
-             'appliance_images/RC007.jpg', 1, 4),
-            ('RC008', 'Wonderchef 1.8L', 'Wonderchef', 2990, '4 star', '76 kWh', '["Auto Steam Release"]',
-             'appliance_images/RC008.jpg', 1, 4),
-            ('RC009', 'Butterfly 2L', 'Butterfly', 2890, '5 star', '72 kWh', '["Energy Efficient"]',
-             'appliance_images/RC009.jpg', 1, 5),
-            ('RC010', 'Orient 1.5L', 'Orient', 2590, '2 star', '65 kWh', '["Cool Touch Handle"]',
-             'appliance_images/RC010.jpg', 1, 2),
-
-                # Pressure Cookers
-                ('PC001', 'Prestige 5L', 'Prestige', 2990, '4 star', '90 kWh', '["Multi-Safety"]',
-                 'appliance_images/PC001.jpg', 1, 8),
-                ('PC002', 'Hawkins 3L', 'Hawkins', 1990, '4 star', '80 kWh', '["Hard Anodized"]',
-                 'appliance_images/PC002.jpg', 1, 8),
-                ('PC003', 'Bajaj 5L', 'Bajaj', 2590, '5 Star', '90 kWh', '["Pressure Indicator"]',
-                 'appliance_images/PC003.jpg', 1, 8),
-                ('PC004', 'Prestige 3L', 'Prestige', 2490, '4 Star', '80 kWh', '["Whistle Control"]',
-                 'appliance_images/PC004.jpg', 1, 8),
-                ('PC005', 'Philips 6L', 'Philips', 3190, '5 Star', '100 kWh', '["Auto Locking"]',
-                 'appliance_images/PC005.jpg', 1, 8),
-                ('PC006', 'Pigeon 3L', 'Pigeon', 1790, '3 Star', '70 kWh', '["Cool Touch Handles"]',
-                 'appliance_images/PC006.jpg', 1, 8),
-                ('PC007', 'Hawkins 4L', 'Hawkins', 2390, '4 Star', '85 kWh', '["Heavy Gauge Aluminum"]',
-                 'appliance_images/PC007.jpg', 1, 8),
-                ('PC008', 'Prestige 2L', 'Prestige', 1990, '3 Star', '60 kWh', '["Pressure Regulator"]',
-                 'appliance_images/PC008.jpg', 1, 8),
-                ('PC009', 'Tefal 5L', 'Tefal', 3590, '5 Star', '110 kWh', '["Induction Compatible"]',
-                 'appliance_images/PC009.jpg', 1, 8),
-                ('PC010', 'Borosil 3L', 'Borosil', 2790, '4 Star', '90 kWh', '["Auto Pressure Control"]',
-                 'appliance_images/PC010.jpg', 1, 8),
-
-
-                # Air Fryers
-                ('AF001', 'Philips HD9252', 'Philips', 9990, '3 Star', '80 kWh', '["Rapid Air"]',
-                 'appliance_images/AF001.jpg', 1, 9),
-                ('AF002', 'Instant Pot Vortex', 'Instant Pot', 11990, '4 Star', '85 kWh', '["7-in-1"]',
-                 'appliance_images/AF002.jpg', 1, 9),
-                ('AF003', 'Ninja Air Fryer', 'Ninja', 8490, '4 Star', '75 kWh', '["Wide Temperature Range"]',
-                 'appliance_images/AF003.jpg', 1, 9),
-                ('AF004', 'Tefal ActiFry', 'Tefal', 9490, '5 Star', '80 kWh', '["Easy to Clean"]',
-                 'appliance_images/AF004.jpg', 1, 9),
-                ('AF005', 'Black+Decker Air Fryer', 'Black+Decker', 7990, '3 Star', '70 kWh', '["Fast Cooking"]',
-                 'appliance_images/AF005.jpg', 1, 9),
-                ('AF006', 'GoWISE USA 5.8QT', 'GoWISE USA', 8490, '4 Star', '78 kWh', '["Touchscreen Controls"]',
-                 'appliance_images/AF006.jpg', 1, 9),
-                ('AF007', 'Cuisinart Air Fryer', 'Cuisinart', 10990, '4 Star', '85 kWh', '["Preheat Function"]',
-                 'appliance_images/AF007.jpg', 1, 9),
-                ('AF008', 'Cosori Smart Air Fryer', 'Cosori', 12990, '5 Star', '90 kWh', '["Wi-Fi Enabled"]',
-                 'appliance_images/AF008.jpg', 1, 9),
-                ('AF009', 'Breville Smart Oven Air', 'Breville', 24990, '4 Star', '95 kWh',
-                 '["Multiple Cooking Functions"]',
-                 'appliance_images/AF009.jpg', 1, 9),
-                ('AF010', 'Chefman TurboFry', 'Chefman', 6490, '3 Star', '60 kWh', '["Compact Size"]',
-                 'appliance_images/AF010.jpg', 1, 9),
-
-
-
-                # Water Purifiers
-                ('WP001', 'Kent Supreme Plus', 'Kent', 18990, '5 star', '50 kWh', '["UV+UF+RO"]',
-                 'appliance_images/WP001.jpg', 1, 10),
-                ('WP002', 'Aquaguard Geneus', 'Aquaguard', 21990, '4 star', '45 kWh', '["TDS Controller"]',
-                 'appliance_images/WP002.jpg', 1, 10),
-                ('WP003', 'Pureit Ultima', 'Pureit', 24990, '5 star', '60 kWh', '["UV+RO"]',
-                 'appliance_images/WP003.jpg', 1, 10),
-                ('WP004', 'Eureka Forbes Aquasure', 'Eureka Forbes', 10990, '4 star', '50 kWh', '["UV+UF"]',
-                 'appliance_images/WP004.jpg', 1, 10),
-                ('WP005', 'HUL Pureit Marvella', 'HUL', 13990, '4 star', '55 kWh', '["TDS Adjuster"]',
-                 'appliance_images/WP005.jpg', 1, 10),
-                (
-                'WP006', 'Kent Ace', 'Kent', 12990, '4 star', '50 kWh', '["RO+UV+UF"]', 'appliance_images/WP006.jpg', 1,
-                10),
-                ('WP007', 'Livpure Glo', 'Livpure', 15990, '5 star', '60 kWh', '["UV+UF+RO"]',
-                 'appliance_images/WP007.jpg', 1, 10),
-                ('WP008', 'Blue Star Aristo', 'Blue Star', 17990, '4 star', '55 kWh', '["RO+UV"]',
-                 'appliance_images/WP008.jpg', 1, 10),
-                ('WP009', 'Tata Swach Smart', 'Tata', 7990, '3 star', '40 kWh', '["UV"]', 'appliance_images/WP009.jpg',
-                 1, 10),
-                ('WP010', 'AquaSure from Aquaguard', 'Eureka Forbes', 9990, '3 star', '45 kWh', '["UV+UF"]',
-                 'appliance_images/WP010.jpg', 1, 10),
-
-                ########################################################################################################3
-                # Laundry & Cleaning
-                # washing machine
-                ('WM001', 'Samsung 6.5kg Top Load', 'Samsung', 18990, '4 Star', '280 kWh', '["Diamond Drum"]',
-                 'appliance_images/WM001.jpg', 2, 1),
-                ('WM002', 'LG 7kg Front Load', 'LG', 32990, '5 Star', '240 kWh', '["Inverter Direct Drive"]',
-                 'appliance_images/WM002.jpg', 2, 1),
-                ('WM003', 'Whirlpool 8kg Semi-Auto', 'Whirlpool', 12990, '3 Star', '320 kWh', '["Power Scrub"]',
-                 'appliance_images/WM003.jpg', 2, 1),
-                ('WM004', 'Bosch 7.5kg Front Load', 'Bosch', 34990, '5 Star', '230 kWh', '["EcoSilence Drive"]',
-                 'appliance_images/WM004.jpg', 2, 1),
-                ('WM005', 'IFB 6kg Front Load', 'IFB', 28990, '5 Star', '250 kWh', '["Aqua Energie"]',
-                 'appliance_images/WM005.jpg', 2, 1),
-                ('WM006', 'Panasonic 6.2kg Top Load', 'Panasonic', 19990, '4 Star', '270 kWh', '["Active Foam System"]',
-                 'appliance_images/WM006.jpg', 2, 1),
-                ('WM007', 'Haier 6.5kg Fully Auto', 'Haier', 21990, '4 Star', '260 kWh', '["Near Zero Pressure"]',
-                 'appliance_images/WM007.jpg', 2, 1),
-                ('WM008', 'Godrej 7kg Top Load', 'Godrej', 20990, '4 Star', '290 kWh', '["Turbo 6 Pulsator"]',
-                 'appliance_images/WM008.jpg', 2, 1),
-                ('WM009', 'Onida 6kg Fully Auto', 'Onida', 17990, '3 Star', '300 kWh', '["Hexa Crystal Drum"]',
-                 'appliance_images/WM009.jpg', 2, 1),
-                ('WM010', 'Samsung 8kg Front Load', 'Samsung', 39990, '5 Star', '220 kWh', '["Bubble Soak"]',
-                 'appliance_images/WM010.jpg', 2, 1),
-
-                # vacuum cleaner
-                ('VC001', 'Eureka Forbes Trendy', 'Eureka Forbes', 5990, '5 star', '120 kWh', '["Bagless"]',
-                 'appliance_images/VC001.jpg', 2, 2),
-                ('VC002', 'Dyson V8 Absolute', 'Dyson', 34990, '4 star', '50 kWh', '["Cordless"]',
-                 'appliance_images/VC002.jpg', 2, 2),
-                ('VC003', 'Philips PowerPro', 'Philips', 10990, '4 star', '110 kWh', '["Cyclone Filter"]',
-                 'appliance_images/VC003.jpg', 2, 2),
-                ('VC004', 'Karcher VC4', 'Karcher', 15990, '3 star', '130 kWh', '["HEPA Filter"]',
-                 'appliance_images/VC004.jpg', 2, 2),
-                ('VC005', 'Bosch GAS 15', 'Bosch', 19990, '4 star', '140 kWh', '["Blower Function"]',
-                 'appliance_images/VC005.jpg', 2, 2),
-                ('VC006', 'Kent Zoom', 'Kent', 7990, '5 star', '90 kWh', '["Rechargeable"]',
-                 'appliance_images/VC006.jpg', 2, 2),
-                ('VC007', 'LG CordZero', 'LG', 32990, '4 star', '55 kWh', '["Dual Battery"]',
-                 'appliance_images/VC007.jpg', 2, 2),
-                ('VC008', 'Inalsa Spruce', 'Inalsa', 3990, '3 star', '125 kWh', '["Wet & Dry"]',
-                 'appliance_images/VC008.jpg', 2, 2),
-                ('VC009', 'Prestige Typhoon', 'Prestige', 5990, '4 star', '115 kWh', '["High Suction"]',
-                 'appliance_images/VC009.jpg', 2, 2),
-                ('VC010', 'Panasonic MC-CL571', 'Panasonic', 11990, '3 star', '135 kWh', '["Cyclone System"]',
-                 'appliance_images/VC010.jpg', 2, 2),
-
-                # robotic vacuum cleaners
-                ('RV001', 'Xiaomi Mi Robot', 'Xiaomi', 24990, '4 star', '100 kWh', '["LIDAR"]',
-                 'appliance_images/RV001.jpg', 2, 3),
-                ('RV002', 'iRobot Roomba i3', 'iRobot', 39990, '5 star', '80 kWh', '["Auto Empty"]',
-                 'appliance_images/RV002.jpg', 2, 3),
-                ('RV003', 'Ecovacs Deebot N8', 'Ecovacs', 29990, '4 star', '85 kWh', '["Mopping"]',
-                 'appliance_images/RV003.jpg', 2, 3),
-                ('RV004', 'Roborock S7', 'Roborock', 44990, '5 star', '75 kWh', '["Sonic Mopping"]',
-                 'appliance_images/RV004.jpg', 2, 3),
-                ('RV005', 'ILIFE V5s Pro', 'ILIFE', 16990, '3 star', '90 kWh', '["Water Tank"]',
-                 'appliance_images/RV005.jpg', 2, 3),
-                ('RV006', 'iRobot Roomba 694', 'iRobot', 29990, '4 star', '78 kWh', '["WiFi Enabled"]',
-                 'appliance_images/RV006.jpg', 2, 3),
-                ('RV007', 'Eufy RoboVac X8', 'Eufy', 34990, '5 star', '70 kWh', '["Twin Turbine"]',
-                 'appliance_images/RV007.jpg', 2, 3),
-                ('RV008', 'Dreame D9 Max', 'Dreame', 25990, '4 star', '95 kWh', '["LIDAR Navigation"]',
-                 'appliance_images/RV008.jpg', 2, 3),
-                ('RV009', 'Samsung Jet Bot+', 'Samsung', 49990, '5 star', '65 kWh', '["SmartThings"]',
-                 'appliance_images/RV009.jpg', 2, 3),
-                ('RV010', 'Viomi SE', 'Viomi', 28990, '4 star', '88 kWh', '["Multi-Floor Mapping"]',
-                 'appliance_images/RV010.jpg', 2, 3),
-
-                # Steam Irons
-                ('SI001', 'Philips GC1905', 'Philips', 1990, '4 star', '60 kWh', '["Anti-Calc"]',
-                 'appliance_images/SI001.jpg', 2, 4),
-                ('SI002', 'Bajaj Majesty DX-7', 'Bajaj', 1290, '4 star', '50 kWh', '["Ceramic Soleplate"]',
-                 'appliance_images/SI002.jpg', 2, 4),
-                ('SI003', 'Usha EI 1602', 'Usha', 1090, '3 star', '45 kWh', '["Non-Stick Soleplate"]',
-                 'appliance_images/SI003.jpg', 2, 4),
-                ('SI004', 'Morphy Richards Super Glide', 'Morphy Richards', 2790, '4 star', '65 kWh', '["Turbo Steam"]',
-                 'appliance_images/SI004.jpg', 2, 4),
-                ('SI005', 'Havells Magnum', 'Havells', 2290, '4 star', '58 kWh', '["Precision Tip"]',
-                 'appliance_images/SI005.jpg', 2, 4),
-                ('SI006', 'Orient FabriGlow', 'Orient', 1390, '3 star', '52 kWh', '["Dry & Steam"]',
-                 'appliance_images/SI006.jpg', 2, 4),
-                ('SI007', 'Panasonic NI-100DX', 'Panasonic', 1690, '3 star', '55 kWh', '["Temperature Control"]',
-                 'appliance_images/SI007.jpg', 2, 4),
-                ('SI008', 'Singer Style Steam', 'Singer', 1490, '4 star', '53 kWh', '["Spray Function"]',
-                 'appliance_images/SI008.jpg', 2, 4),
-                ('SI009', 'Inalsa Optra', 'Inalsa', 1299, '3 star', '48 kWh', '["Variable Steam"]',
-                 'appliance_images/SI009.jpg', 2, 4),
-                ('SI010', 'Kent Smart 1600W', 'Kent', 1999, '4 star', '60 kWh', '["Fast Heat Up"]',
-                 'appliance_images/SI010.jpg', 2, 4),
-
-                ###############################################################################################################
-                # Heating/Cooling
-                # Air Conditioners
-                ('AC001', 'Daikin 1.5 Ton 5-Star Inverter', 'Daikin', 42990, '5 Star', '950 kWh',
-                 '["Copper Condenser", "PM 2.5 Filter"]', 'appliance_images/AC001.jpg', 3, 1),
-                ('AC002', 'LG 1.5 Ton 3-Star Window', 'LG', 32990, '3 Star', '1200 kWh',
-                 '["Ocean Black", "Auto Clean"]', 'appliance_images/AC002.jpg', 3, 1),
-                ('AC003', 'Voltas 1.5 Ton 3-Star Split', 'Voltas', 34990, '3 Star', '1100 kWh',
-                 '["Turbo Cool", "Dehumidifier"]', 'appliance_images/AC003.jpg', 3, 1),
-                ('AC004', 'Blue Star 2 Ton 5-Star Inverter', 'Blue Star', 55990, '5 Star', '1000 kWh',
-                 '["iFeel Technology", "Self-Diagnosis"]', 'appliance_images/AC004.jpg', 3, 1),
-                ('AC005', 'Carrier 1 Ton 3-Star Split', 'Carrier', 28990, '3 Star', '900 kWh',
-                 '["Flexicool", "Dust Filter"]', 'appliance_images/AC005.jpg', 3, 1),
-                ('AC006', 'Hitachi 1.5 Ton 5-Star Inverter', 'Hitachi', 46990, '5 Star', '850 kWh',
-                 '["Kaze Filter", "Eco Mode"]', 'appliance_images/AC006.jpg', 3, 1),
-                ('AC007', 'Samsung 1.5 Ton 3-Star Wind-Free', 'Samsung', 49990, '3 Star', '1050 kWh',
-                 '["Digital Inverter", "Triple Protection"]', 'appliance_images/AC007.jpg', 3, 1),
-                ('AC008', 'Whirlpool 1.5 Ton 3-Star Split', 'Whirlpool', 31990, '3 Star', '1150 kWh',
-                 '["6th Sense", "Stabilizer Free"]', 'appliance_images/AC008.jpg', 3, 1),
-                ('AC009', 'Godrej 1 Ton 5-Star Inverter', 'Godrej', 38990, '5 Star', '800 kWh',
-                 '["R32 Refrigerant", "Golden Fin"]', 'appliance_images/AC009.jpg', 3, 1),
-                ('AC010', 'Panasonic 2 Ton 3-Star Split', 'Panasonic', 45990, '3 Star', '1250 kWh',
-                 '["Econavi", "Nanoe-G"]', 'appliance_images/AC010.jpg', 3, 1),
-
-                # Ceiling Fans
-                ('CF001', 'Crompton Energion HS 1200mm', 'Crompton', 2990, '5 Star', '60 kWh',
-                 '["BLDC Motor", "Remote Control"]', 'appliance_images/CF001.jpg', 3, 2),
-                ('CF002', 'Havells Leganza 1200mm', 'Havells', 3490, '5 Star', '55 kWh', '["Decorative", "3-Speed"]',
-                 'appliance_images/CF002.jpg', 3, 2),
-                ('CF003', 'Bajaj Frore 1200mm', 'Bajaj', 2790, '4 Star', '65 kWh', '["Anti-Dust", "High Air Delivery"]',
-                 'appliance_images/CF003.jpg', 3, 2),
-                ('CF004', 'Orient Electric Apex-FX 1200mm', 'Orient', 3290, '5 Star', '58 kWh',
-                 '["Wet/Dry", "Decorative"]', 'appliance_images/CF004.jpg', 3, 2),
-                ('CF005', 'Usha Bloom 1200mm', 'Usha', 2590, '4 Star', '70 kWh', '["ABS Blades", "3-Speed"]',
-                 'appliance_images/CF005.jpg', 3, 2),
-                ('CF006', 'Luminous Dhoom 1200mm', 'Luminous', 2390, '3 Star', '75 kWh',
-                 '["High Speed", "Balanced Blades"]', 'appliance_images/CF006.jpg', 3, 2),
-                ('CF007', 'Atomberg Renesa 1200mm', 'Atomberg', 3990, '5 Star', '50 kWh', '["BLDC", "Smart Control"]',
-                 'appliance_images/CF007.jpg', 3, 2),
-                ('CF008', 'Khaitan Elegance 1200mm', 'Khaitan', 2190, '3 Star', '80 kWh',
-                 '["Decorative", "High Air Throw"]', 'appliance_images/CF008.jpg', 3, 2),
-                ('CF009', 'Surya Neo 1200mm', 'Surya', 2690, '4 Star', '68 kWh', '["Anti-Rust", "3-Speed"]',
-                 'appliance_images/CF009.jpg', 3, 2),
-                ('CF010', 'Polar Hunter 1200mm', 'Polar', 2490, '3 Star', '72 kWh', '["ABS Blades", "Decorative"]',
-                 'appliance_images/CF010.jpg', 3, 2),
-
-                # Space Heaters
-                ('SH001', 'Bajaj Flashy 1000W', 'Bajaj', 2490, 'NA', '500 kWh',
-                 '["Overheat Protection", "Tip-Over Switch"]', 'appliance_images/SH001.jpg', 3, 3),
-                ('SH002', 'Usha FH1212 2000W', 'Usha', 1990, 'NA', '450 kWh',
-                 '["Adjustable Thermostat", "Carry Handle"]', 'appliance_images/SH002.jpg', 3, 3),
-                ('SH003', 'Morphy Richards Oyster 1200W', 'Morphy Richards', 3490, 'NA', '480 kWh',
-                 '["Ceramic Heating", "Oscillation"]', 'appliance_images/SH003.jpg', 3, 3),
-                ('SH004', 'Havells Cozio 2000W', 'Havells', 2990, 'NA', '520 kWh', '["PTC Ceramic", "Remote Control"]',
-                 'appliance_images/SH004.jpg', 3, 3),
-                ('SH005', 'Orient Electric Areva 1500W', 'Orient', 2290, 'NA', '490 kWh',
-                 '["Fan Heater", "2 Heat Settings"]', 'appliance_images/SH005.jpg', 3, 3),
-                ('SH006', 'Crompton Greaves Amica 2000W', 'Crompton', 2790, 'NA', '510 kWh',
-                 '["Radiant Heating", "Overheat Cut-off"]', 'appliance_images/SH006.jpg', 3, 3),
-                ('SH007', 'Kenstar Halo 2000W', 'Kenstar', 2590, 'NA', '530 kWh',
-                 '["PTC Technology", "Adjustable Thermostat"]', 'appliance_images/SH007.jpg', 3, 3),
-                ('SH008', 'Orpat OEH-1260 2000W', 'Orpat', 1790, 'NA', '550 kWh',
-                 '["Fan Heater", "Overload Protection"]', 'appliance_images/SH008.jpg', 3, 3),
-                ('SH009', 'V-Guard Sunny 2000W', 'V-Guard', 2690, 'NA', '540 kWh',
-                 '["Ceramic Plate", "Thermostat Control"]', 'appliance_images/SH009.jpg', 3, 3),
-                ('SH010', 'Eveready QH800 800W', 'Eveready', 1290, 'NA', '400 kWh', '["Compact", "Portable"]',
-                 'appliance_images/SH010.jpg', 3, 3),
-
-                # Air Purifiers
-                ('AP001', 'Dyson Pure Cool TP07', 'Dyson', 34990, 'NA', '80 kWh',
-                 '["HEPA+Activated Carbon", "Air Multiplier"]', 'appliance_images/AP001.jpg', 3, 4),
-                ('AP002', 'Philips AC2887/20', 'Philips', 24990, 'NA', '70 kWh', '["AeraSense", "3-Stage Filtration"]',
-                 'appliance_images/AP002.jpg', 3, 4),
-                ('AP003', 'Honeywell Air Touch i8', 'Honeywell', 18990, 'NA', '90 kWh', '["HEPA", "Ionizer"]',
-                 'appliance_images/AP003.jpg', 3, 4),
-                ('AP004', 'Sharp FP-J40M-W', 'Sharp', 15990, 'NA', '85 kWh', '["Plasmacluster", "Humidifying"]',
-                 'appliance_images/AP004.jpg', 3, 4),
-                ('AP005', 'Mi Air Purifier 3', 'Xiaomi', 8990, 'NA', '75 kWh', '["True HEPA", "OLED Display"]',
-                 'appliance_images/AP005.jpg', 3, 4),
-                ('AP006', 'Blueair Blue 411', 'Blueair', 12990, 'NA', '82 kWh', '["HEPASilent", "Washable Pre-filter"]',
-                 'appliance_images/AP006.jpg', 3, 4),
-                ('AP007', 'Coway AP-1009CH', 'Coway', 29990, 'NA', '78 kWh', '["Green True HEPA", "Eco Mode"]',
-                 'appliance_images/AP007.jpg', 3, 4),
-                ('AP008', 'Eureka Forbes Aeroguard AP700', 'Eureka Forbes', 14990, 'NA', '88 kWh',
-                 '["5-Stage Purification", "UV LED"]', 'appliance_images/AP008.jpg', 3, 4),
-                ('AP009', 'LG PuriCare 360°', 'LG', 27990, 'NA', '83 kWh', '["Dual Inverter", "Circular Airflow"]',
-                 'appliance_images/AP009.jpg', 3, 4),
-                ('AP010', 'KENT Alps Plus', 'KENT', 16990, 'NA', '87 kWh', '["HEPA+UV", "Smart Sensors"]',
-                 'appliance_images/AP010.jpg', 3, 4),
-
-
-                # Water Heaters
-                ('WH001', 'AO Smith HSE-VAS-X-015', 'AO Smith', 12990, '5 Star', '1200 kWh',
-                 '["Blue Diamond Tank", "Rust-Free"]', 'appliance_images/WH001.jpg', 3, 5),
-                ('WH002', 'Bajaj New Shakti 15L', 'Bajaj', 8990, '4 Star', '1500 kWh',
-                 '["PUF Insulation", "Thermostat"]', 'appliance_images/WH002.jpg', 3, 5),
-                ('WH003', 'Racold Eterno Pro 15L', 'Racold', 15990, '5 Star', '1100 kWh',
-                 '["Glass Lined Tank", "Corrosion-Free"]', 'appliance_images/WH003.jpg', 3, 5),
-                ('WH004', 'Havells Instanio 3L', 'Havells', 5990, 'NA', '800 kWh',
-                 '["Instant Heating", "Chrome Tank"]', 'appliance_images/WH004.jpg', 3, 5),
-                ('WH005', 'V-Guard Victo 15L', 'V-Guard', 10990, '4 Star', '1300 kWh',
-                 '["Thermoplastic Inner", "Auto Cut-off"]', 'appliance_images/WH005.jpg', 3, 5),
-                ('WH006', 'Crompton Bliss 15L', 'Crompton', 11990, '5 Star', '1150 kWh',
-                 '["Advanced Polymer Tank", "Sword Element"]', 'appliance_images/WH006.jpg', 3, 5),
-                ('WH007', 'Kenstar Flora 10L', 'Kenstar', 7990, '3 Star', '1400 kWh',
-                 '["ABS Body", "Thermostat"]', 'appliance_images/WH007.jpg', 3, 5),
-                ('WH008', 'Usha Mist 25L', 'Usha', 14990, '5 Star', '1250 kWh',
-                 '["SS Tank", "Auto Thermal Cut-off"]', 'appliance_images/WH008.jpg', 3, 5),
-                ('WH009', 'Orient Electric Pronto 10L', 'Orient', 6990, '3 Star', '1350 kWh',
-                 '["Corrosion-Resistant", "Thermostat"]', 'appliance_images/WH009.jpg', 3, 5),
-                ('WH010', 'Kenmore 15L', 'Kenmore', 16990, '5 Star', '1050 kWh',
-                 '["Magnesium Anode", "Auto Cut-off"]', 'appliance_images/WH010.jpg', 3, 5),
-
-                ###################################################################################################################
-                # Entertainment
-                # Smart TVs
-                ('TV001', 'Sony X80K 55" 4K LED', 'Sony', 59990, '3 Star', '150 kWh',
-                 '["Android TV", "Dolby Vision"]', 'appliance_images/TV001.jpg', 4, 1),
-                ('TV002', 'Samsung CU7000 50" Crystal UHD', 'Samsung', 49990, '2 Star', '180 kWh',
-                 '["Smart Hub", "HDR"]', 'appliance_images/TV002.jpg', 4, 1),
-                ('TV003', 'LG A2 48" OLED', 'LG', 69990, '4 Star', '120 kWh',
-                 '["AI ThinQ", "Dolby Atmos"]', 'appliance_images/TV003.jpg', 4, 1),
-                ('TV004', 'OnePlus U1S 55" QLED', 'OnePlus', 44990, '3 Star', '160 kWh',
-                 '["Google TV", "HDR10+"]', 'appliance_images/TV004.jpg', 4, 1),
-                ('TV005', 'Mi Q1 55" QLED', 'Xiaomi', 39990, '2 Star', '170 kWh',
-                 '["PatchWall", "Dolby Vision"]', 'appliance_images/TV005.jpg', 4, 1),
-                ('TV006', 'TCL C635 55" QLED', 'TCL', 46990, '3 Star', '155 kWh',
-                 '["Google TV", "144Hz"]', 'appliance_images/TV006.jpg', 4, 1),
-                ('TV007', 'Vu Masterpiece 55" OLED', 'Vu', 54990, '3 Star', '140 kWh',
-                 '["Android TV", "Dolby Vision"]', 'appliance_images/TV007.jpg', 4, 1),
-                ('TV008', 'Hisense A6H 50" 4K', 'Hisense', 37990, '2 Star', '165 kWh',
-                 '["Vidaa OS", "HDR"]', 'appliance_images/TV008.jpg', 4, 1),
-                ('TV009', 'Nokia Stream TV 43"', 'Nokia', 29990, '2 Star', '130 kWh',
-                 '["Android TV", "HDR10"]', 'appliance_images/TV009.jpg', 4, 1),
-                ('TV010', 'Realme 4K SLED 55"', 'Realme', 42990, '3 Star', '145 kWh',
-                 '["Google TV", "Dolby Atmos"]', 'appliance_images/TV010.jpg', 4, 1),
-
-                # Soundbars
-                ('SB001', 'Bose 900 Dolby Atmos', 'Bose', 79990, '5 star', '90 kWh',
-                 '["Adaptive EQ", "Wi-Fi"]', 'appliance_images/SB001.jpg', 4, 2),
-                ('SB002', 'Sony HT-S40R 5.1ch', 'Sony', 24990, '4 star', '60 kWh',
-                 '["Dolby Digital", "Bluetooth"]', 'appliance_images/SB002.jpg', 4, 2),
-                ('SB003', 'JBL Bar 2.1 Deep Bass', 'JBL', 19990, '4 star', '70 kWh',
-                 '["Wireless Subwoofer", "HDMI"]', 'appliance_images/SB003.jpg', 4, 2),
-                ('SB004', 'LG SP8YA 3.1.2ch', 'LG', 49990, '5 star', '80 kWh',
-                 '["MeriDian", "Dolby Atmos"]', 'appliance_images/SB004.jpg', 4, 2),
-                ('SB005', 'Samsung HW-Q600A 3.1.2ch', 'Samsung', 34990, '4 star', '75 kWh',
-                 '["DTS:X", "Adaptive Sound"]', 'appliance_images/SB005.jpg', 4, 2),
-                ('SB006', 'Philips TAB5305 2.1ch', 'Philips', 12990, '4 star', '50 kWh',
-                 '["DTS Sound", "Bluetooth"]', 'appliance_images/SB006.jpg', 4, 2),
-                ('SB007', 'Zebronics Zeb-Juke Bar 2.1', 'Zebronics', 5990, '4 star', '45 kWh',
-                 '["USB Playback", "Remote"]', 'appliance_images/SB007.jpg', 4, 2),
-                ('SB008', 'Boat Aavante 1200D', 'Boat', 9990, '4 star', '55 kWh',
-                 '["Dolby Audio", "HDMI ARC"]', 'appliance_images/SB008.jpg', 4, 2),
-                ('SB009', 'Mivi Thunder 80W', 'Mivi', 7990, '4 star', '40 kWh',
-                 '["Bluetooth 5.0", "Bass Boost"]', 'appliance_images/SB009.jpg', 4, 2),
-                ('SB010', 'pTron Boom 2.1', 'pTron', 4990, 'NA', '35 kWh',
-                 '["USB/SD", "FM Radio"]', 'appliance_images/SB010.jpg', 4, 2),
-
-                # Smart Speakers
-                ('SS001', 'Amazon Echo Dot (4th Gen)', 'Amazon', 4990, '4 star', '15 kWh',
-                 '["Alexa", "Bluetooth"]', 'appliance_images/SS001.jpg', 4, 3),
-                ('SS002', 'Google Nest Mini (2nd Gen)', 'Google', 4490, '4 star', '12 kWh',
-                 '["Google Assistant", "Voice Match"]', 'appliance_images/SS002.jpg', 4, 3),
-                ('SS003', 'Apple HomePod mini', 'Apple', 9990, 'NA', '20 kWh',
-                 '["Siri", "U1 Chip"]', 'appliance_images/SS003.jpg', 4, 3),
-                ('SS004', 'JBL Link 20', 'JBL', 12990, '4 star', '25 kWh',
-                 '["Google Assistant", "Portable"]', 'appliance_images/SS004.jpg', 4, 3),
-                ('SS005', 'Bose Home Speaker 300', 'Bose', 24990, '5 star', '30 kWh',
-                 '["Alexa", "Wi-Fi"]', 'appliance_images/SS005.jpg', 4, 3),
-                ('SS006', 'Sony SRS-XB23', 'Sony', 8990, '4 star', '18 kWh',
-                 '["Extra Bass", "IP67"]', 'appliance_images/SS006.jpg', 4, 3),
-                ('SS007', 'Mi Smart Speaker', 'Xiaomi', 3990, 'NA', '14 kWh',
-                 '["Google Assistant", "Bluetooth"]', 'appliance_images/SS007.jpg', 4, 3),
-                ('SS008', 'Boat Stone 650', 'Boat', 2990, 'NA', '22 kWh',
-                 '["40W RMS", "IPX7"]', 'appliance_images/SS008.jpg', 4, 3),
-                ('SS009', 'Realme Smart Speaker', 'Realme', 3490, '4 star', '16 kWh',
-                 '["Google Assistant", "Chroma Lights"]', 'appliance_images/SS009.jpg', 4, 3),
-                ('SS010', 'iBall Musi Play', 'iBall', 1990, 'NA', '10 kWh',
-                 '["Bluetooth", "AUX"]', 'appliance_images/SS010.jpg', 4, 3),
-
-                # Gaming Consoles
-                ('GC001', 'Sony PlayStation 5 Digital', 'Sony', 39990, '4 star', '200 kWh',
-                 '["825GB SSD", "4K/120Hz"]', 'appliance_images/GC001.jpg', 4, 4),
-                ('GC002', 'Microsoft Xbox Series X', 'Microsoft', 49990, '5 star', '180 kWh',
-                 '["1TB SSD", "4K/120Hz"]', 'appliance_images/GC002.jpg', 4, 4),
-                ('GC003', 'Nintendo Switch OLED', 'Nintendo', 32990, '4 star', '40 kWh',
-                 '["7" OLED", "64GB"]', 'appliance_images/GC003.jpg', 4, 4),
-                ('GC004', 'Sony PlayStation 4 Slim', 'Sony', 29990, 'NA', '150 kWh',
-                 '["1TB HDD", "1080p"]', 'appliance_images/GC004.jpg', 4, 4),
-                ('GC005', 'Microsoft Xbox Series S', 'Microsoft', 34990, '4 star', '120 kWh',
-                 '["512GB SSD", "1440p"]', 'appliance_images/GC005.jpg', 4, 4),
-                ('GC006', 'Nintendo Switch Lite', 'Nintendo', 19990, 'NA', '30 kWh',
-                 '["5.5" LCD", "32GB"]', 'appliance_images/GC006.jpg', 4, 4),
-                ('GC007', 'Atari VCS 800', 'Atari', 24990, 'NA', '90 kWh',
-                 '["AMD Ryzen", "4K"]', 'appliance_images/GC007.jpg', 4, 4),
-                ('GC008', 'Steam Deck 64GB', 'Valve', 49990, '4 star', '100 kWh',
-                 '["7" Touchscreen", "Zen 2 CPU"]', 'appliance_images/GC008.jpg', 4, 4),
-                ('GC009', 'Oculus Quest 2 128GB', 'Meta', 29990, 'NA', '60 kWh',
-                 '["VR Headset", "Snapdragon XR2"]', 'appliance_images/GC009.jpg', 4, 4),
-                ('GC010', 'RetroN 5 HD', 'Hyperkin', 12990, 'NA', '50 kWh',
-                 '["Plays Cartridges", "HDMI"]', 'appliance_images/GC010.jpg', 4, 4),
-
-                ############################################################################################################3
-                # Smart Home
-                # Security Cameras
-                ('SC001', 'TP-Link Tapo C210', 'TP-Link', 3490, '4 star', '10 kWh',
-                 '["3MP", "Color Night Vision"]', 'appliance_images/SC001.jpg', 5, 1),
-                ('SC002', 'Ezviz C3X', 'Ezviz', 5990, 'NA', '12 kWh',
-                 '["360°", "AI Detection"]', 'appliance_images/SC002.jpg', 5, 1),
-                ('SC003', 'Mi 360° 2K', 'Xiaomi', 4990, 'NA', '11 kWh',
-                 '["2K Resolution", "Starlight Sensor"]', 'appliance_images/SC003.jpg', 5, 1),
-                ('SC004', 'Dahua IPC-HDW1239', 'Dahua', 8990, '4 star', '15 kWh',
-                 '["PoE", "IP67"]', 'appliance_images/SC004.jpg', 5, 1),
-                ('SC005', 'Hikvision DS-2CD2043G0-I', 'Hikvision', 7490, '5 star', '14 kWh',
-                 '["4MP", "WDR"]', 'appliance_images/SC005.jpg', 5, 1),
-                ('SC006', 'Godrej Security Cam', 'Godrej', 6490, '5 star', '13 kWh',
-                 '["1080p", "Motion Detection"]', 'appliance_images/SC006.jpg', 5, 1),
-                ('SC007', 'CP Plus 3MP', 'CP Plus', 5490, '4 star', '16 kWh',
-                 '["IP66", "Audio Support"]', 'appliance_images/SC007.jpg', 5, 1),
-                ('SC008', 'Realme Smart Cam 360', 'Realme', 3990, 'NA', '9 kWh',
-                 '["360°", "AI Recognition"]', 'appliance_images/SC008.jpg', 5, 1),
-                ('SC009', 'Imou Ranger 2', 'Imou', 4990, '4 star', '10 kWh',
-                 '["2K", "Spotlight"]', 'appliance_images/SC009.jpg', 5, 1),
-                ('SC010', 'Qubo Smart Cam 360', 'Qubo', 2990, 'NA', '8 kWh',
-                 '["1080p", "2-Way Audio"]', 'appliance_images/SC010.jpg', 5, 1),
-
-                # Smart Locks
-                ('SL001', 'Yale YDM 7116', 'Yale', 12990, '5 star', '5 kWh',
-                 '["Fingerprint", "Bluetooth"]', 'appliance_images/SL001.jpg', 5, 2),
-                ('SL002', 'Godrej Locks Secure', 'Godrej', 8990, '4 star', '4 kWh',
-                 '["Keypad", "Auto-Lock"]', 'appliance_images/SL002.jpg', 5, 2),
-                ('SL003', 'Philips EasyKey', 'Philips', 15990, '5 star', '6 kWh',
-                 '["Face Recognition", "App Control"]', 'appliance_images/SL003.jpg', 5, 2),
-                ('SL004', 'Havells Solitaire', 'Havells', 11990, '4 star', '5 kWh',
-                 '["RFID", "Anti-Panic"]', 'appliance_images/SL004.jpg', 5, 2),
-                ('SL005', 'Danalock V3', 'Danalock', 9990, 'NA', '3 kWh',
-                 '["Z-Wave", "Auto-Unlock"]', 'appliance_images/SL005.jpg', 5, 2),
-                ('SL006', 'August Wi-Fi Smart Lock', 'August', 17990, '4 star', '7 kWh',
-                 '["Wi-Fi", "Auto-Lock"]', 'appliance_images/SL006.jpg', 5, 2),
-                ('SL007', 'Mi Smart Door Lock', 'Xiaomi', 14990, 'NA', '6 kWh',
-                 '["7-in-1 Unlock", "Anti-Peep"]', 'appliance_images/SL007.jpg', 5, 2),
-                ('SL008', 'Samsung SHS-P718', 'Samsung', 19990, '4 star', '8 kWh',
-                 '["RFID", "Emergency Power"]', 'appliance_images/SL008.jpg', 5, 2),
-                ('SL009', 'Ultraloq U-Bolt Pro', 'Ultraloq', 16990, '4 star', '5 kWh',
-                 '["Fingerprint", "App Control"]', 'appliance_images/SL009.jpg', 5, 2),
-                ('SL010', 'Qubo Smart Lock', 'Qubo', 7990, 'NA', '4 kWh',
-                 '["Bluetooth", "Auto-Lock"]', 'appliance_images/SL010.jpg', 5, 2),
-
-
-                # Smart Thermostats
-                ('ST001', 'Google Nest Learning', 'Google', 15990, '4 star', '15 kWh',
-                 '["Auto-Schedule", "Farsight"]', 'appliance_images/ST001.jpg', 5, 3),
-                ('ST002', 'Honeywell T6 Pro', 'Honeywell', 12990, 'NA', '12 kWh',
-                 '["Geofencing", "OpenTherm"]', 'appliance_images/ST002.jpg', 5, 3),
-                ('ST003', 'Ecobee SmartThermostat', 'Ecobee', 17990, '5 star', '10 kWh',
-                 '["Alexa Built-in", "Room Sensors"]', 'appliance_images/ST003.jpg', 5, 3),
-                ('ST004', 'Tado Smart Thermostat', 'Tado', 14990, 'NA', '14 kWh',
-                 '["Geofencing", "Weather Adaptation"]', 'appliance_images/ST004.jpg', 5, 3),
-                ('ST005', 'Hive Active Heating', 'Hive', 11990, 'NA', '13 kWh',
-                 '["App Control", "Boiler Control"]', 'appliance_images/ST005.jpg', 5, 3),
-                ('ST006', 'Drayton Wiser', 'Drayton', 9990, 'NA', '11 kWh',
-                 '["Multi-Zone", "Smart Scheduling"]', 'appliance_images/ST006.jpg', 5, 3),
-                ('ST007', 'Netatmo Smart Thermostat', 'Netatmo', 13990, 'NA', '12 kWh',
-                 '["Weather Compensation", "Auto-Assist"]', 'appliance_images/ST007.jpg', 5, 3),
-                ('ST008', 'Honeywell Lyric T6', 'Honeywell', 10990, '5 star', '10 kWh',
-                 '["Geofencing", "Touchscreen"]', 'appliance_images/ST008.jpg', 5, 3),
-                ('ST009', 'Siemens RDE100', 'Siemens', 8990, 'NA', '9 kWh',
-                 '["OpenTherm", "Weather Comp"]', 'appliance_images/ST009.jpg', 5, 3),
-                ('ST010', 'Salus iT500', 'Salus', 7990, 'NA', '8 kWh',
-                 '["Smart Scheduling", "App Control"]', 'appliance_images/ST010.jpg', 5, 3),
-
-                # Smoke Detectors
-                ('SD001', 'FireAngel ST-622', 'FireAngel', 2990, '4 star', '2 kWh',
-                 '["Wi-Fi", "10-Year Battery"]', 'appliance_images/SD001.jpg', 5, 4),
-                ('SD002', 'Kidde KN-COSM-B', 'Kidde', 1990, 'NA', '1.5 kWh',
-                 '["CO Detection", "Voice Alarm"]', 'appliance_images/SD002.jpg', 5, 4),
-                ('SD003', 'First Alert SCO5CN', 'First Alert', 2490, 'NA', '2.5 kWh',
-                 '["Combination Sensor", "Battery Backup"]', 'appliance_images/SD003.jpg', 5, 4),
-                ('SD004', 'Nest Protect', 'Google', 5990, '5 star', '3 kWh',
-                 '["Split-Spectrum Sensor", "App Alerts"]', 'appliance_images/SD004.jpg', 5, 4),
-                ('SD005', 'X-Sense SD03', 'X-Sense', 1790, 'NA', '1.8 kWh',
-                 '["Photoelectric", "10-Year Battery"]', 'appliance_images/SD005.jpg', 5, 4),
-                ('SD006', 'Ei Electronics Ei650', 'Ei', 3490, 'NA', '2.2 kWh',
-                 '["Radio Interconnect", "Hush Button"]', 'appliance_images/SD006.jpg', 5, 4),
-                ('SD007', 'Honeywell X-Series', 'Honeywell', 2790, 'NA', '2 kWh',
-                 '["Photoelectric", "Test Button"]', 'appliance_images/SD007.jpg', 5, 4),
-                ('SD008', 'Aico Ei141', 'Aico', 3990, '5 star', '2.8 kWh',
-                 '["RadioLINK", "Optical Sensor"]', 'appliance_images/SD008.jpg', 5, 4),
-                ('SD009', 'Heiman HS1SA', 'Heiman', 2290, 'NA', '1.7 kWh',
-                 '["Zigbee", "LED Indicator"]', 'appliance_images/SD009.jpg', 5, 4),
-                ('SD010', 'Smartwares RM370', 'Smartwares', 1590, 'NA', '1.5 kWh',
-                 '["Photoelectric", "10-Year Battery"]', 'appliance_images/SD010.jpg', 5, 4),
-
-                #############################################################################################################33
-                # Personal Care
-                # Hair Dryers
-                ('HD001', 'Dyson Supersonic', 'Dyson', 29900, '5 star', '50 kWh',
-                 '["Fast Drying", "Heat Control"]', 'appliance_images/HD001.jpg', 6, 1),
-                ('HD002', 'Philips HP8100', 'Philips', 1990, '3 star', '40 kWh',
-                 '["Ionic", "Foldable"]', 'appliance_images/HD002.jpg', 6, 1),
-                ('HD003', 'Wahl Super Dry', 'Wahl', 2490, '4 star', '45 kWh',
-                 '["Ceramic", "2 Speed"]', 'appliance_images/HD003.jpg', 6, 1),
-                ('HD004', 'Babyliss Pro 230', 'Babyliss', 3490, '5 star', '55 kWh',
-                 '["2000W", "Cold Shot"]', 'appliance_images/HD004.jpg', 6, 1),
-                ('HD005', 'Remington D3190', 'Remington', 1790, '3 star', '42 kWh',
-                 '["Ceramic", "Diffuser"]', 'appliance_images/HD005.jpg', 6, 1),
-                ('HD006', 'Vega Bloom 1000W', 'Vega', 1290, '2 star', '38 kWh',
-                 '["Ionic", "Compact"]', 'appliance_images/HD006.jpg', 6, 1),
-                ('HD007', 'Nova NHP 1500', 'Nova', 1590, '4 star', '48 kWh',
-                 '["Tourmaline", "2 Heat"]', 'appliance_images/HD007.jpg', 6, 1),
-                ('HD008', 'Agaro 33000', 'Agaro', 2290, '5 star', '52 kWh',
-                 '["Ceramic", "Cool Air"]', 'appliance_images/HD008.jpg', 6, 1),
-                ('HD009', 'Panasonic EH-NA65', 'Panasonic', 4990, '4 star', '46 kWh',
-                 '["Nanoe", "Dual Voltage"]', 'appliance_images/HD009.jpg', 6, 1),
-                ('HD010', 'Havells HD3151', 'Havells', 1890, '3 star', '44 kWh',
-                 '["2000W", "Foldable"]', 'appliance_images/HD010.jpg', 6, 1),
-
-                # Electric Shavers
-                ('ES0011', 'Philips S9000', 'Philips', 14990, '5 star', '20 kWh',
-                 '["Wet&Dry", "Self-Sharpening"]', 'appliance_images/ES0011.jpg', 6, 2),
-                ('ES0021', 'Braun Series 7', 'Braun', 12990, '4 star', '18 kWh',
-                 '["AutoClean", "5-in-1"]', 'appliance_images/ES0021.jpg', 6, 2),
-                ('ES0031', 'Panasonic ES-LT67', 'Panasonic', 8990, '3 star', '15 kWh',
-                 '["Multi-Flex", "Linear Motor"]', 'appliance_images/ES0031.jpg', 6, 2),
-                ('ES0041', 'Philips OneBlade', 'Philips', 4990, '4 star', '10 kWh',
-                 '["Hybrid", "3-in-1"]', 'appliance_images/ES0041.jpg', 6, 2),
-                ('ES0051', 'Nova NG-1000', 'Nova', 1990, '2 star', '12 kWh',
-                 '["Foil Shaver", "Trimmer"]', 'appliance_images/ES0051.jpg', 6, 2),
-                ('ES0061', 'Wahl Lifeproof', 'Wahl', 7990, '5 star', '14 kWh',
-                 '["Waterproof", "Self-Sharpening"]', 'appliance_images/ES0061.jpg', 6, 2),
-                ('ES0071', 'Remington F5-5800', 'Remington', 5990, '3 star', '16 kWh',
-                 '["Flexible Head", "Precision Trimmer"]', 'appliance_images/ES0071.jpg', 6, 2),
-                ('ES0081', 'Kemei KM-5018', 'Kemei', 1490, '2 star', '8 kWh',
-                 '["3D Floating", "USB Charge"]', 'appliance_images/ES0081.jpg', 6, 2),
-                ('ES0091', 'Syska SS101', 'Syska', 2490, '4 star', '11 kWh',
-                 '["Foil Shaver", "LED Display"]', 'appliance_images/ES0091.jpg', 6, 2),
-                ('ES0101', 'Agaro 37013', 'Agaro', 1790, '3 star', '9 kWh',
-                 '["3D Floating", "Washable"]', 'appliance_images/ES0101.jpg', 6, 2),
-
-                # Electric Toothbrushes
-                ('ET001', 'Oral-B iO8', 'Oral-B', 12990, '5 star', '10 kWh',
-                 '["AI Coaching", "Smart Display"]', 'appliance_images/ET001.jpg', 6, 3),
-                ('ET002', 'Philips Sonicare 9900', 'Philips', 14990, '4 star', '12 kWh',
-                 '["Pressure Sensor", "3 Modes"]', 'appliance_images/ET002.jpg', 6, 3),
-                ('ET003', 'Colgate Hum', 'Colgate', 3990, '3 star', '8 kWh',
-                 '["App Connected", "Smart Timer"]', 'appliance_images/ET003.jpg', 6, 3),
-                ('ET004', 'Oral-B Pro 1000', 'Oral-B', 2990, '4 star', '7 kWh',
-                 '["CrossAction", "2 Min Timer"]', 'appliance_images/ET004.jpg', 6, 3),
-                ('ET005', 'Philips Sonicare 4100', 'Philips', 3490, '3 star', '9 kWh',
-                 '["2 Modes", "Pressure Sensor"]', 'appliance_images/ET005.jpg', 6, 3),
-                ('ET006', 'Foreo Issa 2', 'Foreo', 9990, '5 star', '6 kWh',
-                 '["Silicone Bristles", "12 Modes"]', 'appliance_images/ET006.jpg', 6, 3),
-                ('ET007', 'Waterpik Sonic-Fusion', 'Waterpik', 8990, '4 star', '11 kWh',
-                 '["Flosser+Brush", "2 Modes"]', 'appliance_images/ET007.jpg', 6, 3),
-                ('ET008', 'Burst Sonic', 'Burst', 4990, '3 star', '5 kWh',
-                 '["Charcoal Bristles", "Whitening"]', 'appliance_images/ET008.jpg', 6, 3),
-                ('ET009', 'Quip Electric Toothbrush', 'Quip', 2490, '2 star', '4 kWh',
-                 '["Slim Design", "Subscription"]', 'appliance_images/ET009.jpg', 6, 3),
-                ('ET010', 'Himalaya Herbals', 'Himalaya', 1790, '4 star', '5 kWh',
-                 '["Soft Bristles", "2 Modes"]', 'appliance_images/ET010.jpg', 6, 3),
-
-                #########################################################################################################################3
-                # Miscellaneous
-                # Treadmills
-                ('TM001', 'Cult Sport', 'Cult', 34990, '5 star', '200 kWh',
-                 '["2HP Motor", "12 Programs"]', 'appliance_images/TM001.jpg', 7, 1),
-                ('TM002', 'PowerMax TDM-100', 'PowerMax', 24990, '4 star', '250 kWh',
-                 '["3HP Peak", "Auto Incline"]', 'appliance_images/TM002.jpg', 7, 1),
-                ('TM003', 'Sparnod Fitness TR-450', 'Sparnod', 29990, '3 star', '220 kWh',
-                 '["16 Programs", "300kg Capacity"]', 'appliance_images/TM003.jpg', 7, 1),
-                ('TM004', 'Fitkit FT-440', 'Fitkit', 19990, '4 star', '180 kWh',
-                 '["2.5HP", "12 Programs"]', 'appliance_images/TM004.jpg', 7, 1),
-                ('TM005', 'Healthgenie 4112', 'Healthgenie', 17990, '3 star', '210 kWh',
-                 '["2HP", "Manual Incline"]', 'appliance_images/TM005.jpg', 7, 1),
-                ('TM006', 'Proline PTM-100', 'Proline', 22990, '5 star', '230 kWh',
-                 '["3HP Peak", "15 Programs"]', 'appliance_images/TM006.jpg', 7, 1),
-                ('TM007', 'Kobo TM-09', 'Kobo', 15990, '3 star', '190 kWh',
-                 '["2.25HP", "Foldable"]', 'appliance_images/TM007.jpg', 7, 1),
-                ('TM008', 'Avon Actium', 'Avon', 27990, '4 star', '240 kWh',
-                 '["3.5HP", "Auto Incline"]', 'appliance_images/TM008.jpg', 7, 1),
-                ('TM009', 'Tunturi Jog F40', 'Tunturi', 39990, '5 star', '260 kWh',
-                 '["4HP", "22 Programs"]', 'appliance_images/TM009.jpg', 7, 1),
-                ('TM010', 'NordicTrack T6.5S', 'NordicTrack', 49990, '5 star', '280 kWh',
-                 '["3.6CHP", "iFit Compatible"]', 'appliance_images/TM010.jpg', 7, 1),
-
-                # Air Compressors
-                ('AC0011', 'Elgi 2HP', 'Elgi', 14990, '5 star', '300 kWh',
-                 '["50L Tank", "Oil-Free"]', 'appliance_images/AC0011.jpg', 7, 2),
-                ('AC0021', 'Hitachi EC28M', 'Hitachi', 12990, '4 star', '280 kWh',
-                 '["1HP", "Direct Drive"]', 'appliance_images/AC0021.jpg', 7, 2),
-                ('AC0031', 'Bosch GAS 18V-2', 'Bosch', 17990, '3 star', '250 kWh',
-                 '["Portable", "2 Gallon"]', 'appliance_images/AC0031.jpg', 7, 2),
-                ('AC0041', 'Ingersoll Rand SS3', 'Ingersoll Rand', 29990, '5 star', '350 kWh',
-                 '["3HP", "60L Tank"]', 'appliance_images/AC0041.jpg', 7, 2),
-                ('AC0051', 'Black+Decker BDPC200', 'Black+Decker', 9990, '3 star', '220 kWh',
-                 '["2HP", "6L Tank"]', 'appliance_images/AC0051.jpg', 7, 2),
-                ('AC0061', 'Makita MAC700', 'Makita', 24990, '5 star', '320 kWh',
-                 '["2HP", "Oil Lubricated"]', 'appliance_images/AC0061.jpg', 7, 2),
-                ('AC0071', 'Rolair VT25BIG', 'Rolair', 19990, '4 star', '290 kWh',
-                 '["2.5HP", "Portable"]', 'appliance_images/AC0071.jpg', 7, 2),
-                ('AC0081', 'Campbell Hausfeld DC080500', 'Campbell Hausfeld', 11990, '4 star', '270 kWh',
-                 '["1HP", "8 Gallon"]', 'appliance_images/AC0081.jpg', 7, 2),
-                ('AC0091', 'Porter-Cable C2002', 'Porter-Cable', 13990, '3 star', '310 kWh',
-                 '["1.5HP", "6 Gallon"]', 'appliance_images/AC0091.jpg', 7, 2),
-                ('AC0101', 'DeWalt DWFP55126', 'DeWalt', 16990, '5 star', '330 kWh',
-                 '["2HP", "6 Gallon"]', 'appliance_images/AC0101.jpg', 7, 2),
-
-                # Water Softeners
-                ('WS001', 'Kent Supreme Plus', 'Kent', 24990, '5 star', '50 kWh',
-                 '["Ion Exchange", "25L Capacity"]', 'appliance_images/WS001.jpg', 7, 3),
-                ('WS002', 'Aquaguard Protect+', 'Aquaguard', 27990, '4 star', '45 kWh',
-                 '["Smart Alert", "30L Capacity"]', 'appliance_images/WS002.jpg', 7, 3),
-                ('WS003', 'Pureit Advanced', 'Pureit', 22990, '4 star', '55 kWh',
-                 '["Auto Flush", "20L Capacity"]', 'appliance_images/WS003.jpg', 7, 3),
-                ('WS004', 'HUL Pureit Ultima', 'HUL', 19990, '3 star', '60 kWh',
-                 '["UV+UF", "15L Capacity"]', 'appliance_images/WS004.jpg', 7, 3),
-                ('WS005', 'Livpure Glo', 'Livpure', 25990, '4 star', '48 kWh',
-                 '["RO+UV", "8L Storage"]', 'appliance_images/WS005.jpg', 7, 3),
-                ('WS006', 'AO Smith Z8', 'AO Smith', 29990, '5 star', '42 kWh',
-                 '["Digital Display", "Side Stream"]', 'appliance_images/WS006.jpg', 7, 3),
-                ('WS007', 'Eureka Forbes Aquasure', 'Eureka Forbes', 21990, '3 star', '52 kWh',
-                 '["TDS Controller", "10L Storage"]', 'appliance_images/WS007.jpg', 7, 3),
-                ('WS008', 'Whirlpool Marvel', 'Whirlpool', 26990, '4 star', '47 kWh',
-                 '["6-Stage Purification", "7L Storage"]', 'appliance_images/WS008.jpg', 7, 3),
-                ('WS009', 'LG PuriCare', 'LG', 23990, '4 star', '53 kWh',
-                 '["UV Nano", "8L Storage"]', 'appliance_images/WS009.jpg', 7, 3),
-                ('WS010', 'KENT Grand Plus', 'KENT', 28990, '5 star', '44 kWh',
-                 '["RO+UV+UF", "12L Storage"]', 'appliance_images/WS010.jpg', 7, 3),
-
-            ]
-            # Insert sample appliances for each subcategory
-            cursor.executemany('''
-                        INSERT OR IGNORE INTO appliances 
-                        (id, name, brand, price, energy_rating, annual_consumption, features, image_url, category_id, subcategory_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', sample_appliances)
-
-            db.commit()
+
+def create_tables(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS subcategories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        FOREIGN KEY (category_id) REFERENCES categories (id)
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS appliances (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        brand TEXT NOT NULL,
+        price REAL NOT NULL,
+        energy_rating TEXT NOT NULL,
+        annual_consumption TEXT,
+        features TEXT,
+        image_url TEXT,
+        category_id INTEGER NOT NULL,
+        subcategory_id INTEGER NOT NULL,
+        FOREIGN KEY (category_id) REFERENCES categories (id),
+        FOREIGN KEY (subcategory_id) REFERENCES subcategories (id)
+    )
+    ''')
+
+
+def seed_catalog(cursor):
+    """Load the sample catalog; safe to re-run against a database that already has it"""
+    import seed_data
+
+    # Category and subcategory ids are positional, so only seed them into empty tables
+    if not cursor.execute('SELECT COUNT(*) FROM categories').fetchone()[0]:
+        cursor.executemany('INSERT INTO categories (name) VALUES (?)', seed_data.CATEGORIES)
+    if not cursor.execute('SELECT COUNT(*) FROM subcategories').fetchone()[0]:
+        cursor.executemany('INSERT INTO subcategories (category_id, name) VALUES (?, ?)',
+                           seed_data.SUBCATEGORIES)
+
+    cursor.executemany('''
+    INSERT OR IGNORE INTO appliances
+    (id, name, brand, price, energy_rating, annual_consumption, features, image_url, category_id, subcategory_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', seed_data.APPLIANCES)
+    ingest_appliances(cursor)
+
+
+def create_change_log(cursor):
+    """Record every appliance write so catalog snapshots can refresh incrementally"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS catalog_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        appliance_rowid INTEGER NOT NULL
+    )
+    ''')
+    # REPLACE removes the conflicting row without firing delete triggers, so log it up front
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_log_replace BEFORE INSERT ON appliances BEGIN
+        INSERT INTO catalog_changes (appliance_rowid) SELECT rowid FROM appliances WHERE id = new.id;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_log_insert AFTER INSERT ON appliances BEGIN
+        INSERT INTO catalog_changes (appliance_rowid) VALUES (new.rowid);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_log_update BEFORE UPDATE ON appliances BEGIN
+        INSERT INTO catalog_changes (appliance_rowid)
+        SELECT rowid FROM appliances WHERE id = new.id AND rowid != old.rowid;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_log_updated AFTER UPDATE ON appliances BEGIN
+        INSERT INTO catalog_changes (appliance_rowid) VALUES (old.rowid);
+        INSERT INTO catalog_changes (appliance_rowid) SELECT new.rowid WHERE new.rowid != old.rowid;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_log_delete AFTER DELETE ON appliances BEGIN
+        INSERT INTO catalog_changes (appliance_rowid) VALUES (old.rowid);
+    END
+    ''')
+
+
+def create_indexes(cursor):
+    """Indexes behind the scope + budget filters and the subcategory lookup"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_appliances_subcategory_price '
+                   'ON appliances (subcategory_id, price)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_appliances_category_price '
+                   'ON appliances (category_id, price)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_subcategories_category '
+                   'ON subcategories (category_id)')
+
+
+def create_search_index(cursor):
+    """FTS5 index over name, brand and parsed features, kept in step with appliances by triggers"""
+    cursor.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS appliances_fts USING fts5(
+        name, brand, features_json,
+        content = 'appliances', content_rowid = 'rowid',
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )
+    ''')
+    # External content: the index must be told the old values of a row to forget it
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_fts_replace BEFORE INSERT ON appliances BEGIN
+        INSERT INTO appliances_fts (appliances_fts, rowid, name, brand, features_json)
+        SELECT 'delete', rowid, name, brand, features_json FROM appliances WHERE id = new.id;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_fts_insert AFTER INSERT ON appliances BEGIN
+        INSERT INTO appliances_fts (rowid, name, brand, features_json)
+        VALUES (new.rowid, new.name, new.brand, new.features_json);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_fts_update BEFORE UPDATE ON appliances BEGIN
+        INSERT INTO appliances_fts (appliances_fts, rowid, name, brand, features_json)
+        SELECT 'delete', rowid, name, brand, features_json FROM appliances
+        WHERE id = new.id AND rowid != old.rowid;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_fts_updated AFTER UPDATE ON appliances BEGIN
+        INSERT INTO appliances_fts (appliances_fts, rowid, name, brand, features_json)
+        VALUES ('delete', old.rowid, old.name, old.brand, old.features_json);
+        INSERT INTO appliances_fts (rowid, name, brand, features_json)
+        VALUES (new.rowid, new.name, new.brand, new.features_json);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_fts_delete AFTER DELETE ON appliances BEGIN
+        INSERT INTO appliances_fts (appliances_fts, rowid, name, brand, features_json)
+        VALUES ('delete', old.rowid, old.name, old.brand, old.features_json);
+    END
+    ''')
+    rebuild_search_index(cursor)
+
+
+def create_ingest_triggers(cursor):
+    """Send rows whose raw strings change back through ingest, and index the rows waiting for it"""
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS appliances_reingest
+    AFTER UPDATE OF energy_rating, annual_consumption, features ON appliances BEGIN
+        UPDATE appliances SET energy_tier = NULL, annual_kwh = NULL, features_json = NULL
+        WHERE rowid = new.rowid;
+    END
+    ''')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_appliances_pending_ingest '
+                   f'ON appliances (energy_tier) WHERE {PENDING_INGEST}')
+    ingest_appliances(cursor)
+
+
+def rebuild_search_index(cursor):
+    cursor.execute("INSERT INTO appliances_fts (appliances_fts) VALUES ('rebuild')")
+
+
+# Schema migrations, applied in order. Never edit a released step: append a new one.
+MIGRATIONS = [
+    (1, create_tables),
+    (2, migrate_parsed_columns),
+    (3, seed_catalog),
+    (4, create_change_log),
+    (5, create_indexes),
+    (6, create_search_index),
+    (7, create_ingest_triggers),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(cursor):
+    cursor.execute('CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)')
+    return cursor.execute('SELECT MAX(version) FROM schema_version').fetchone()[0] or 0
+
+
+def init_db(path=None):
+    """Bring the database up to SCHEMA_VERSION without touching existing data
+
+    Once a database is current this is a single version lookup, so every worker
+    can call it on boot. Workers that find pending migrations serialize on
+    BEGIN IMMEDIATE and re-check, so only the first one applies them.
+    """
+    with closing(sqlite3.connect(path or DB_PATH, timeout=30, isolation_level=None)) as db:
+        cursor = db.cursor()
+        # WAL is persistent in the file, so this only writes the first time
+        if cursor.execute('PRAGMA journal_mode').fetchone()[0] != 'wal':
+            cursor.execute('PRAGMA journal_mode = WAL')
+        if get_schema_version(cursor) >= SCHEMA_VERSION:
+            return
+
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            version = get_schema_version(cursor)
+            for step, migrate in MIGRATIONS:
+                if step > version:
+                    migrate(cursor)
+                    cursor.execute('INSERT INTO schema_version (version) VALUES (?)', (step,))
+            cursor.execute('COMMIT')
+        except BaseException:
+            cursor.execute('ROLLBACK')
+            raise
 
 
 # Initialize database
 init_db()
 
+
+# Slow query log
+# Statements slower than this, execution plus fetching, are logged with their plan
+SLOW_QUERY_SECONDS = float(os.environ.get('SLOW_QUERY_SECONDS', 0.05))
+SLOW_QUERY_LOG_SIZE = int(os.environ.get('SLOW_QUERY_LOG_SIZE', 100))
+# Required by the /admin endpoints (X-Admin-Token header); unset keeps them hidden
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+slow_queries = collections.deque(maxlen=SLOW_QUERY_LOG_SIZE)
+
+
+def parameter_shape(params):
+    """Types and lengths of statement parameters, never their values"""
+    def shape(value):
+        if isinstance(value, (str, bytes)):
+            return f'{type(value).__name__}[{len(value)}]'
+        return type(value).__name__
+    if isinstance(params, dict):
+        return {key: shape(value) for key, value in params.items()}
+    return [shape(value) for value in params]
+
+
+def record_slow_query(db, sql, params, seconds):
+    try:
+        plan = [row[3] for row in sqlite3.Connection.execute(db, f'EXPLAIN QUERY PLAN {sql}', params)]
+    except sqlite3.Error:  # PRAGMA, BEGIN and friends have no plan
+        plan = []
+    entry = {
+        "sql": ' '.join(sql.split()),
+        "params": parameter_shape(params),
+        "seconds": round(seconds, 6),
+        "plan": plan,
+        "endpoint": request.endpoint if has_request_context() else None,
+        "at": datetime.now().isoformat(timespec='seconds')
+    }
+    slow_queries.append(entry)
+    app.logger.warning('slow query (%.1f ms) %s params=%s plan=%s',
+                       seconds * 1000, entry["sql"], entry["params"], '; '.join(plan))
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that times each statement from execute until its rows are drained or dropped
+
+    SQLite steps lazily, so most of a scan's cost lands in the fetches rather
+    than in execute itself.
+    """
+
+    _sql = None
+
+    def _finish(self):
+        sql, self._sql = self._sql, None
+        if sql is not None and self._seconds >= SLOW_QUERY_SECONDS:
+            record_slow_query(self.connection, sql, self._params, self._seconds)
+
+    def _timed(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._seconds += time.perf_counter() - started
+
+    def execute(self, sql, params=()):
+        self._finish()
+        self._sql, self._params, self._seconds = sql, params, 0.0
+        self._timed(super().execute, sql, params)
+        if self.description is None:  # no result rows to wait for
+            self._finish()
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._finish()
+        self._sql, self._params, self._seconds = sql, (), 0.0
+        self._timed(super().executemany, sql, seq_of_params)
+        self._finish()
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed(super().fetchmany, self.arraysize if size is None else size)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            return self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+
+class TimedConnection(sqlite3.Connection):
+    """sqlite3 connection factory whose statements all go through TimedCursor"""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        return self.cursor().executemany(sql, seq_of_params)
+
+
+def admin_authorized():
+    offered = request.headers.get('X-Admin-Token') or ''
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(offered.encode(), ADMIN_TOKEN.encode())
+
+
+# Connection pool
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 8))
+DB_CACHE_KIB = int(os.environ.get('DB_CACHE_KIB', 32768))
+DB_MMAP_SIZE = int(os.environ.get('DB_MMAP_SIZE', 256 * 1024 * 1024))
+DB_CACHED_STATEMENTS = 256
+
+
+class ConnectionPool:
+    """Read-only SQLite connections opened once per worker and reused across requests"""
+
+    def __init__(self, path, size=DB_POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self.stats = {
+            "opened": 0,
+            "acquired": 0,
+            "reused": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0
+        }
+
+    def connect(self):
+        """Open a new tuned read-only connection (not managed by the pool)"""
+        uri = f'{Path(self.path).resolve().as_uri()}?mode=ro'
+        db = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                             cached_statements=DB_CACHED_STATEMENTS, factory=TimedConnection)
+        db.execute(f'PRAGMA cache_size = -{DB_CACHE_KIB}')
+        db.execute(f'PRAGMA mmap_size = {DB_MMAP_SIZE}')
+        return db
+
+    def _acquire(self):
+        with self._lock:
+            # Connections must not cross a fork (e.g. gunicorn --preload)
+            if self._pid != os.getpid():
+                self._reset()
+            self.stats["acquired"] += 1
+            try:
+                db = self._idle.get_nowait()
+                self.stats["reused"] += 1
+                return db
+            except queue.Empty:
+                if self._opened < self.size:
+                    self._opened += 1
+                    self.stats["opened"] += 1
+                    return None
+
+        start = time.perf_counter()
+        db = self._idle.get()
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.stats["reused"] += 1
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += waited
+            self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], waited)
+        return db
+
+    @contextmanager
+    def connection(self):
+        with stage('connect'):
+            db = self._acquire()
+            if db is None:
+                try:
+                    db = self.connect()
+                except BaseException:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+        try:
+            yield db
+        finally:
+            self._idle.put(db)
+
+    def metrics(self):
+        with self._lock:
+            return {**self.stats, "size": self.size, "open": self._opened, "idle": self._idle.qsize()}
+
+
+db_pool = ConnectionPool(DB_PATH)
+
+
+# Request metrics
+# Latency histogram bucket bounds in seconds, Prometheus client defaults widened downwards
+METRIC_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                  1.0, 2.5, 5.0, 10.0)
+
+_request_timings = threading.local()
+
+
+@contextmanager
+def stage(name):
+    """Time a block as one stage of the current request; free outside requests"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages = getattr(_request_timings, 'stages', None)
+        if stages is not None:
+            stages.append((name, time.perf_counter() - started))
+
+
+class Histogram:
+    """Latency histogram with one series per label value, rendered as Prometheus text"""
+
+    def __init__(self, name, help_text, label, buckets=METRIC_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # label value -> per-bucket counts (last one is +Inf) followed by the running sum
+        self._series = {}
+
+    def observe(self, seconds, label_value):
+        bucket = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[bucket] += 1
+            series[-1] += seconds
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = {value: list(counts) for value, counts in self._series.items()}
+        for value, counts in sorted(series.items()):
+            label = f'{self.label}="{value}"'
+            total = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                total += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label},le="{le}"}} {total}')
+            lines.append(f'{self.name}_sum{{{label}}} {counts[-1]!r}')
+            lines.append(f'{self.name}_count{{{label}}} {total}')
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values"""
+
+    def __init__(self, name, help_text, labels):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *label_values):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            labels = ','.join(f'{label}="{value}"' for label, value in zip(self.labels, label_values))
+            lines.append(f'{self.name}{{{labels}}} {value}')
+        return lines
+
+
+STAGE_SECONDS = Histogram('dtbs_stage_duration_seconds', 'Time spent in each request stage.', 'stage')
+REQUEST_SECONDS = Histogram('dtbs_request_duration_seconds', 'Request latency by endpoint.', 'endpoint')
+REQUESTS = Counter('dtbs_requests_total', 'Requests by endpoint, method and status.',
+                   ('endpoint', 'method', 'status'))
+
+
+@app.before_request
+def start_request_timing():
+    _request_timings.started = time.perf_counter()
+    _request_timings.stages = []
+
+
+@app.after_request
+def finish_request_timing(response):
+    """Fold the request's stages into the histograms and report them in Server-Timing"""
+    stages = getattr(_request_timings, 'stages', None)
+    if stages is None:
+        return response
+    _request_timings.stages = None
+    elapsed = time.perf_counter() - _request_timings.started
+
+    totals = {}
+    for name, seconds in stages:
+        totals[name] = totals.get(name, 0.0) + seconds
+    for name, seconds in totals.items():
+        STAGE_SECONDS.observe(seconds, name)
+    endpoint = request.endpoint or 'unmatched'
+    REQUEST_SECONDS.observe(elapsed, endpoint)
+    REQUESTS.inc(endpoint, request.method, str(response.status_code))
+
+    response.headers['Server-Timing'] = ', '.join(
+        [f'{name};dur={seconds * 1000:.3f}' for name, seconds in totals.items()]
+        + [f'total;dur={elapsed * 1000:.3f}'])
+    return response
+
+
+def _gauges(prefix, values, help_text):
+    """Prometheus lines for a flat dict of numeric stats"""
+    lines = []
+    for key, value in values.items():
+        name = f'{prefix}_{key}'
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} gauge', f'{name} {value!r}']
+    return lines
+
+
+# Request profiling
+# Opt-in: a request carrying this token in X-Profile or ?profile= runs under cProfile
+PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN', '')
+PROFILE_DIR = os.environ.get('PROFILE_DIR', 'profiles')
+# Seconds between stack samples of in-flight requests; 0 turns the sampler off
+PROFILE_SAMPLE_INTERVAL = float(os.environ.get('PROFILE_SAMPLE_INTERVAL', 0))
+# Seconds of samples aggregated into each collapsed-stack file
+PROFILE_SAMPLE_WINDOW = float(os.environ.get('PROFILE_SAMPLE_WINDOW', 60))
+PROFILE_SUMMARY_LINES = 40
+
+# cProfile hooks the whole interpreter from Python 3.12, so one profiled request at a time
+_profile_lock = threading.Lock()
+# thread id -> endpoint for requests being handled right now, read by the sampler
+_active_requests = {}
+_profile_seq = itertools.count()
+
+
+def profile_requested():
+    if not PROFILE_TOKEN:
+        return False
+    offered = request.headers.get('X-Profile') or request.args.get('profile') or ''
+    return hmac.compare_digest(offered.encode(), PROFILE_TOKEN.encode())
+
+
+def _profile_path(label, extension):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    return os.path.join(PROFILE_DIR, f'{label}-{stamp}-{os.getpid()}-{next(_profile_seq)}{extension}')
+
+
+def dump_profile(profiler, endpoint):
+    """Write a .prof (pstats, loadable by snakeviz or gprof2dot) and a text summary
+
+    Returns the .prof path, or None when the directory is unwritable: a
+    profile is never worth failing the request over.
+    """
+    summary = io.StringIO()
+    summary.write(f'{request.method} {request.full_path}\n\n')
+    pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(PROFILE_SUMMARY_LINES)
+    try:
+        path = _profile_path(endpoint, '.prof')
+        profiler.dump_stats(path)
+        with open(path[:-len('.prof')] + '.txt', 'w', encoding='utf-8') as f:
+            f.write(summary.getvalue())
+    except OSError as e:
+        app.logger.warning('cannot write profile: %s', e)
+        return None
+    return path
+
+
+@app.before_request
+def start_request_profile():
+    _active_requests[threading.get_ident()] = request.endpoint or 'unmatched'
+    if PROFILE_SAMPLE_INTERVAL > 0:
+        ensure_stack_sampler()
+    if profile_requested() and _profile_lock.acquire(blocking=False):
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+
+@app.after_request
+def finish_request_profile(response):
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        _profile_lock.release()
+        path = dump_profile(profiler, request.endpoint or 'unmatched')
+        if path:
+            response.headers['X-Profile-File'] = os.path.basename(path)
+    return response
+
+
+@app.teardown_request
+def abandon_request_profile(exc):
+    _active_requests.pop(threading.get_ident(), None)
+    profiler = g.pop('profiler', None)
+    if profiler is not None:  # the view raised, so after_request never ran
+        profiler.disable()
+        _profile_lock.release()
+        dump_profile(profiler, 'error')
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+def collapse_stack(frame):
+    """Root-first 'a;b;c' stack, the format flamegraph.pl and speedscope read"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class StackSampler:
+    """Samples the stacks of threads handling requests and writes collapsed-stack files per window"""
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL, window=PROFILE_SAMPLE_WINDOW):
+        self.interval = interval
+        self.window = window
+        self.pid = os.getpid()
+        self.samples = {}
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def sample(self):
+        frames = sys._current_frames()
+        for ident, endpoint in list(_active_requests.items()):
+            frame = frames.get(ident)
+            if frame is not None:
+                stack = f'{endpoint};{collapse_stack(frame)}'
+                self.samples[stack] = self.samples.get(stack, 0) + 1
+
+    def flush(self):
+        samples, self.samples = self.samples, {}
+        if not samples:
+            return None
+        path = _profile_path('samples', '.collapsed')
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(samples.items()):
+                f.write(f'{stack} {count}\n')
+        return path
+
+    def _run(self):
+        flush_at = time.monotonic() + self.window
+        while True:
+            time.sleep(self.interval)
+            self.sample()
+            if time.monotonic() >= flush_at:
+                flush_at += self.window
+                try:
+                    self.flush()
+                except OSError as e:
+                    app.logger.warning('cannot write stack samples: %s', e)
+
+
+_stack_sampler = None
+_stack_sampler_lock = threading.Lock()
+
+
+def ensure_stack_sampler():
+    """Start this process's sampler on its first request; forked workers each get their own"""
+    global _stack_sampler
+    if _stack_sampler is not None and _stack_sampler.pid == os.getpid():
+        return
+    with _stack_sampler_lock:
+        if _stack_sampler is None or _stack_sampler.pid != os.getpid():
+            _stack_sampler = StackSampler()
+
+
 # Energy data
 ENERGY_DATA = {
     "price_per_kwh": 7.50,
@@ -905,36 +827,500 @@ ENERGY_DATA = {
 }
 
 
-# Recommendation algorithm
-def recommend_appliances(category_id=None, subcategory_id=None, budget=50000, eco_priority=0.5):
-    """AI recommendation engine using database"""
-    with closing(sqlite3.connect('../appliances.db')) as db:
-        cursor = db.cursor()
+# Catalog snapshot
+def _energy_scores(energy_tier):
+    scores = np.ones(len(energy_tier), dtype=np.float64)
+    for tier, score in ENERGY_SCORES.items():
+        scores[energy_tier == tier] = score
+    return scores
+
+
+def _score(energy_score, price, budget, eco_priority):
+    """Scalar form of CatalogSnapshot.score, bit-for-bit identical to the vectorized one"""
+    price_score = 1 - min(price / budget, 1)
+    return (energy_score * eco_priority) + (price_score * (1 - eco_priority))
+
+
+class TierIndex:
+    """Price-sorted appliance positions per (scope, energy score)
+
+    Within one energy score the recommend score falls as price rises, so the
+    top-K for any budget is a k-way merge of these lists, each cut at the budget.
+    Scopes mirror the recommend filters: ('all', 0), ('category', id) and
+    ('subcategory', id).
+    """
+
+    SCOPES = ('all', 'category', 'subcategory')
+
+    def __init__(self, lists):
+        self.lists = lists
+        self.prices = {}
+        self.rowids = {}
+        self.scope_keys = {}
+        for key in lists:
+            self.scope_keys.setdefault(key[:2], []).append(key)
+
+    @staticmethod
+    def scope_for(category_id=None, subcategory_id=None):
+        if subcategory_id:
+            return 'subcategory', int(subcategory_id)
+        elif category_id:
+            return 'category', int(category_id)
+        return 'all', 0
+
+    @staticmethod
+    def _scope_ids(catalog, scope, positions):
+        if scope == 'subcategory':
+            return catalog.subcategory_id[positions]
+        elif scope == 'category':
+            return catalog.category_id[positions]
+        return np.zeros(len(positions), dtype=np.int64)
+
+    @staticmethod
+    def _sorted(catalog, positions):
+        return positions[np.lexsort((catalog.rowid[positions], catalog.price[positions]))]
+
+    def _attach(self, catalog, keys):
+        for key in keys:
+            self.prices[key] = catalog.price[self.lists[key]]
+            self.rowids[key] = catalog.rowid[self.lists[key]]
+        return self
+
+    @classmethod
+    def build(cls, catalog, positions):
+        lists = {}
+        energy = catalog.energy_score[positions]
+        for scope in cls.SCOPES:
+            ids = cls._scope_ids(catalog, scope, positions)
+            order = np.lexsort((catalog.rowid[positions], catalog.price[positions], energy, ids))
+            ids, scores, ordered = ids[order], energy[order], positions[order]
+            breaks = np.flatnonzero((ids[1:] != ids[:-1]) | (scores[1:] != scores[:-1])) + 1
+            for start, end in zip(np.r_[0, breaks], np.r_[breaks, len(ordered)]):
+                if end > start:
+                    lists[(scope, int(ids[start]), float(scores[start]))] = ordered[start:end]
+        return cls(lists)._attach(catalog, lists)
+
+    def updated(self, previous, catalog, changed, members):
+        """Copy of this index with the changed positions re-slotted
+
+        Only the lists that held or now hold a changed position are rebuilt;
+        every other list is shared with this index.
+        """
+        touched = set()
+        old = changed[changed < len(previous)]
+        new = changed[members[changed]]
+        for scope in self.SCOPES:
+            for source, positions in ((previous, old), (catalog, new)):
+                ids = self._scope_ids(source, scope, positions)
+                for scope_id, score in zip(ids.tolist(), source.energy_score[positions].tolist()):
+                    touched.add((scope, scope_id, score))
+
+        lists = dict(self.lists)
+        rebuilt = []
+        for key in touched:
+            kept = lists.pop(key, np.empty(0, dtype=np.int64))
+            kept = kept[~np.isin(kept, changed)]
+            scope, scope_id, score = key
+            added = new[(self._scope_ids(catalog, scope, new) == scope_id) &
+                        (catalog.energy_score[new] == score)]
+            positions = self._sorted(catalog, np.concatenate([kept, added]))
+            if len(positions):
+                lists[key] = positions
+                rebuilt.append(key)
+
+        index = TierIndex(lists)
+        for key in lists.keys() - touched:
+            index.prices[key] = self.prices[key]
+            index.rowids[key] = self.rowids[key]
+        return index._attach(catalog, rebuilt)
+
+    def _start(self, key, end, budget, eco_priority, after):
+        """First index in one list ranked below the (score, rowid) cursor"""
+        if after is None:
+            return 0
+        score, rowid = after
+        prices, rowids = self.prices[key], self.rowids[key]
+        # Scores never rise along a list, so binary search for the first one not above the cursor
+        i = bisect.bisect_left(prices, -score, 0, end,
+                               key=lambda price: -_score(key[2], price, budget, eco_priority))
+        while i < end and _score(key[2], prices[i], budget, eco_priority) == score and rowids[i] <= rowid:
+            i += 1
+        return i
+
+    def top(self, scope, scope_id, budget, eco_priority, limit, after=None):
+        """Exact top-`limit` positions and scores for one scope, best first
+
+        `after` is the (score, rowid) of the last item already returned; the
+        ranking resumes right below it without touching the earlier items.
+        """
+        return self.merge(self.scope_keys.get((scope, scope_id), ()), budget, eco_priority, limit, after)
+
+    def merge(self, keys, budget, eco_priority, limit, after=None, low=None):
+        """top() over any set of this index's lists, optionally skipping prices below `low`"""
+        heads = []
+        for key in keys:
+            end = int(np.searchsorted(self.prices[key], budget, side='right'))
+            i = self._start(key, end, budget, eco_priority, after)
+            if low is not None:
+                i = max(i, int(np.searchsorted(self.prices[key], low, side='left')))
+            if i < end:
+                score = _score(key[2], self.prices[key][i], budget, eco_priority)
+                heads.append((-score, int(self.rowids[key][i]), key, i, end))
+        heapq.heapify(heads)
+
+        picked = []
+        cutoff = None
+        while heads:
+            neg_score, rowid, key, i, end = heads[0]
+            # Scores only fall from here; keep going just long enough to collect ties at the cut
+            if cutoff is not None and -neg_score < cutoff:
+                break
+            picked.append((-neg_score, rowid, int(self.lists[key][i])))
+            if len(picked) == limit:
+                cutoff = -neg_score
+            if i + 1 < end:
+                score = _score(key[2], self.prices[key][i + 1], budget, eco_priority)
+                heapq.heapreplace(heads, (-score, int(self.rowids[key][i + 1]), key, i + 1, end))
+            else:
+                heapq.heappop(heads)
+
+        picked.sort(key=lambda item: (-item[0], item[1]))
+        picked = picked[:limit]
+        return (np.array([item[2] for item in picked], dtype=np.int64),
+                np.array([item[0] for item in picked], dtype=np.float64))
+
+
+class CatalogSnapshot:
+    """Columnar copy of the appliances table, loaded once and scored with NumPy
+
+    Positions are stable for the life of a process: deleted rows are only
+    marked dead and new rows are appended, so refreshes can reuse the
+    tier indexes of the previous snapshot.
+    """
+
+    COLUMNS = 'rowid, price, energy_tier, annual_kwh, category_id, subcategory_id'
+    # PRODUCTS_QUERY joins both, so appliances whose category or subcategory is missing cannot be shown.
+    # The unary + keeps SQLite reading in rowid order instead of through the category index.
+    LISTED = '+category_id IN (SELECT id FROM categories) AND +subcategory_id IN (SELECT id FROM subcategories)'
+    COLUMNS_QUERY = f'SELECT {COLUMNS} FROM appliances WHERE {LISTED} ORDER BY rowid'
+    CHANGED_COLUMNS_QUERY = f'''
+    SELECT {COLUMNS} FROM appliances
+    WHERE rowid IN (SELECT value FROM json_each(?)) AND {LISTED}
+    ORDER BY rowid
+    '''
+    # Brands are text, so they are read apart from the numeric columns and kept as codes
+    BRANDS_QUERY = f'SELECT brand FROM appliances WHERE {LISTED} ORDER BY rowid'
+    CHANGED_BRANDS_QUERY = f'''
+    SELECT brand FROM appliances
+    WHERE rowid IN (SELECT value FROM json_each(?)) AND {LISTED}
+    ORDER BY rowid
+    '''
+    CHANGE_SEQ_QUERY = 'SELECT IFNULL(MAX(seq), 0) FROM catalog_changes'
+    CHANGES_QUERY = 'SELECT DISTINCT appliance_rowid FROM catalog_changes WHERE seq > ?'
+
+    def __init__(self, rowid, price, energy_tier, annual_kwh, category_id, subcategory_id,
+                 alive=None, change_seq=0, data_version=None, brand_code=None, brands=()):
+        self.rowid = rowid
+        self.price = price
+        self.energy_tier = energy_tier
+        self.energy_score = _energy_scores(energy_tier)
+        self.annual_kwh = annual_kwh
+        self.category_id = category_id
+        self.subcategory_id = subcategory_id
+        self.alive = np.ones(len(rowid), dtype=bool) if alive is None else alive
+        # Eco picks include highly efficient appliances or those with low consumption
+        self.eco_eligible = self.alive & ((energy_tier == 5) | (annual_kwh < 200))
+        # brand_code indexes brands, which only ever grows so codes stay valid across refreshes
+        self.brand_code = np.zeros(len(rowid), dtype=np.int64) if brand_code is None else brand_code
+        self.brands = list(brands)
+        self.change_seq = change_seq
+        self.data_version = data_version
+        self.index = None
+        self.eco_index = None
+        self._facet_indexes = {}
+        self._frontiers = {}
+
+    def __len__(self):
+        return len(self.rowid)
+
+    @staticmethod
+    def _columns(rows):
+        columns = np.array(rows, dtype=np.float64).reshape(-1, 6)
+        # Rows written since the last ingest have no tier yet; they count as unrated until it runs
+        energy_tier = np.nan_to_num(columns[:, 2], nan=ENERGY_TIER_NA).astype(np.int64)
+        return (columns[:, 0].astype(np.int64), columns[:, 1].copy(), energy_tier,
+                columns[:, 3].copy(), columns[:, 4].astype(np.int64), columns[:, 5].astype(np.int64))
+
+    @staticmethod
+    def _brand_codes(rows, brands):
+        """Codes for a column of brand rows, and `brands` extended with any new names"""
+        ids = {name: code for code, name in enumerate(brands)}
+        codes = np.fromiter((ids.setdefault(row[0], len(ids)) for row in rows), dtype=np.int64, count=len(rows))
+        return codes, list(ids)
+
+    @classmethod
+    def load(cls, db, data_version=None):
+        with _read_transaction(db):
+            change_seq = db.execute(cls.CHANGE_SEQ_QUERY).fetchone()[0]
+            rows = db.execute(cls.COLUMNS_QUERY).fetchall()
+            brand_rows = db.execute(cls.BRANDS_QUERY).fetchall()
+        brand_code, brands = cls._brand_codes(brand_rows, ())
+        catalog = cls(*cls._columns(rows), change_seq=change_seq, data_version=data_version,
+                      brand_code=brand_code, brands=brands)
+        catalog.index = TierIndex.build(catalog, np.flatnonzero(catalog.alive))
+        catalog.eco_index = TierIndex.build(catalog, np.flatnonzero(catalog.eco_eligible))
+        return catalog
+
+    def refreshed(self, db, data_version):
+        """Snapshot with the rows changed since this one applied, falling back to a full load"""
+        with _read_transaction(db):
+            change_seq = db.execute(self.CHANGE_SEQ_QUERY).fetchone()[0]
+            if change_seq < self.change_seq:
+                changed = None  # change log was reset, e.g. a rebuilt database
+            else:
+                changed = [row[0] for row in db.execute(self.CHANGES_QUERY, (self.change_seq,))]
+            reload = changed is None or FULL_RELOAD_MARKER in changed or len(changed) > max(1000, len(self) // 10)
+            if not reload:
+                rows = db.execute(self.CHANGED_COLUMNS_QUERY, (json.dumps(changed),)).fetchall()
+                brand_rows = db.execute(self.CHANGED_BRANDS_QUERY, (json.dumps(changed),)).fetchall()
+        if reload:
+            return self.load(db, data_version)
+
+        changed = np.array(sorted(changed), dtype=np.int64)
+        rowid, price, energy_tier, annual_kwh, category_id, subcategory_id = self._columns(rows)
+        brand_code, brands = self._brand_codes(brand_rows, self.brands)
+
+        # Changed rowids this snapshot already has a position for; the rest are appended
+        known = np.searchsorted(self.rowid, changed)
+        in_range = known < len(self)
+        in_range[in_range] = self.rowid[known[in_range]] == changed[in_range]
+        previous_positions = known[in_range]
+        appended = ~np.isin(rowid, changed[in_range])
+        if appended.any() and len(self) and rowid[appended].min() <= self.rowid[-1]:
+            return self.load(db, data_version)  # new rowid inside the known range
+
+        columns = [np.concatenate([old, new[appended]]) for old, new in (
+            (self.rowid, rowid), (self.price, price), (self.energy_tier, energy_tier),
+            (self.annual_kwh, annual_kwh), (self.category_id, category_id),
+            (self.subcategory_id, subcategory_id), (self.brand_code, brand_code))]
+        alive = np.concatenate([self.alive, np.ones(appended.sum(), dtype=bool)])
+        alive[previous_positions] = False
+
+        positions = np.searchsorted(columns[0], rowid)
+        for column, values in zip(columns, (rowid, price, energy_tier, annual_kwh,
+                                            category_id, subcategory_id, brand_code)):
+            column[positions] = values
+        alive[positions] = True
+
+        catalog = CatalogSnapshot(*columns[:-1], alive=alive, change_seq=change_seq, data_version=data_version,
+                                  brand_code=columns[-1], brands=brands)
+        touched = np.union1d(previous_positions, positions)
+        catalog.index = self.index.updated(self, catalog, touched, catalog.alive)
+        catalog.eco_index = self.eco_index.updated(self, catalog, touched, catalog.eco_eligible)
+        # Frontiers of scopes no changed row was or is in still hold
+        stale = {('all', 0)}
+        for snapshot in (self, catalog):
+            in_range = touched[touched < len(snapshot)]
+            stale.update(('category', int(i)) for i in np.unique(snapshot.category_id[in_range]))
+            stale.update(('subcategory', int(i)) for i in np.unique(snapshot.subcategory_id[in_range]))
+        catalog._frontiers = {scope: positions for scope, positions in self._frontiers.items() if scope not in stale}
+        return catalog
+
+    def positions_of(self, rowids):
+        """Positions of the live rows among `rowids`; rows this snapshot has not seen are dropped"""
+        positions = np.searchsorted(self.rowid, rowids)
+        known = positions < len(self)
+        known[known] = self.rowid[positions[known]] == rowids[known]
+        positions = positions[known]
+        return positions[self.alive[positions]]
+
+    def facet_index(self, category_id=None, subcategory_id=None):
+        """FacetIndex of a recommend scope, built on first use and kept for the life of the snapshot"""
+        scope = TierIndex.scope_for(category_id, subcategory_id)
+        index = self._facet_indexes.get(scope)
+        if index is None:
+            lists = [self.index.lists[key] for key in self.index.scope_keys.get(scope, ())]
+            index = self._facet_indexes[scope] = FacetIndex.build(
+                self, np.concatenate(lists) if lists else np.empty(0, dtype=np.int64))
+        return index
+
+    def frontier(self, category_id=None, subcategory_id=None):
+        """Positions on a recommend scope's Pareto frontier, cheapest first, computed on first use"""
+        scope = TierIndex.scope_for(category_id, subcategory_id)
+        positions = self._frontiers.get(scope)
+        if positions is None:
+            positions = self.select(category_id, subcategory_id, np.inf)
+            positions = self._frontiers[scope] = positions[skyline(
+                self.price[positions], self.annual_kwh[positions], self.energy_tier[positions])]
+        return positions
+
+    def matches(self, positions, category_id=None, subcategory_id=None, budget=50000):
+        """Mask of the given positions that pass the recommend filters"""
+        mask = self.alive[positions] & (self.price[positions] <= budget)
+        if subcategory_id:
+            mask &= self.subcategory_id[positions] == int(subcategory_id)
+        elif category_id:
+            mask &= self.category_id[positions] == int(category_id)
+        return mask
 
-        # Base query with proper filtering logic
-        query = '''
-        SELECT a.*, c.name as category_name, s.name as subcategory_name 
-        FROM appliances a
-        JOIN categories c ON a.category_id = c.id
-        JOIN subcategories s ON a.subcategory_id = s.id
-        WHERE a.price <= ?
-        '''
-        params = [budget]
-
-        # Add filters if provided
+    def select(self, category_id=None, subcategory_id=None, budget=50000):
+        """Positions of the appliances matching the recommend filters"""
+        mask = self.alive & (self.price <= budget)
         if subcategory_id:
             # If subcategory is specified, only filter by that
-            query += ' AND a.subcategory_id = ?'
-            params.append(subcategory_id)
+            mask &= self.subcategory_id == int(subcategory_id)
         elif category_id:
-            # If only category is specified, filter by category
-            query += ' AND a.category_id = ?'
-            params.append(category_id)
-
-        # Execute query
-        cursor.execute(query, params)
-        products = []
-        for row in cursor.fetchall():
+            mask &= self.category_id == int(category_id)
+        return np.flatnonzero(mask)
+
+    def score(self, positions, budget, eco_priority):
+        price_score = 1 - np.minimum(self.price[positions] / budget, 1)
+        return (self.energy_score[positions] * eco_priority) + (price_score * (1 - eco_priority))
+
+    def rank(self, positions, budget, eco_priority, limit=None, after=None):
+        """Order positions by score (highest first), ties broken by table order"""
+        scores = self.score(positions, budget, eco_priority)
+        if after is not None:
+            score, rowid = after
+            below = (scores < score) | ((scores == score) & (self.rowid[positions] > rowid))
+            positions, scores = positions[below], scores[below]
+        if limit is not None and len(positions) > limit:
+            # Keep everything scoring at least the K-th best so ties stay exact
+            kth = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            keep = scores >= kth
+            positions, scores = positions[keep], scores[keep]
+        order = np.lexsort((self.rowid[positions], -scores))
+        if limit is not None:
+            order = order[:limit]
+        return positions[order], scores[order]
+
+    def rank_many(self, positions, budgets, eco_priorities, limit):
+        """rank() of `positions` for many (budget, eco priority) pairs, scored as one matrix
+
+        Entry i equals rank(positions[price <= budgets[i]], budgets[i],
+        eco_priorities[i], limit); profiles are scored in row blocks so the
+        matrix stays within BATCH_SCORE_CELLS.
+        """
+        price, energy_score, rowid = self.price[positions], self.energy_score[positions], self.rowid[positions]
+        step = max(1, BATCH_SCORE_CELLS // max(len(positions), 1))
+        results = []
+        for start in range(0, len(budgets), step):
+            budget = np.asarray(budgets[start:start + step], dtype=np.float64)[:, None]
+            eco_priority = np.asarray(eco_priorities[start:start + step], dtype=np.float64)[:, None]
+            price_score = 1 - np.minimum(price / budget, 1)
+            scores = (energy_score * eco_priority) + (price_score * (1 - eco_priority))
+            keep = price <= budget
+            if len(positions) > limit:
+                # Per row, keep everything scoring at least the K-th best so ties stay exact
+                masked = np.where(keep, scores, -np.inf)
+                kth = np.partition(masked, len(positions) - limit, axis=1)[:, len(positions) - limit]
+                keep &= masked >= kth[:, None]
+            for row in range(len(budget)):
+                selected = np.flatnonzero(keep[row])
+                order = selected[np.lexsort((rowid[selected], -scores[row, selected]))[:limit]]
+                results.append((positions[order], scores[row, order]))
+        return results
+
+    def top(self, category_id, subcategory_id, budget, eco_priority, limit, eco_only=False, after=None):
+        """Top-`limit` matches, from the tier index when the score is monotonic in price"""
+        if eco_priority < 1 and budget > 0:
+            index = self.eco_index if eco_only else self.index
+            return index.top(*TierIndex.scope_for(category_id, subcategory_id),
+                             budget, eco_priority, limit, after)
+
+        positions = self.select(category_id, subcategory_id, budget)
+        if eco_only:
+            positions = positions[self.eco_eligible[positions]]
+        return self.rank(positions, budget, eco_priority, limit, after)
+
+
+@contextmanager
+def _read_transaction(db):
+    """Run several reads against one consistent database snapshot"""
+    db.execute('BEGIN')
+    try:
+        yield
+    finally:
+        db.rollback()
+
+
+def ingest_pending(db):
+    """Parse the typed columns of appliances written since the last check; True if there were any
+
+    Pool connections are read-only, so the rows are updated through a
+    short-lived writable connection.
+    """
+    if not db.execute(PENDING_INGEST_QUERY).fetchone()[0]:
+        return False
+    try:
+        with closing(sqlite3.connect(DB_PATH, timeout=30)) as writer, writer:
+            ingest_appliances(writer.cursor())
+    except sqlite3.OperationalError as e:
+        app.logger.warning('cannot ingest new appliances: %s', e)
+        return False
+    return True
+
+
+_catalog = None
+_catalog_db = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """Current catalog snapshot, refreshed only when another connection wrote to the db"""
+    global _catalog, _catalog_db
+    with stage('snapshot'), _catalog_lock:
+        if _catalog_db is None:
+            _catalog_db = db_pool.connect()
+        data_version = _catalog_db.execute('PRAGMA data_version').fetchone()[0]
+        if (_catalog is None or _catalog.data_version != data_version) and ingest_pending(_catalog_db):
+            # The ingest committed through another connection, so the version moved on
+            data_version = _catalog_db.execute('PRAGMA data_version').fetchone()[0]
+        if _catalog is None:
+            _catalog = CatalogSnapshot.load(_catalog_db, data_version)
+        elif _catalog.data_version != data_version:
+            _catalog = _catalog.refreshed(_catalog_db, data_version)
+        return _catalog
+
+
+PRODUCTS_QUERY = '''
+SELECT a.rowid, a.id, a.name, a.brand, a.price, a.energy_rating, a.annual_consumption,
+       a.features_json, a.image_url, a.category_id, a.subcategory_id, a.energy_tier, a.annual_kwh,
+       c.name as category_name, s.name as subcategory_name
+FROM appliances a
+JOIN categories c ON a.category_id = c.id
+JOIN subcategories s ON a.subcategory_id = s.id
+WHERE a.rowid IN (SELECT value FROM json_each(?))
+'''
+
+
+def fetch_product_rows(catalog, positions):
+    """rowid -> PRODUCTS_QUERY row for the given snapshot positions, in one query"""
+    rowids = np.unique(catalog.rowid[positions]).tolist()
+    if not rowids:
+        return {}
+    with db_pool.connection() as db, stage('query'):
+        return {row[0]: row[1:] for row in db.execute(PRODUCTS_QUERY, (json.dumps(rowids),))}
+
+
+def load_products(catalog, positions, scores, rows=None):
+    """Fetch the full rows for the given snapshot positions, keeping their order
+
+    Pass `rows` from fetch_product_rows to share one query across many lists.
+    Rows deleted (or unlisted) since the snapshot was taken are skipped.
+    """
+    rowids = catalog.rowid[positions].tolist()
+    if not rowids:
+        return []
+    if rows is None:
+        rows = fetch_product_rows(catalog, positions)
+
+    products = []
+    with stage('decode'):
+        for rowid, score in zip(rowids, scores.tolist()):
+            row = rows.get(rowid)
+            if row is None:
+                continue
             products.append({
                 "id": row[0],
                 "name": row[1],
@@ -942,105 +1328,1958 @@ def recommend_appliances(category_id=None, subcategory_id=None, budget=50000, ec
                 "price": row[3],
                 "energy_rating": row[4],
                 "annual_consumption": row[5],
-                "features": eval(row[6]),
+                "features": json.loads(row[6] or '[]'),
                 "image_url": row[7],
                 "category_id": row[8],
                 "subcategory_id": row[9],
-                "category_name": row[10],
-                "subcategory_name": row[11]
+                "energy_tier": row[10],
+                "annual_kwh": row[11],
+                "category_name": row[12],
+                "subcategory_name": row[13],
+                "score": score
             })
+            products[-1]["image_url"] = hashed_image_url(row[7])
+            products[-1]["image_srcset"], products[-1]["image_webp_srcset"] = image_srcsets(row[7])
+    return products
+
+
+# Facets
+# Upper bounds of the price bands counted for the filter sidebar; one more band covers the rest
+PRICE_BANDS = (5000, 10000, 20000, 30000, 50000, 100000)
+
+FacetFilters = collections.namedtuple('FacetFilters', 'brands min_energy_tier min_price features')
+NO_FACET_FILTERS = FacetFilters((), None, None, ())
+
+
+def _feature_phrase(keyword):
+    return ' '.join(re.findall(r'\w+(?:[.\-]\w+)*', str(keyword).lower()))
+
+
+def parse_facet_filters(preferences):
+    """FacetFilters from a recommend request body; ValueError on values of the wrong type"""
+    brands = preferences.get('brands') or ()
+    features = preferences.get('features') or ()
+    min_energy_tier = preferences.get('min_energy_tier')
+    min_price = preferences.get('min_price')
+    if isinstance(brands, str):
+        brands = [brands]
+    if isinstance(features, str):
+        features = features.split(',')
+    return FacetFilters(
+        tuple(sorted({str(brand) for brand in brands})),
+        int(min_energy_tier) if min_energy_tier not in (None, '') else None,
+        float(min_price) if min_price not in (None, '') else None,
+        tuple(sorted({_feature_phrase(keyword) for keyword in features} - {''})))
+
+
+def feature_positions(catalog, features):
+    """Snapshot positions whose features contain every keyword, from the full-text index's posting lists"""
+    match = 'features_json : ({})'.format(' AND '.join(f'"{phrase}"' for phrase in features))
+    with db_pool.connection() as db, stage('query'):
+        rowids = db.execute(SEARCH_MATCHES_QUERY, (match,)).fetchall()
+    return catalog.positions_of(np.array(rowids, dtype=np.int64).reshape(-1))
+
+
+class FacetIndex(TierIndex):
+    """Price-sorted positions per (brand code, energy tier) within one recommend scope
+
+    These posting lists answer the brand, tier and price filters by picking
+    lists and cutting them at the price range, so every facet count is a
+    pair of binary searches per list rather than a pass over the scope.
+    Keys end in the lists' energy score, so the picked lists rank with the
+    same k-way merge as the tier index.
+    """
+
+    @classmethod
+    def build(cls, catalog, positions):
+        brand, tier = catalog.brand_code[positions], catalog.energy_tier[positions]
+        order = np.lexsort((catalog.rowid[positions], catalog.price[positions], tier, brand))
+        brand, tier, positions = brand[order], tier[order], positions[order]
+        breaks = np.flatnonzero((brand[1:] != brand[:-1]) | (tier[1:] != tier[:-1])) + 1
+        lists = {}
+        for start, end in zip(np.r_[0, breaks], np.r_[breaks, len(positions)]):
+            if end > start:
+                lists[(int(brand[start]), int(tier[start]), float(catalog.energy_score[positions[start]]))] = \
+                    positions[start:end]
+        return cls(lists)._attach(catalog, lists)
+
+    def apply(self, low, high, brands=None, min_energy_tier=None, matching=None):
+        """FacetSelection of the rows passing every filter, and each facet's counts under the other filters
+
+        `brands` is a set of brand codes and `matching` a boolean mask over
+        the catalog (the feature filter); None means no filter.
+        """
+        brand_counts = collections.Counter()
+        tier_counts = collections.Counter()
+        band_counts = np.zeros(len(PRICE_BANDS) + 1, dtype=np.int64)
+        keys = []
+        slices = []
+        for key, prices in self.prices.items():
+            brand, tier, _ = key
+            brand_ok = brands is None or brand in brands
+            tier_ok = min_energy_tier is None or tier >= min_energy_tier
+            if not (brand_ok or tier_ok):
+                continue
+            positions = self.lists[key]
+            in_range = positions[np.searchsorted(prices, low, side='left'):np.searchsorted(prices, high, side='right')]
+            if matching is not None:
+                in_range = in_range[matching[in_range]]
+            if tier_ok:
+                brand_counts[brand] += len(in_range)
+            if brand_ok:
+                tier_counts[tier] += len(in_range)
+            if brand_ok and tier_ok:
+                # Price bands are counted over every price, not just the filtered range
+                if matching is None:
+                    band_counts += np.diff(np.searchsorted(prices, PRICE_BANDS, side='right'), prepend=0,
+                                           append=len(prices))
+                else:
+                    band_counts += np.bincount(np.searchsorted(PRICE_BANDS, prices[matching[positions]]),
+                                               minlength=len(PRICE_BANDS) + 1)
+                keys.append(key)
+                slices.append(in_range)
+        selection = FacetSelection(self, keys, slices, low, exact_lists=matching is None)
+        return selection, brand_counts, tier_counts, band_counts
+
+
+class FacetSelection:
+    """The rows a facet filter set lets through, ranked like CatalogSnapshot.top"""
+
+    def __init__(self, index, keys, slices, low, exact_lists):
+        self.index = index
+        self.keys = keys
+        self.slices = slices
+        self.low = low
+        # Without a feature filter every row of the picked lists within the price range passes
+        self.exact_lists = exact_lists
+        self._positions = None
+
+    @property
+    def positions(self):
+        if self._positions is None:
+            self._positions = np.concatenate(self.slices) if self.slices else np.empty(0, dtype=np.int64)
+        return self._positions
+
+    def top(self, catalog, budget, eco_priority, limit, eco_only=False, after=None):
+        if self.exact_lists and not eco_only and eco_priority < 1 and budget > 0:
+            return self.index.merge(self.keys, budget, eco_priority, limit, after, self.low)
+        positions = self.positions
+        if eco_only:
+            positions = positions[catalog.eco_eligible[positions]]
+        return catalog.rank(positions, budget, eco_priority, limit, after)
+
+
+def apply_facets(catalog, category_id, subcategory_id, budget, filters):
+    """FacetSelection of the scope under the filters, and facet counts for the filter sidebar
+
+    A facet is counted under every filter except its own, so a sidebar can
+    show what picking another brand, tier or price band would return.
+    """
+    brands = None
+    if filters.brands:
+        brands = {code for code, name in enumerate(catalog.brands) if name in filters.brands}
+    matching = None
+    if filters.features:
+        matching = np.zeros(len(catalog), dtype=bool)
+        matching[feature_positions(catalog, filters.features)] = True
+    low = -np.inf if filters.min_price is None else filters.min_price
+    selection, brand_counts, tier_counts, band_counts = catalog.facet_index(category_id, subcategory_id).apply(
+        low, budget, brands, filters.min_energy_tier, matching)
+
+    facets = {
+        "brands": sorted(({"brand": name, "count": brand_counts[code]} for code, name in enumerate(catalog.brands)
+                          if brand_counts[code] or name in filters.brands),
+                         key=lambda item: (-item["count"], item["brand"])),
+        "energy_tiers": [{"tier": tier, "count": count} for tier, count in sorted(tier_counts.items(), reverse=True)
+                         if count],
+        "price_bands": [{"min": low, "max": high, "count": int(count)} for low, high, count
+                        in zip((0,) + PRICE_BANDS, PRICE_BANDS + (None,), band_counts)]
+    }
+    return selection, facets
 
-        # Score products
-        for product in products:
-            rating = product['energy_rating']
-            if '5 Star' in rating:
-                energy_score = 5
-            elif '4 Star' in rating:
-                energy_score = 4
-            elif '3 Star' in rating:
-                energy_score = 3
-            elif 'NA' in rating:
-                energy_score = 2  # Default score for NA ratings
-            else:
-                energy_score = 1
 
-            price_score = 1 - min(product['price'] / budget, 1)
-            product['score'] = (energy_score * eco_priority) + (price_score * (1 - eco_priority))
+# Pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+MAX_BATCH_PROFILES = int(os.environ.get('MAX_BATCH_PROFILES', 1000))
 
-        products.sort(key=lambda x: x['score'], reverse=True)
 
-        # Eco picks include highly efficient appliances or those with low consumption
-        eco_picks = [
-            p for p in products
-            if ('5 Star' in p['energy_rating'] or
-               (p.get('annual_consumption') and
-                float(p['annual_consumption'].replace(' kWh', '')) < 200))
-        ][:3]
-
-        return {
-            "recommendations": products[:50],
-            "eco_picks": eco_picks
+def _query_digest(category_id, subcategory_id, budget, eco_priority, filters=NO_FACET_FILTERS):
+    query = [TierIndex.scope_for(category_id, subcategory_id), budget, eco_priority]
+    if filters != NO_FACET_FILTERS:
+        query.append(filters)
+    return hashlib.sha1(json.dumps(query).encode()).hexdigest()[:8]
+
+
+def encode_cursor(score, rowid, query):
+    """Opaque cursor holding the last (score, rowid) of a page and the query it belongs to"""
+    payload = json.dumps({"s": score, "r": rowid, "q": query}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, query):
+    """(score, rowid) from a cursor; ValueError if it is malformed or from another query"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        after = float(payload["s"]), int(payload["r"])
+        matches = payload["q"] == query
+    except (ValueError, TypeError, KeyError):
+        raise ValueError('malformed cursor')
+    if not matches:
+        raise ValueError('cursor belongs to a different query')
+    return after
+
+
+# Recommendation algorithm
+# Largest profiles x candidates score matrix a batch builds at once (float64 cells)
+BATCH_SCORE_CELLS = int(os.environ.get('BATCH_SCORE_CELLS', 4_000_000))
+ECO_PICKS = 3
+
+
+def _page(catalog, top, top_scores, limit, query):
+    """Cut a limit+1 ranking to one page and the cursor for the page after it"""
+    next_cursor = None
+    if len(top) > limit:
+        top, top_scores = top[:limit], top_scores[:limit]
+        next_cursor = encode_cursor(float(top_scores[-1]), int(catalog.rowid[top[-1]]), query)
+    return top, top_scores, next_cursor
+
+
+def recommend_appliances(category_id=None, subcategory_id=None, budget=50000, eco_priority=0.5,
+                         limit=DEFAULT_PAGE_SIZE, cursor=None, filters=NO_FACET_FILTERS):
+    """AI recommendation engine using the in-memory catalog snapshot
+
+    Returns one page of the ranking plus a `next_cursor` for the page after
+    it (None on the last page). Eco picks and facet counts only come with
+    the first page.
+    """
+    catalog = get_catalog()
+    query = _query_digest(category_id, subcategory_id, budget, eco_priority, filters)
+    after = decode_cursor(cursor, query) if cursor else None
+
+    facets = None
+    if after is None or filters != NO_FACET_FILTERS:
+        with stage('facets'):
+            selection, facets = apply_facets(catalog, category_id, subcategory_id, budget, filters)
+    if filters == NO_FACET_FILTERS:
+        def top(limit, eco_only=False):
+            return catalog.top(category_id, subcategory_id, budget, eco_priority, limit, eco_only, after)
+    else:
+        def top(limit, eco_only=False):
+            return selection.top(catalog, budget, eco_priority, limit, eco_only, after)
+
+    # One extra item tells us whether another page exists
+    with stage('rank'):
+        top_positions, top_scores = top(limit + 1)
+    top_positions, top_scores, next_cursor = _page(catalog, top_positions, top_scores, limit, query)
+
+    eco_picks = []
+    if after is None:
+        with stage('rank'):
+            eco_top, eco_scores = top(ECO_PICKS, eco_only=True)
+        eco_picks = load_products(catalog, eco_top, eco_scores)
+
+    return {
+        "recommendations": load_products(catalog, top_positions, top_scores),
+        "eco_picks": eco_picks,
+        "facets": facets if after is None else None,
+        "next_cursor": next_cursor
+    }
+
+
+def recommend_many(profiles, limit=DEFAULT_PAGE_SIZE):
+    """First page of recommend_appliances for each (category_id, subcategory_id, budget, eco_priority)
+
+    Profiles sharing a filter are scored together: the filter's candidates
+    are selected once and every profile is ranked against them in one
+    vectorized pass, and all result rows are hydrated with a single query.
+    """
+    if not profiles:
+        return []
+    catalog = get_catalog()
+    ranked = [None] * len(profiles)
+    groups = {}
+    for i, (category_id, subcategory_id, budget, eco_priority) in enumerate(profiles):
+        if budget > 0:
+            groups.setdefault(TierIndex.scope_for(category_id, subcategory_id), []).append(i)
+        else:
+            # Degenerate budgets keep recommend_appliances' exact (nan-producing) arithmetic
+            ranked[i] = (catalog.top(category_id, subcategory_id, budget, eco_priority, limit + 1),
+                         catalog.top(category_id, subcategory_id, budget, eco_priority, ECO_PICKS,
+                                     eco_only=True))
+
+    for members in groups.values():
+        category_id, subcategory_id = profiles[members[0]][:2]
+        budgets = [profiles[i][2] for i in members]
+        eco_priorities = [profiles[i][3] for i in members]
+        positions = catalog.select(category_id, subcategory_id, max(budgets))
+        eco_positions = positions[catalog.eco_eligible[positions]]
+        with stage('rank'):
+            tops = catalog.rank_many(positions, budgets, eco_priorities, limit + 1)
+            eco_tops = catalog.rank_many(eco_positions, budgets, eco_priorities, ECO_PICKS)
+        for i, top, eco_top in zip(members, tops, eco_tops):
+            ranked[i] = top, eco_top
+
+    pages = []
+    for (category_id, subcategory_id, budget, eco_priority), ((top, top_scores), eco_top) in zip(profiles, ranked):
+        query = _query_digest(category_id, subcategory_id, budget, eco_priority)
+        pages.append((_page(catalog, top, top_scores, limit, query), eco_top))
+
+    rows = fetch_product_rows(catalog, np.concatenate(
+        [positions for (top, _, _), (eco_top, _) in pages for positions in (top, eco_top)]))
+    return [{
+        "recommendations": load_products(catalog, top, top_scores, rows),
+        "eco_picks": load_products(catalog, *eco_top, rows),
+        "next_cursor": next_cursor
+    } for (top, top_scores, next_cursor), eco_top in pages]
+
+
+# Pareto frontier
+# Most points /api/pareto returns; longer frontiers are thinned evenly along the price axis
+MAX_PARETO_POINTS = int(os.environ.get('MAX_PARETO_POINTS', 500))
+
+
+def skyline(price, annual_kwh, energy_tier):
+    """Indexes of the rows no other row beats on price, annual kWh and energy tier, cheapest first
+
+    A row is dominated by one no dearer, using no more energy and rated no
+    lower that differs somewhere. In price order only earlier rows can
+    dominate, and with a handful of tiers a running minimum of kWh per tier
+    threshold finds them in one pass, so the sort dominates: O(n log n).
+    Unknown consumption counts as the worst.
+    """
+    if not len(price):
+        return np.empty(0, dtype=np.int64)
+    # Finite, so no row compares equal to the sweep's starting infinity
+    kwh = np.where(np.isnan(annual_kwh), np.finfo(np.float64).max, annual_kwh)
+    order = np.lexsort((-energy_tier, kwh, price))
+    price, kwh, tier = price[order], kwh[order], energy_tier[order]
+    # Identical rows never dominate each other, so the sweep runs over distinct ones
+    first = np.r_[True, (price[1:] != price[:-1]) | (kwh[1:] != kwh[:-1]) | (tier[1:] != tier[:-1])]
+    group = np.cumsum(first) - 1
+    kwh, tier = kwh[first], tier[first]
+    dominated = np.zeros(len(kwh), dtype=bool)
+    for level in np.unique(tier).tolist():
+        # Least kWh among the earlier rows rated at least `level`
+        best = np.r_[np.inf, np.minimum.accumulate(np.where(tier >= level, kwh, np.inf))[:-1]]
+        rows = tier == level
+        dominated[rows] = best[rows] <= kwh[rows]
+    return order[~dominated[group]]
+
+
+def pareto_frontier(category_id=None, subcategory_id=None, budget=50000, limit=MAX_PARETO_POINTS):
+    """Non-dominated appliances of a scope under the budget, cheapest first
+
+    Dominance only ever compares a row with cheaper ones, so the frontier
+    under a budget is the scope's cached frontier cut at that price.
+    """
+    catalog = get_catalog()
+    with stage('pareto'):
+        positions = catalog.frontier(category_id, subcategory_id)
+        positions = positions[:np.searchsorted(catalog.price[positions], budget, side='right')]
+    size = len(positions)
+    if size > limit:
+        positions = positions[np.linspace(0, size - 1, limit).round().astype(np.int64)]
+    rows = fetch_product_rows(catalog, positions)
+    points = []
+    for rowid in catalog.rowid[positions].tolist():
+        row = rows.get(rowid)
+        if row is None:
+            # Deleted, or no longer listed, since the snapshot was taken
+            continue
+        points.append({
+            "id": row[0],
+            "name": row[1],
+            "brand": row[2],
+            "price": row[3],
+            "energy_rating": row[4],
+            "energy_tier": row[10],
+            "annual_kwh": row[11],
+            "subcategory_name": row[13]
+        })
+    return {"frontier": points, "frontier_size": size}
+
+
+# Full-text search
+# Share of the blended search score that comes from text relevance; the rest is the eco score
+SEARCH_TEXT_WEIGHT = float(os.environ.get('SEARCH_TEXT_WEIGHT', 0.6))
+# bm25 weights of the name, brand and features columns
+SEARCH_COLUMN_WEIGHTS = (4.0, 2.0, 1.0)
+# Match sets up to this size are ranked by BM25; scoring costs ~1.5us per matching row at 1M rows
+SEARCH_RANKED_MATCHES = int(os.environ.get('SEARCH_RANKED_MATCHES', 2000))
+MAX_SEARCH_TERMS = 8
+
+SEARCH_MATCHES_QUERY = 'SELECT rowid FROM appliances_fts WHERE appliances_fts MATCH ?'
+SEARCH_RANKED_QUERY = f'''
+SELECT rowid, bm25(appliances_fts, {", ".join(map(str, SEARCH_COLUMN_WEIGHTS))})
+FROM appliances_fts
+WHERE appliances_fts MATCH ?
+'''
+
+
+def fts_query(text, any_term=False):
+    """FTS5 MATCH expression for every term (or any, with `any_term`), the last one as a prefix
+
+    Terms are quoted so user input can never be read as query syntax;
+    '1.5' stays one term and FTS matches it as the phrase '1 5'.
+    """
+    terms = re.findall(r'\w+(?:[.\-]\w+)*', text.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return (' OR ' if any_term else ' ').join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+
+
+def _best(catalog, positions, scores, candidates, limit):
+    """Top-`limit` of the candidate indexes by score, ties broken by table order"""
+    if len(candidates) > limit:
+        # Keep everything scoring at least the K-th best so ties stay exact
+        kth = np.partition(scores[candidates], len(candidates) - limit)[len(candidates) - limit]
+        candidates = candidates[scores[candidates] >= kth]
+    return candidates[np.lexsort((catalog.rowid[positions[candidates]], -scores[candidates]))][:limit]
+
+
+def search_appliances(text, category_id=None, subcategory_id=None, budget=50000, eco_priority=0.5,
+                      limit=DEFAULT_PAGE_SIZE):
+    """Text matches within the recommend filters, ranked by BM25 blended with the eco score
+
+    Both halves are scaled to [0, 1]: relevance against the best match, the
+    eco score against the highest score possible at this eco priority.
+    Matching rowids alone are cheap to list, BM25 is not, so a broad query
+    (more than SEARCH_RANKED_MATCHES rows, e.g. a bare brand name) counts
+    every match as equally relevant and is ordered by its eco score.
+    """
+    match = fts_query(text)
+    if match is None:
+        return {"recommendations": [], "eco_picks": [], "next_cursor": None}
+    catalog = get_catalog()
+    with db_pool.connection() as db, stage('query'):
+        rowids = np.array(db.execute(SEARCH_MATCHES_QUERY, (match,)).fetchall(), dtype=np.int64).reshape(-1)
+        if not len(rowids):
+            # Nothing has every term: rank partial matches, where BM25 favours rows matching more of them
+            match = fts_query(text, any_term=True)
+            rowids = np.array(db.execute(SEARCH_MATCHES_QUERY, (match,)).fetchall(), dtype=np.int64).reshape(-1)
+        relevance = np.ones(len(rowids))
+        if len(rowids) <= SEARCH_RANKED_MATCHES:
+            ranked = np.array(db.execute(SEARCH_RANKED_QUERY, (match,)).fetchall(), dtype=np.float64).reshape(-1, 2)
+            rowids, relevance = ranked[:, 0].astype(np.int64), -ranked[:, 1]
+
+    with stage('rank'):
+        # The index commits with the table, so it can be ahead of this snapshot
+        positions = np.searchsorted(catalog.rowid, rowids)
+        known = positions < len(catalog)
+        known[known] = catalog.rowid[positions[known]] == rowids[known]
+        positions, relevance = positions[known], relevance[known]
+        keep = catalog.matches(positions, category_id, subcategory_id, budget)
+        positions, relevance = positions[keep], relevance[keep]
+
+        best_score = max(ENERGY_SCORES.values()) * eco_priority + (1 - eco_priority)
+        scores = (SEARCH_TEXT_WEIGHT * relevance / max(relevance.max(initial=0), 1e-9)
+                  + (1 - SEARCH_TEXT_WEIGHT) * catalog.score(positions, budget, eco_priority) / best_score)
+        order = _best(catalog, positions, scores, np.arange(len(positions)), limit)
+        eco_order = _best(catalog, positions, scores, np.flatnonzero(catalog.eco_eligible[positions]), ECO_PICKS)
+
+    rows = fetch_product_rows(catalog, np.concatenate([positions[order], positions[eco_order]]))
+    return {
+        "recommendations": load_products(catalog, positions[order], scores[order], rows),
+        "eco_picks": load_products(catalog, positions[eco_order], scores[eco_order], rows),
+        "next_cursor": None
+    }
+
+
+# Autocomplete
+SUGGEST_LIMIT = 8
+MAX_SUGGEST_LIMIT = 20
+# Prefix ranges up to this many entries are ranked on the fly; longer ones keep their top entries
+SUGGEST_LEAF_SIZE = 64
+# Least trigram (Dice) similarity at which an unknown word is corrected to a known one
+SUGGEST_MIN_SIMILARITY = 0.45
+# A rebuild reads every distinct name, so writes in quick succession share one
+SUGGEST_MIN_REBUILD_SECONDS = float(os.environ.get('SUGGEST_MIN_REBUILD_SECONDS', 30))
+
+SUGGEST_NAMES_QUERY = 'SELECT brand, name FROM appliances'
+SUGGEST_SUBCATEGORIES_QUERY = 'SELECT id, category_id, name FROM subcategories'
+
+
+def _suggest_key(text):
+    return ' '.join(text.lower().split())
+
+
+def _trigrams(word, complete=True):
+    """Padded trigrams; a word still being typed gets no end padding"""
+    padded = f'  {word} ' if complete else f'  {word}'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SuggestIndex:
+    """Brand, model and subcategory completions for the search box
+
+    Entries are kept sorted by lowercased text, so a prefix is a bisected
+    range. The prefix trie over that array is cut off at SUGGEST_LEAF_SIZE:
+    every prefix with a longer range has its best entries precomputed, and
+    shorter ranges are ranked when asked. Misspelt words are corrected
+    against the catalog's word list through a trigram index.
+    """
+
+    def __init__(self, appliances, subcategories, subcategory_counts, data_version=None):
+        """`appliances` are (brand, name) rows, `subcategories` (id, category_id, name) rows"""
+        self.data_version = data_version
+        self.built = time.monotonic()
+        brands = collections.Counter(brand for brand, _ in appliances)
+        names = collections.Counter(name for _, name in appliances)
+        entries = [(text, 'brand', count, None, None) for text, count in brands.items()]
+        entries += [(text, 'model', count, None, None) for text, count in names.items()]
+        entries += [(name, 'subcategory', int(subcategory_counts.get(subcategory_id, 0)), subcategory_id, category_id)
+                    for subcategory_id, category_id, name in subcategories]
+        entries = [entry for entry in entries if entry[0]]
+        keys = [_suggest_key(entry[0]) for entry in entries]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.entries = [entries[i] for i in order]
+
+        # Global order: most appliances first, then shortest, then alphabetical (the array order)
+        counts = np.array([entry[2] for entry in self.entries], dtype=np.int64)
+        lengths = np.array([len(key) for key in self.keys], dtype=np.int64)
+        self.rank = np.empty(len(self.keys), dtype=np.int64)
+        self.rank[np.lexsort((np.arange(len(self.keys)), lengths, -counts))] = np.arange(len(self.keys))
+        self.top = {}
+        self._build_trie('', 0, len(self.keys))
+
+        # How many entries use each word; breaks ties between equally close corrections
+        self.word_counts = collections.Counter(itertools.chain.from_iterable(map(str.split, self.keys)))
+        self.words = sorted(self.word_counts)
+        self.word_trigrams = {}
+        for word in self.words:
+            if len(word) >= 3 and word.isalpha():
+                for trigram in _trigrams(word):
+                    self.word_trigrams.setdefault(trigram, []).append(word)
+
+    def _ranked(self, lo, hi, limit):
+        ranks = self.rank[lo:hi]
+        if hi - lo > limit:
+            best = np.argpartition(ranks, limit)[:limit]
+        else:
+            best = np.arange(hi - lo)
+        return (best[np.argsort(ranks[best])] + lo).tolist()
+
+    def _build_trie(self, prefix, lo, hi):
+        stack = [(prefix, lo, hi)]
+        while stack:
+            prefix, lo, hi = stack.pop()
+            if hi - lo <= SUGGEST_LEAF_SIZE:
+                continue
+            self.top[prefix] = self._ranked(lo, hi, MAX_SUGGEST_LIMIT)
+            depth = len(prefix)
+            i = lo
+            while i < hi:
+                if len(self.keys[i]) == depth:  # the prefix itself sorts first
+                    i += 1
+                    continue
+                child = prefix + self.keys[i][depth]
+                j = bisect.bisect_left(self.keys, _prefix_end(child), i, hi)
+                stack.append((child, i, j))
+                i = j
+
+    def complete(self, prefix, limit):
+        """Positions of the best `limit` entries starting with `prefix`"""
+        top = self.top.get(prefix)
+        if top is not None:
+            return top[:limit]
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, _prefix_end(prefix), lo)
+        return self._ranked(lo, hi, limit)
+
+    def _known(self, word, complete):
+        if complete:
+            return word in self.word_counts
+        i = bisect.bisect_left(self.words, word)
+        return i < len(self.words) and self.words[i].startswith(word)
+
+    def correct(self, word, complete=True):
+        """Closest known word by trigram Dice similarity, or `word` when nothing is close enough"""
+        if len(word) < 3 or not word.isalpha() or self._known(word, complete):
+            return word
+        trigrams = _trigrams(word, complete)
+        shared = {}
+        for trigram in trigrams:
+            for candidate in self.word_trigrams.get(trigram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        best, best_key = word, (SUGGEST_MIN_SIMILARITY, 0)
+        for candidate, common in shared.items():
+            key = (2 * common / (len(trigrams) + len(_trigrams(candidate))), self.word_counts[candidate])
+            if key > best_key:
+                best, best_key = candidate, key
+        return best
+
+    def suggest(self, text, limit=SUGGEST_LIMIT):
+        """Ranked completions of `text`, then completions of its spelling-corrected form"""
+        query = _suggest_key(text)
+        if not query:
+            return []
+        positions = self.complete(query, limit)
+        suggestions = [self._suggestion(i, corrected=False) for i in positions]
+        if len(suggestions) < limit:
+            words = query.split()
+            # The last word is still being typed unless the text ends in a space
+            corrected = ' '.join([self.correct(word) for word in words[:-1]]
+                                 + [self.correct(words[-1], complete=text[-1:].isspace())])
+            if corrected != query:
+                suggestions += [self._suggestion(i, corrected=True)
+                                for i in self.complete(corrected, limit) if i not in positions]
+        return suggestions[:limit]
+
+    def _suggestion(self, i, corrected):
+        text, kind, count, subcategory_id, category_id = self.entries[i]
+        suggestion = {"text": text, "kind": kind, "count": count, "corrected": corrected}
+        if kind == 'subcategory':
+            suggestion.update(subcategory_id=subcategory_id, category_id=category_id)
+        return suggestion
+
+
+def _prefix_end(prefix):
+    """Smallest string greater than every string starting with `prefix`"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+_suggest_index = None
+_suggest_lock = threading.Lock()
+
+
+def build_suggest_index(catalog):
+    with db_pool.connection() as db:
+        appliances = db.execute(SUGGEST_NAMES_QUERY).fetchall()
+        subcategories = db.execute(SUGGEST_SUBCATEGORIES_QUERY).fetchall()
+    ids, counts = np.unique(catalog.subcategory_id[catalog.alive], return_counts=True)
+    return SuggestIndex(appliances, subcategories, dict(zip(ids.tolist(), counts.tolist())), catalog.data_version)
+
+
+def _rebuild_suggest_index(catalog):
+    global _suggest_index
+    try:
+        _suggest_index = build_suggest_index(catalog)
+    finally:
+        _suggest_lock.release()
+
+
+def get_suggest_index():
+    """Current suggestion index; after a write the old one keeps serving while a thread rebuilds it"""
+    global _suggest_index
+    catalog = get_catalog()
+    index = _suggest_index
+    if index is None:
+        with _suggest_lock:
+            if _suggest_index is None:
+                _suggest_index = build_suggest_index(catalog)
+            return _suggest_index
+    if (index.data_version != catalog.data_version
+            and time.monotonic() - index.built >= SUGGEST_MIN_REBUILD_SECONDS
+            and _suggest_lock.acquire(blocking=False)):
+        threading.Thread(target=_rebuild_suggest_index, args=(catalog,), name='suggest-index', daemon=True).start()
+    return index
+
+
+# Similar appliances
+SIMILAR_LIMIT = 8
+# Neighbors kept per appliance, so also the most a lookup can ask for
+MAX_SIMILAR_LIMIT = 20
+# Subcategories up to this size get every neighbor list computed when their index is built;
+# larger ones compute a list on its first lookup and keep it
+SIMILAR_PRECOMPUTE_ROWS = int(os.environ.get('SIMILAR_PRECOMPUTE_ROWS', 5000))
+# Share of each vector's (squared) length given to the feature tokens; the rest is price, tier and kWh
+SIMILAR_FEATURE_WEIGHT = 0.6
+# Rows scored at once while precomputing; bounds the block x subcategory similarity matrix
+SIMILAR_BLOCK_ROWS = 256
+
+SIMILAR_COLUMNS = 'rowid, subcategory_id, price, energy_tier, annual_kwh, features_json'
+SIMILAR_ROWS_QUERY = f'SELECT {SIMILAR_COLUMNS} FROM appliances WHERE subcategory_id = ?'
+SIMILAR_CHANGED_ROWS_QUERY = f'''
+SELECT {SIMILAR_COLUMNS} FROM appliances
+WHERE rowid IN (SELECT value FROM json_each(?))
+ORDER BY rowid
+'''
+APPLIANCE_SUBCATEGORY_QUERY = 'SELECT rowid, subcategory_id FROM appliances WHERE id = ?'
+
+
+def _feature_tokens(features_json):
+    """Lowercased word counts of an appliance's feature list"""
+    return collections.Counter(re.findall(r'[a-z0-9]+', ' '.join(json.loads(features_json or '[]')).lower()))
+
+
+class NeighborIndex:
+    """Nearest neighbors by cosine similarity within one subcategory
+
+    Each appliance is a TF-IDF vector of its feature tokens joined with the
+    z-scores of its log price, energy tier and log annual kWh, normalized
+    to unit length. Vectors are stored sparse: a fixed-width row of token
+    columns and weights, plus the three numeric values. The neighbor table
+    holds the MAX_SIMILAR_LIMIT closest rows of every filled row, best
+    first, so a lookup is a row read. IDF and z-score statistics are fixed
+    when the index is built; changed rows are patched in with them.
+    """
+
+    def __init__(self, subcategory_id, rows, change_seq, data_version=None):
+        """`rows` are SIMILAR_COLUMNS rows of the subcategory"""
+        self.subcategory_id = subcategory_id
+        self.change_seq = change_seq
+        self.data_version = data_version
+        self.precompute = len(rows) <= SIMILAR_PRECOMPUTE_ROWS
+
+        # Feature lists repeat heavily, so each distinct one is tokenized once
+        lists = collections.Counter(row[5] for row in rows)
+        document_frequency = collections.Counter()
+        for features_json, count in lists.items():
+            for token in _feature_tokens(features_json):
+                document_frequency[token] += count
+        # Column 0 pads the token rows and always has weight 0
+        self.vocabulary = {token: column for column, token in enumerate(document_frequency, 1)}
+        self.idf = np.r_[0, [np.log((1 + len(rows)) / (1 + count)) + 1 for count in document_frequency.values()]]
+        numbers = self._raw_numbers(rows)
+        known = ~np.isnan(numbers)
+        count = np.maximum(known.sum(axis=0), 1)
+        self.mean = np.where(known, numbers, 0).sum(axis=0) / count
+        self.std = np.sqrt((np.where(known, numbers - self.mean, 0) ** 2).sum(axis=0) / count)
+        self.std[self.std == 0] = 1
+
+        self.rowid = np.array([row[0] for row in rows], dtype=np.int64)
+        self.local = {rowid: i for i, rowid in enumerate(self.rowid.tolist())}
+        self.alive = np.ones(len(rows), dtype=bool)
+        self.columns, self.weights, self.numbers = self._vectors([row[5] for row in rows], numbers)
+        self.neighbors = np.full((len(rows), MAX_SIMILAR_LIMIT), -1, dtype=np.int64)
+        self.similarity = np.full((len(rows), MAX_SIMILAR_LIMIT), -np.inf)
+        self.filled = np.zeros(len(rows), dtype=bool)
+        if self.precompute:
+            self._fill(np.arange(len(rows)))
+
+    def __len__(self):
+        return len(self.rowid)
+
+    @staticmethod
+    def _raw_numbers(rows):
+        numbers = np.array([row[2:5] for row in rows], dtype=np.float64).reshape(-1, 3)
+        numbers[:, 0] = np.log1p(np.maximum(numbers[:, 0], 0))
+        numbers[:, 2] = np.log1p(np.maximum(numbers[:, 2], 0))
+        return numbers
+
+    def _vectors(self, features, numbers):
+        """Unit vectors of rows with the given features_json and raw numbers
+
+        Returned as (token columns, token weights, numeric part).
+        """
+        distinct = {}
+        which = np.fromiter((distinct.setdefault(features_json, len(distinct)) for features_json in features),
+                            dtype=np.int64, count=len(features))
+        tokens = [_feature_tokens(features_json) for features_json in distinct]
+        for counts in tokens:
+            for token in counts:
+                if token not in self.vocabulary:
+                    # Unseen when the index was built: weighted as if in no document
+                    self.vocabulary[token] = len(self.idf)
+                    self.idf = np.r_[self.idf, np.log(1 + len(self)) + 1]
+        width = max(1, max(map(len, tokens), default=0))
+        columns = np.zeros((len(tokens), width), dtype=np.int64)
+        weights = np.zeros((len(tokens), width))
+        for i, counts in enumerate(tokens):
+            columns[i, :len(counts)] = [self.vocabulary[token] for token in counts]
+            weights[i, :len(counts)] = list(counts.values())
+        columns, weights = columns[which], weights[which] * self.idf[columns[which]]
+        text_norm = np.linalg.norm(weights, axis=1, keepdims=True)
+        weights = np.divide(weights, text_norm, out=np.zeros_like(weights), where=text_norm > 0)
+        weights *= np.sqrt(SIMILAR_FEATURE_WEIGHT)
+
+        numbers = np.nan_to_num((numbers - self.mean) / self.std) * np.sqrt((1 - SIMILAR_FEATURE_WEIGHT) / 3)
+        norm = np.sqrt((weights ** 2).sum(axis=1) + (numbers ** 2).sum(axis=1))[:, None]
+        norm[norm == 0] = 1
+        return columns, weights / norm, numbers / norm
+
+    def _dense(self, rows):
+        vectors = np.zeros((len(rows), len(self.idf)))
+        np.add.at(vectors, (np.arange(len(rows))[:, None], self.columns[rows]), self.weights[rows])
+        return vectors
+
+    def _scores(self, rows):
+        """(block, similarities of the block to every row) over `rows`; -inf for itself and dead rows"""
+        # Small indexes multiply whole blocks by a dense copy; large ones gather a row at a time
+        dense = self._dense(np.arange(len(self))) if len(rows) > 1 and len(self) <= SIMILAR_PRECOMPUTE_ROWS else None
+        step = SIMILAR_BLOCK_ROWS if dense is not None else 1
+        for start in range(0, len(rows), step):
+            block = rows[start:start + step]
+            if dense is not None:
+                scores = dense[block] @ dense.T
+            else:
+                scores = np.einsum('bnk,nk->bn', self._dense(block)[:, self.columns], self.weights)
+            scores += self.numbers[block] @ self.numbers.T
+            scores[:, ~self.alive] = -np.inf
+            scores[np.arange(len(block)), block] = -np.inf
+            yield block, scores
+
+    def _fill(self, rows):
+        """Compute the neighbor lists of `rows`"""
+        k = min(MAX_SIMILAR_LIMIT, len(self))
+        for block, scores in self._scores(rows):
+            best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for i, row in enumerate(block.tolist()):
+                self._store(row, best[i], scores[i, best[i]])
+        self.filled[rows] = True
+
+    def _store(self, row, candidates, scores):
+        keep = np.isfinite(scores)
+        candidates, scores = candidates[keep], scores[keep]
+        order = np.lexsort((self.rowid[candidates], -scores))[:MAX_SIMILAR_LIMIT]
+        self.neighbors[row] = -1
+        self.similarity[row] = -np.inf
+        self.neighbors[row, :len(order)] = candidates[order]
+        self.similarity[row, :len(order)] = scores[order]
+
+    def similar(self, rowid, limit=SIMILAR_LIMIT):
+        """(rowids, similarities) of the closest appliances to `rowid`, best first"""
+        row = self.local.get(rowid)
+        if row is None or not self.alive[row]:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if not self.filled[row]:
+            self._fill(np.array([row]))
+        neighbors = self.neighbors[row, :limit]
+        neighbors = neighbors[neighbors >= 0]
+        return self.rowid[neighbors], self.similarity[row, :len(neighbors)]
+
+    def update(self, changed, rows, change_seq, data_version):
+        """Patch in the SIMILAR_COLUMNS rows of the `changed` rowids; changed rowids without a row were deleted"""
+        rows = [row for row in rows if row[1] == self.subcategory_id]
+        kept = {row[0] for row in rows}
+        removed = np.array([self.local[rowid] for rowid in changed if rowid in self.local and rowid not in kept],
+                           dtype=np.int64)
+        self.alive[removed] = False
+        self.filled[removed] = False
+
+        appended = [row for row in rows if row[0] not in self.local]
+        if appended:
+            for i, row in enumerate(appended, len(self)):
+                self.local[row[0]] = i
+            self.rowid = np.r_[self.rowid, [row[0] for row in appended]]
+            self.alive = np.r_[self.alive, np.ones(len(appended), dtype=bool)]
+            self.neighbors = np.r_[self.neighbors, np.full((len(appended), MAX_SIMILAR_LIMIT), -1, dtype=np.int64)]
+            self.similarity = np.r_[self.similarity, np.full((len(appended), MAX_SIMILAR_LIMIT), -np.inf)]
+            self.filled = np.r_[self.filled, np.zeros(len(appended), dtype=bool)]
+        positions = np.array([self.local[row[0]] for row in rows], dtype=np.int64)
+        if rows:
+            self.alive[positions] = True
+            columns, weights, numbers = self._vectors([row[5] for row in rows], self._raw_numbers(rows))
+            width = max(columns.shape[1], self.columns.shape[1])
+            self.columns, self.weights = (np.pad(array, ((0, len(self) - len(array)), (0, width - array.shape[1])))
+                                          for array in (self.columns, self.weights))
+            self.numbers = np.pad(self.numbers, ((0, len(self) - len(self.numbers)), (0, 0)))
+            self.columns[positions] = 0
+            self.weights[positions] = 0
+            self.columns[positions, :columns.shape[1]] = columns
+            self.weights[positions, :weights.shape[1]] = weights
+            self.numbers[positions] = numbers
+
+        # Lists that held a changed row may have lost it or seen it move down, so they are recomputed
+        stale = self.filled & np.isin(self.neighbors, np.r_[positions, removed]).any(axis=1)
+        stale[positions] = self.filled[positions] | self.precompute
+        stale &= self.alive
+        self.filled[stale] = False
+        # Every other list can only gain changed rows, each displacing its last entry
+        for block, scores in self._scores(positions):
+            for row in np.flatnonzero(self.filled & (scores >= self.similarity[:, -1]).any(axis=0)).tolist():
+                listed = self.neighbors[row] >= 0
+                self._store(row, np.r_[self.neighbors[row, listed], block],
+                            np.r_[self.similarity[row, listed], scores[:, row]])
+        if self.precompute:
+            self._fill(np.flatnonzero(stale))
+        self.change_seq = change_seq
+        self.data_version = data_version
+
+
+_neighbor_indexes = {}
+_neighbor_lock = threading.Lock()
+
+
+def _neighbor_index(subcategory_id, catalog):
+    """NeighborIndex of a subcategory, built on first use and patched from the change log after writes"""
+    index = _neighbor_indexes.get(subcategory_id)
+    if index is not None and index.data_version == catalog.data_version:
+        return index
+    with db_pool.connection() as db, _read_transaction(db):
+        change_seq = db.execute(CatalogSnapshot.CHANGE_SEQ_QUERY).fetchone()[0]
+        if index is not None and change_seq >= index.change_seq:
+            changed = [row[0] for row in db.execute(CatalogSnapshot.CHANGES_QUERY, (index.change_seq,))]
+            if FULL_RELOAD_MARKER not in changed and len(changed) <= max(1000, len(index) // 10):
+                rows = db.execute(SIMILAR_CHANGED_ROWS_QUERY, (json.dumps(changed),)).fetchall()
+                index.update(changed, rows, change_seq, catalog.data_version)
+                return index
+        rows = db.execute(SIMILAR_ROWS_QUERY, (subcategory_id,)).fetchall()
+    index = _neighbor_indexes[subcategory_id] = NeighborIndex(subcategory_id, rows, change_seq, catalog.data_version)
+    return index
+
+
+def similar_appliances(appliance_id, limit=SIMILAR_LIMIT):
+    """Closest appliances of the same subcategory, or None for an unknown id"""
+    with db_pool.connection() as db, stage('query'):
+        row = db.execute(APPLIANCE_SUBCATEGORY_QUERY, (appliance_id,)).fetchone()
+    if row is None:
+        return None
+    rowid, subcategory_id = row
+    catalog = get_catalog()
+    with stage('similar'), _neighbor_lock:
+        rowids, similarity = _neighbor_index(subcategory_id, catalog).similar(rowid, limit)
+    # Drop neighbors written after this snapshot was taken
+    known = np.isin(rowids, catalog.rowid[catalog.positions_of(rowids)])
+    return load_products(catalog, catalog.positions_of(rowids[known]), similarity[known])
+
+
+# Result cache
+RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 1024))
+RESULT_CACHE_TTL = float(os.environ.get('RESULT_CACHE_TTL', 300))
+# Optional SQLite file shared by every worker on the host
+RESULT_CACHE_DB = os.environ.get('RESULT_CACHE_DB')
+
+# The eco priority slider moves in steps of 0.01
+ECO_PRIORITY_STEPS = 100
+
+
+def quantize_eco_priority(eco_priority):
+    return round(eco_priority * ECO_PRIORITY_STEPS) / ECO_PRIORITY_STEPS
+
+
+def energy_data_version():
+    return hashlib.sha1(json.dumps(ENERGY_DATA, sort_keys=True).encode()).hexdigest()[:12]
+
+
+class ResultCache:
+    """LRU + TTL cache of serialized responses, optionally shared through a SQLite file
+
+    Keys carry the catalog and energy data versions. When either changes the
+    local entries are dropped at once; shared entries simply stop matching and
+    age out.
+    """
+
+    def __init__(self, size=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL, shared_path=RESULT_CACHE_DB):
+        self.size = size
+        self.ttl = ttl
+        self.shared_path = shared_path
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._versions = None
+        self._shared = threading.local()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "shared_hits": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0
         }
 
-# Routes
+    def _shared_db(self):
+        db = getattr(self._shared, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.shared_path, timeout=1, factory=TimedConnection)
+            db.execute('PRAGMA journal_mode = WAL')
+            db.execute('''
+            CREATE TABLE IF NOT EXISTS result_cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires REAL NOT NULL
+            )
+            ''')
+            self._shared.db = db
+        return db
+
+    def _check_versions(self, versions):
+        if versions != self._versions:
+            if self._versions is not None and self._entries:
+                self.stats["invalidations"] += len(self._entries)
+                self._entries.clear()
+            self._versions = versions
+
+    def get(self, key, versions):
+        now = time.monotonic()
+        with self._lock:
+            self._check_versions(versions)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry[1]
+                del self._entries[key]
+                self.stats["expirations"] += 1
+
+        if self.shared_path:
+            row = self._shared_db().execute(
+                'SELECT value, expires FROM result_cache WHERE key = ? AND expires > ?',
+                (json.dumps([key, versions]), time.time())
+            ).fetchone()
+            if row is not None:
+                with self._lock:
+                    self.stats["shared_hits"] += 1
+                    self._store(key, row[0], row[1] - time.time())
+                return row[0]
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def _store(self, key, value, ttl):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def put(self, key, versions, value):
+        with self._lock:
+            self._check_versions(versions)
+            self._store(key, value, self.ttl)
+
+        if self.shared_path:
+            db = self._shared_db()
+            now = time.time()
+            with db:
+                db.execute('INSERT OR REPLACE INTO result_cache (key, value, expires) VALUES (?, ?, ?)',
+                           (json.dumps([key, versions]), value, now + self.ttl))
+                db.execute('DELETE FROM result_cache WHERE expires <= ?', (now,))
+
+    def metrics(self):
+        with self._lock:
+            return {**self.stats, "size": len(self._entries), "capacity": self.size, "ttl": self.ttl}
+
+
+result_cache = ResultCache()
+
+
+# Image derivatives
+IMAGE_DIR = 'appliance_images'
+DERIVED_IMAGE_DIR = os.path.join(IMAGE_DIR, 'derived')
+IMAGE_MANIFEST_PATH = os.path.join(DERIVED_IMAGE_DIR, 'manifest.json')
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+IMAGE_WIDTHS = (240, 480, 720)
+# Bump when the manifest layout changes so the next build starts from scratch
+IMAGE_MANIFEST_FORMAT = 2
+# Pillow format name -> (file extension, save options)
+IMAGE_FORMATS = {
+    'jpeg': ('jpg', {'quality': 80, 'optimize': True, 'progressive': True}),
+    'webp': ('webp', {'quality': 75, 'method': 6}),
+}
+
+
+def build_image_derivatives(source_dir=IMAGE_DIR, widths=IMAGE_WIDTHS, manifest_path=IMAGE_MANIFEST_PATH):
+    """Write fixed-width JPEG and WebP copies of every source image plus a manifest
+
+    Output names carry a content hash, so they can be cached forever. Sources
+    whose hash and widths match the previous manifest are skipped, and
+    derivatives no longer referenced are deleted.
+    """
+    from PIL import Image, ImageOps  # build-time only dependency
+
+    output_dir = os.path.dirname(manifest_path)
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_image_manifest(manifest_path)
+    previous = previous.get('images', {}) if previous.get('format') == IMAGE_MANIFEST_FORMAT else {}
+    images = {}
+    stats = {"sources": 0, "rebuilt": 0, "skipped": 0, "source_bytes": 0, "derived_bytes": 0}
+
+    for name in sorted(os.listdir(source_dir)):
+        path = os.path.join(source_dir, name)
+        if not name.lower().endswith(IMAGE_EXTENSIONS) or not os.path.isfile(path):
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        stats["sources"] += 1
+        stats["source_bytes"] += len(data)
+
+        # Image URLs in the catalog do not always match the file name's case
+        key = name.lower()
+        entry = previous.get(key)
+        if not (entry and entry["source_hash"] == digest and entry["widths"] == list(widths) and all(
+                os.path.exists(os.path.join(output_dir, file)) for file, _ in _derived_files(entry))):
+            try:
+                entry = _derive_image(Image, ImageOps, data, name, widths, output_dir)
+            except (OSError, ValueError) as e:
+                print(f'skipping {path}: {e}', file=sys.stderr)
+                stats["skipped"] += 1
+                continue
+            entry.update(source=name, source_hash=digest, source_size=len(data), widths=list(widths))
+            stats["rebuilt"] += 1
+        images[key] = entry
+        stats["derived_bytes"] += sum(size for _, size in _derived_files(entry))
+
+    referenced = {file for entry in images.values() for file, _ in _derived_files(entry)}
+    for name in os.listdir(output_dir):
+        if name not in referenced and name != os.path.basename(manifest_path):
+            os.remove(os.path.join(output_dir, name))
+
+    tmp_path = f'{manifest_path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({"format": IMAGE_MANIFEST_FORMAT, "images": images}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return stats
+
+
+def _derive_image(Image, ImageOps, data, name, widths, output_dir):
+    stem = os.path.splitext(name)[0].replace('.', '-')
+    with Image.open(io.BytesIO(data)) as source:
+        # Some sources are WebP or GIF despite a .jpg name; serve them with their real type
+        source_type = Image.MIME.get(source.format)
+        image = ImageOps.exif_transpose(source)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, 'white')
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        else:
+            image = image.convert('RGB')
+
+    entry = {"width": image.width, "height": image.height, "source_type": source_type,
+             **{fmt: [] for fmt in IMAGE_FORMATS}}
+    # Never upscale: narrow sources collapse onto their own width
+    for width in sorted({min(width, image.width) for width in widths}):
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+        for fmt, (extension, options) in IMAGE_FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, fmt.upper(), **options)
+            body = buffer.getvalue()
+            file = f'{stem}-{width}.{hashlib.sha256(body).hexdigest()[:10]}.{extension}'
+            file_path = os.path.join(output_dir, file)
+            if not os.path.exists(file_path):
+                with open(file_path, 'wb') as f:
+                    f.write(body)
+            entry[fmt].append([width, file, len(body)])
+    return entry
+
+
+def _derived_files(entry):
+    return [(file, size) for fmt in IMAGE_FORMATS for _, file, size in entry[fmt]]
+
+
+def load_image_manifest(path=IMAGE_MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+image_manifest = load_image_manifest()
+image_manifest = image_manifest.get('images', {}) if image_manifest.get('format') == IMAGE_MANIFEST_FORMAT else {}
+image_manifest_version = hashlib.sha1(json.dumps(image_manifest, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def image_srcsets(image_url):
+    """(JPEG srcset, WebP srcset) for a catalog image URL, or (None, None) before a build"""
+    entry = image_manifest.get(os.path.basename(image_url or '').lower())
+    if not entry:
+        return None, None
+    return tuple(
+        ', '.join(f'/{DERIVED_IMAGE_DIR}/{file} {width}w' for width, file, _ in entry[fmt])
+        for fmt in IMAGE_FORMATS
+    )
+
+
+def hashed_image_url(image_url):
+    """Immutable, content-hashed URL for a catalog image, or the stored URL before a build"""
+    entry = image_manifest.get(os.path.basename(image_url or '').lower())
+    if not entry:
+        return image_url
+    return f'/{IMAGE_DIR}/{_hashed_name(entry["source"], entry["source_hash"])}'
+
+
+def _hashed_name(name, digest):
+    stem, extension = os.path.splitext(name)
+    return f'{stem}.{digest[:10]}{extension}'
+
+
+# Static assets
+STATIC_MAX_AGE = 365 * 24 * 3600
+# '' (Flask streams the file), 'x-sendfile' (Apache/lighttpd) or 'x-accel-redirect' (nginx)
+STATIC_SENDFILE = os.environ.get('STATIC_SENDFILE', '').lower()
+STATIC_SENDFILE_HEADERS = ('x-sendfile', 'x-accel-redirect')
+if STATIC_SENDFILE and STATIC_SENDFILE not in STATIC_SENDFILE_HEADERS:
+    raise ValueError(f'STATIC_SENDFILE must be empty, x-sendfile or x-accel-redirect, not {STATIC_SENDFILE!r}')
+# nginx internal location that maps onto the app directory, used with x-accel-redirect
+STATIC_ACCEL_PREFIX = os.environ.get('STATIC_ACCEL_PREFIX', '/protected/')
+
+
+# Preferred first when the client rates several codings equally
+CONTENT_CODINGS = ('br', 'gzip')
+
+
+def negotiate_encoding(accept_encodings, available):
+    """Best precompressed coding the client accepts, or None for the identity body"""
+    ranked = [(accept_encodings[coding], -CONTENT_CODINGS.index(coding))
+              for coding in available if accept_encodings[coding] > 0]
+    return CONTENT_CODINGS[-max(ranked)[1]] if ranked else None
+
+
+class StaticAsset:
+    """Immutable file whose size and ETag come from a build manifest, not a stat()
+
+    `variants` maps a content coding ('br', 'gzip') to a precompressed
+    sibling asset for text types.
+    """
+
+    def __init__(self, path, size, etag, mimetype=None, variants=None):
+        self.path = path
+        self.size = size
+        self.etag = etag
+        self.mimetype = mimetype or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.variants = variants or {}
+
+
+def image_static_assets(manifest):
+    """URL path (below /appliance_images/) -> StaticAsset for hashed originals and derivatives"""
+    assets = {}
+    for entry in manifest.values():
+        assets[_hashed_name(entry["source"], entry["source_hash"])] = StaticAsset(
+            os.path.join(IMAGE_DIR, entry["source"]), entry["source_size"], entry["source_hash"],
+            entry.get("source_type"))
+        for file, size in _derived_files(entry):
+            assets[f'derived/{file}'] = StaticAsset(
+                os.path.join(DERIVED_IMAGE_DIR, file), size, file.rsplit('.', 2)[-2])
+    return assets
+
+
+image_assets = image_static_assets(image_manifest)
+
+
+def send_static_asset(asset):
+    """Serve a hashed asset with a one-year immutable policy, 304s, Range and X-Sendfile support"""
+    coding = negotiate_encoding(request.accept_encodings, asset.variants)
+    selected = asset.variants[coding] if coding else asset
+
+    if STATIC_SENDFILE in STATIC_SENDFILE_HEADERS:
+        response = app.response_class(mimetype=asset.mimetype)
+        if STATIC_SENDFILE == 'x-sendfile':
+            response.headers['X-Sendfile'] = os.path.abspath(selected.path)
+        else:
+            response.headers['X-Accel-Redirect'] = STATIC_ACCEL_PREFIX + selected.path.replace(os.sep, '/')
+    else:
+        response = app.response_class(mimetype=asset.mimetype, direct_passthrough=True)
+        if request.if_none_match.contains_weak(selected.etag):
+            response.status_code = 304
+        else:
+            response.response = wrap_file(request.environ, open(selected.path, 'rb'))
+            response.content_length = selected.size
+
+    response.set_etag(selected.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    response.cache_control.immutable = True
+    if asset.variants:
+        response.vary.add('Accept-Encoding')
+    if coding:
+        response.content_encoding = coding
+    response.accept_ranges = 'bytes'
+    if STATIC_SENDFILE in STATIC_SENDFILE_HEADERS or response.status_code == 304:
+        return response
+    return response.make_conditional(request, accept_ranges=True, complete_length=selected.size)
+
+
+# Taxonomy
+CATEGORIES_QUERY = 'SELECT id, name FROM categories'
+SUBCATEGORIES_QUERY = 'SELECT id, name FROM subcategories WHERE category_id = ?'
+TAXONOMY_MAX_AGE = int(os.environ.get('TAXONOMY_MAX_AGE', 300))
+
+
+class Blob:
+    """Pre-serialized response body and its strong ETag"""
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+
+    @classmethod
+    def json(cls, value):
+        return cls(f"{app.json.dumps(value)}\n".encode())
+
+    def compressed(self):
+        """Content-coding -> Blob of this body precompressed at the highest level"""
+        variants = {'gzip': Blob(gzip.compress(self.body, 9, mtime=0))}
+        if brotli is not None:
+            variants['br'] = Blob(brotli.compress(self.body, quality=11))
+        return variants
+
+
+class Taxonomy:
+    """Category -> subcategory tree, serialized once per database version"""
+
+    def __init__(self, db, data_version=None):
+        self.data_version = data_version
+        categories = [{"id": row[0], "name": row[1]} for row in db.execute(CATEGORIES_QUERY)]
+        tree = []
+        self._subcategories = {}
+        for category in categories:
+            subcategories = [{"id": row[0], "name": row[1]}
+                             for row in db.execute(SUBCATEGORIES_QUERY, (category["id"],))]
+            self._subcategories[category["id"]] = Blob.json(subcategories)
+            tree.append({**category, "subcategories": subcategories})
+        self._empty = Blob.json([])
+        self.categories = Blob.json(categories)
+        self.tree = Blob.json(tree)
+
+    def subcategories_of(self, category_id):
+        return self._subcategories.get(category_id, self._empty)
+
+
+_taxonomy = None
+
+
+def get_taxonomy():
+    """Current taxonomy, rebuilt when the catalog snapshot sees a database write"""
+    global _taxonomy
+    catalog = get_catalog()
+    taxonomy = _taxonomy
+    if taxonomy is None or taxonomy.data_version != catalog.data_version:
+        with db_pool.connection() as db:
+            taxonomy = _taxonomy = Taxonomy(db, catalog.data_version)
+    return taxonomy
+
+
+# Front-end assets, built by build_assets.py
+ASSET_DIR = 'assets'
+ASSET_MANIFEST_PATH = os.path.join(ASSET_DIR, 'manifest.json')
+
+
+def load_asset_manifest(path=ASSET_MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 
+def frontend_static_assets(manifest):
+    """URL path (below /assets/) -> StaticAsset for every built front-end file"""
+    assets = {}
+    for name, entry in manifest.get('files', {}).items():
+        variants = {coding: StaticAsset(os.path.join(ASSET_DIR, variant["file"]), variant["size"],
+                                        variant["file"].split('.')[-3] + f'-{coding}', entry["type"])
+                    for coding, variant in entry["variants"].items()}
+        assets[name] = StaticAsset(os.path.join(ASSET_DIR, name), entry["size"], name.split('.')[-2],
+                                   entry["type"], variants)
+    return assets
+
+
+# Without a build the page falls back to the public CDNs
+frontend_assets = load_asset_manifest() or None
+frontend_files = frontend_static_assets(frontend_assets or {})
+
+
+# Index page
+INDEX_MAX_AGE = int(os.environ.get('INDEX_MAX_AGE', 0))
+
+
+class Page:
+    """Rendered page held as raw bytes plus precompressed variants"""
+
+    def __init__(self, html):
+        self.raw = Blob(html.encode())
+        self.variants = self.raw.compressed()
+
+    def select(self, accept_encodings):
+        coding = negotiate_encoding(accept_encodings, self.variants)
+        return coding, self.variants[coding] if coding else self.raw
+
+
+_index_page = None
+
+
+def get_index_page():
+    """The landing page, rendered once on first use; it has no per-request variables"""
+    global _index_page
+    if _index_page is None:
+        with stage('render'):
+            _index_page = Page(render_template_string(HTML_TEMPLATE, assets=frontend_assets))
+    return _index_page
+
+
+# Routes
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
-@app.route('/appliance_images/<filename>')
+    coding, blob = get_index_page().select(request.accept_encodings)
+    response = conditional_response(blob.body, blob.etag, 'text/html', INDEX_MAX_AGE)
+    response.vary.add('Accept-Encoding')
+    if coding:
+        response.content_encoding = coding
+    return response
+
+
+@app.route('/appliance_images/<path:filename>')
 def serve_appliance_image(filename):
-    return send_from_directory('appliance_images', filename)
+    asset = image_assets.get(filename)
+    if asset is None:
+        return send_from_directory(IMAGE_DIR, filename)
+    return send_static_asset(asset)
+
+
+@app.route(f'/{ASSET_DIR}/<path:filename>')
+def serve_frontend_asset(filename):
+    asset = frontend_files.get(filename)
+    if asset is None:
+        abort(404)
+    return send_static_asset(asset)
+
+
+def conditional_response(body, etag, mimetype, max_age):
+    """Response for a pre-serialized body with a strong ETag, answering 304 when it matches"""
+    response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+@app.route('/api/taxonomy')
+def get_taxonomy_tree():
+    blob = get_taxonomy().tree
+    return conditional_response(blob.body, blob.etag, app.json.mimetype, TAXONOMY_MAX_AGE)
 
 
 @app.route('/api/categories')
 def get_categories():
-    with closing(sqlite3.connect('../appliances.db')) as db:
-        cursor = db.cursor()
-        cursor.execute('SELECT id, name FROM categories')
-        categories = [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
-        return jsonify(categories)
+    blob = get_taxonomy().categories
+    return conditional_response(blob.body, blob.etag, app.json.mimetype, TAXONOMY_MAX_AGE)
 
 
 @app.route('/api/subcategories/<int:category_id>')
 def get_subcategories(category_id):
-    with closing(sqlite3.connect('../appliances.db')) as db:
-        cursor = db.cursor()
-        cursor.execute('SELECT id, name FROM subcategories WHERE category_id = ?', (category_id,))
-        subcategories = [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
-        return jsonify(subcategories)
+    blob = get_taxonomy().subcategories_of(category_id)
+    return conditional_response(blob.body, blob.etag, app.json.mimetype, TAXONOMY_MAX_AGE)
+
+
+@app.route('/api/stats')
+def get_stats():
+    return jsonify({"db_pool": db_pool.metrics(), "result_cache": result_cache.metrics()})
+
+
+@app.route('/admin/slow-queries')
+def get_slow_queries():
+    """Recent statements over SLOW_QUERY_SECONDS in this process, slowest first"""
+    if not admin_authorized():
+        abort(404)
+    return jsonify({"threshold_seconds": SLOW_QUERY_SECONDS,
+                    "queries": sorted(slow_queries, key=lambda entry: entry["seconds"], reverse=True)})
+
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus text exposition of request, stage, cache and pool metrics for this process"""
+    catalog = _catalog
+    lines = STAGE_SECONDS.render() + REQUEST_SECONDS.render() + REQUESTS.render()
+    lines += _gauges('dtbs_result_cache', result_cache.metrics(), 'Result cache statistic (see /api/stats).')
+    lines += _gauges('dtbs_db_pool', db_pool.metrics(), 'Connection pool statistic (see /api/stats).')
+    if catalog is not None:
+        lines += _gauges('dtbs_catalog', {"rows": int(catalog.alive.sum()), "change_seq": catalog.change_seq},
+                         'Catalog snapshot size and change-log position.')
+    return app.response_class('\n'.join(lines) + '\n', content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def parse_id(value, name):
+    """Category/subcategory id from JSON, a query string or CSV; None (or 0, '') means any"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str) and re.fullmatch(r'\s*\d+\s*', value):
+        return int(value) or None
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0 and value == int(value):
+        return int(value) or None
+    raise ValueError(f'{name} must be a non-negative integer')
+
+
+def parse_number(value, name, convert=float):
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a number') from None
+
+
+def parse_preferences(preferences):
+    """(category_id, subcategory_id, budget, eco_priority, limit) from a recommend request body
+
+    Raises ValueError naming the first field that is missing its expected type.
+    """
+    if not isinstance(preferences, dict):
+        raise ValueError('preferences must be an object')
+    budget = parse_number(preferences.get('budget', 50000), 'budget')
+    # Scores divide by the budget and by the best possible score, 5 * eco + (1 - eco)
+    if not 0 < budget < float('inf'):
+        raise ValueError('budget must be a positive finite number')
+    eco_priority = parse_number(preferences.get('eco_priority', 0.5), 'eco_priority')
+    if not 0 <= eco_priority <= 1:
+        raise ValueError('eco_priority must be between 0 and 1')
+    return (parse_id(preferences.get('category_id'), 'category_id'),
+            parse_id(preferences.get('subcategory_id'), 'subcategory_id'),
+            budget,
+            quantize_eco_priority(eco_priority),
+            min(max(parse_number(preferences.get('limit') or DEFAULT_PAGE_SIZE, 'limit', int), 1), MAX_PAGE_SIZE))
 
 
 @app.route('/api/recommend', methods=['POST'])
 def api_recommend():
     preferences = request.json
-    results = recommend_appliances(
-        preferences.get('category_id'),
-        preferences.get('subcategory_id'),
-        float(preferences.get('budget', 50000)),
-        float(preferences.get('eco_priority', 0.5))
-    )
+    try:
+        category_id, subcategory_id, budget, eco_priority, limit = parse_preferences(preferences)
+        cursor = preferences.get('cursor') or None
+        if cursor is not None and not isinstance(cursor, str):
+            raise ValueError('malformed cursor')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        filters = parse_facet_filters(preferences)
+    except (TypeError, ValueError):
+        return jsonify({"error": "brands and features must be lists, min_energy_tier and min_price numbers"}), 400
+
+    key = (TierIndex.scope_for(category_id, subcategory_id), budget, eco_priority, limit, cursor, filters)
+    versions = (get_catalog().change_seq, energy_data_version(), image_manifest_version)
+    with stage('cache'):
+        body = result_cache.get(key, versions)
+    if body is None:
+        try:
+            body = recommend_response(category_id, subcategory_id, budget, eco_priority,
+                                      limit, cursor, filters).get_data()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        with stage('cache'):
+            result_cache.put(key, versions, body)
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
+@app.route('/api/recommend/batch', methods=['POST'])
+def api_recommend_batch():
+    """First pages for many preference profiles: {"profiles": [...], "limit": n}"""
+    body = request.json
+    profiles = body.get('profiles') if isinstance(body, dict) else None
+    if not isinstance(profiles, list) or not profiles:
+        return jsonify({"error": "profiles must be a non-empty list"}), 400
+    if len(profiles) > MAX_BATCH_PROFILES:
+        return jsonify({"error": f"at most {MAX_BATCH_PROFILES} profiles per batch"}), 400
+    try:
+        limit = parse_preferences({"limit": body.get('limit')})[4]
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    parsed = []
+    for i, profile in enumerate(profiles):
+        try:
+            parsed.append(parse_preferences(profile)[:4])
+        except ValueError as e:
+            return jsonify({"error": f"profile {i}: {e}"}), 400
+    profiles = parsed
+
+    results = recommend_many(profiles, limit)
+    for result in results:
+        add_annual_costs(result['recommendations'] + result['eco_picks'])
+    with stage('serialize'):
+        return jsonify({"results": results, "energy_data": ENERGY_DATA})
+
+
+@app.route('/api/search')
+def api_search():
+    """?q= text search within the usual category/subcategory/budget/eco_priority filters"""
+    text = request.args.get('q', '').strip()
+    if not text:
+        return jsonify({"error": "q is required"}), 400
+    try:
+        category_id, subcategory_id, budget, eco_priority, limit = parse_preferences(request.args)
+        results = search_appliances(text, category_id, subcategory_id, budget, eco_priority, limit)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    add_annual_costs(results['recommendations'] + results['eco_picks'])
+    with stage('serialize'):
+        return jsonify({**results, "energy_data": ENERGY_DATA})
+
+
+@app.route('/api/pareto')
+def api_pareto():
+    """Price / annual kWh / energy tier trade-offs within the usual category/subcategory/budget filters"""
+    try:
+        category_id, subcategory_id, budget = parse_preferences(request.args)[:3]
+        limit = min(max(int(request.args.get('limit') or MAX_PARETO_POINTS), 2), MAX_PARETO_POINTS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    results = pareto_frontier(category_id, subcategory_id, budget, limit)
+    with stage('serialize'):
+        return jsonify(results)
+
+
+@app.route('/api/appliances/<appliance_id>/similar')
+def api_similar(appliance_id):
+    """?limit= most similar appliances of the same subcategory"""
+    try:
+        limit = min(max(int(request.args.get('limit') or SIMILAR_LIMIT), 1), MAX_SIMILAR_LIMIT)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    similar = similar_appliances(appliance_id, limit)
+    if similar is None:
+        return jsonify({"error": "no such appliance"}), 404
+    add_annual_costs(similar)
+    with stage('serialize'):
+        return jsonify({"similar": similar, "energy_data": ENERGY_DATA})
+
+
+@app.route('/api/suggest')
+def api_suggest():
+    """?q= as-you-type completions: brands, models and subcategories"""
+    try:
+        limit = min(max(int(request.args.get('limit') or SUGGEST_LIMIT), 1), MAX_SUGGEST_LIMIT)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    text = request.args.get('q', '')
+    suggestions = get_suggest_index().suggest(text, limit)
+    with stage('serialize'):
+        return jsonify({"query": text, "suggestions": suggestions})
 
-    for product in results['recommendations'] + results['eco_picks']:
-        if product.get('annual_consumption'):
-            product['annual_cost'] = calculate_annual_cost(
-                product['annual_consumption'],
-                ENERGY_DATA['price_per_kwh']
-            )
 
-    return jsonify({
-        **results,
-        "energy_data": ENERGY_DATA
-    })
+def recommend_response(category_id, subcategory_id, budget, eco_priority,
+                       limit=DEFAULT_PAGE_SIZE, cursor=None, filters=NO_FACET_FILTERS):
+    results = recommend_appliances(category_id, subcategory_id, budget, eco_priority, limit, cursor, filters)
+    add_annual_costs(results['recommendations'] + results['eco_picks'])
 
+    with stage('serialize'):
+        return jsonify({
+            **results,
+            "energy_data": ENERGY_DATA
+        })
 
-def calculate_annual_cost(consumption, price_per_kwh):
-    try:
-        kwh = float(consumption.replace(' kWh', ''))
-        return f"₹{(kwh * price_per_kwh):.2f}"
-    except:
+
+def add_annual_costs(products):
+    with stage('annual_cost'):
+        for product in products:
+            if product.get('annual_kwh') is not None:
+                product['annual_cost'] = calculate_annual_cost(
+                    product['annual_kwh'],
+                    ENERGY_DATA['price_per_kwh']
+                )
+
+
+def calculate_annual_cost(annual_kwh, price_per_kwh):
+    if annual_kwh is None:
         return "N/A"
+    return f"₹{(annual_kwh * price_per_kwh):.2f}"
+
+
+# Query plan checks
+# Not issued by the app: the SQL equivalent of CatalogSnapshot.select, checked so the scope + price
+# indexes keep serving ad-hoc queries against the table
+APPLIANCES_IN_BUDGET_QUERY = '''
+SELECT a.*, c.name as category_name, s.name as subcategory_name
+FROM appliances a
+JOIN categories c ON a.category_id = c.id
+JOIN subcategories s ON a.subcategory_id = s.id
+WHERE a.price <= ? AND a.{scope}_id = ?
+'''
+
+# Every read the app issues against the catalog database (the shared result cache lives in its own
+# file), then the reference queries: (name, sql, sample params, tables it may read in full)
+QUERY_PLAN_CHECKS = [
+    ('categories', CATEGORIES_QUERY, (), {'categories'}),
+    ('subcategories', SUBCATEGORIES_QUERY, (1,), set()),
+    ('products', PRODUCTS_QUERY, ('[1, 2]',), set()),
+    ('catalog_load', CatalogSnapshot.COLUMNS_QUERY, (), {'appliances'}),
+    ('catalog_changed_rows', CatalogSnapshot.CHANGED_COLUMNS_QUERY, ('[1, 2]',), set()),
+    ('catalog_brands', CatalogSnapshot.BRANDS_QUERY, (), {'appliances'}),
+    ('catalog_changed_brands', CatalogSnapshot.CHANGED_BRANDS_QUERY, ('[1, 2]',), set()),
+    ('catalog_change_seq', CatalogSnapshot.CHANGE_SEQ_QUERY, (), set()),
+    ('catalog_changes', CatalogSnapshot.CHANGES_QUERY, (0,), set()),
+    ('ingest_pending', PENDING_INGEST_QUERY, (), set()),
+    ('ingest_rows', INGEST_ROWS_QUERY, (), set()),
+    ('search_matches', SEARCH_MATCHES_QUERY, ('"lg"*',), set()),
+    ('search_ranked', SEARCH_RANKED_QUERY, ('"lg"*',), set()),
+    # The suggestion index is built from every name
+    ('suggest_names', SUGGEST_NAMES_QUERY, (), {'appliances'}),
+    ('suggest_subcategories', SUGGEST_SUBCATEGORIES_QUERY, (), {'subcategories'}),
+    ('similar_rows', SIMILAR_ROWS_QUERY, (1,), set()),
+    ('similar_changed_rows', SIMILAR_CHANGED_ROWS_QUERY, ('[1, 2]',), set()),
+    ('appliance_subcategory', APPLIANCE_SUBCATEGORY_QUERY, ('ES001',), set()),
+    ('reference_appliances_in_budget_by_subcategory', APPLIANCES_IN_BUDGET_QUERY.format(scope='subcategory'),
+     (30000, 1), set()),
+    ('reference_appliances_in_budget_by_category', APPLIANCES_IN_BUDGET_QUERY.format(scope='category'),
+     (30000, 1), set()),
+]
+
+
+def explain_query_plans(db):
+    """EXPLAIN QUERY PLAN detail lines for every registered query"""
+    return {
+        name: [row[3] for row in db.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+        for name, sql, params, _ in QUERY_PLAN_CHECKS
+    }
+
+
+def check_query_plans(db):
+    """Plan lines that fall back to a full scan of a table the query should not scan"""
+    allowed = {name: scans for name, _, _, scans in QUERY_PLAN_CHECKS}
+    aliases = {'a': 'appliances', 'c': 'categories', 's': 'subcategories'}
+    # A partial index only holds the rows its WHERE admits, so scanning one is not a full read
+    partial = {row[0] for row in db.execute(
+        "SELECT i.name FROM sqlite_master m, pragma_index_list(m.name) i WHERE m.type = 'table' AND i.partial")}
+    problems = []
+    for name, plan in explain_query_plans(db).items():
+        for detail in plan:
+            match = re.match(r'SCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?', detail)
+            if not match or 'VIRTUAL TABLE' in detail or detail == 'SCAN CONSTANT ROW' or match.group(2) in partial:
+                continue
+            if aliases.get(match.group(1), match.group(1)) not in allowed[name]:
+                problems.append((name, detail))
+    return problems
+
+
+# Bulk recommendations
+BULK_CHUNK_SIZE = 500
+
+
+def read_records(path):
+    """Stream dicts from a CSV (with a header row) or JSON Lines file"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            reader = csv.reader(f)
+            header = next(reader, [])
+            for row in reader:
+                # Empty CSV cells mean "not given", like a missing JSON key
+                yield {key: value for key, value in zip(header, row) if value}
+        else:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Passed through so the output reports it against its input
+                        yield line.rstrip('\n')
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_bulk_worker():
+    """Load the catalog once per worker process, on its own connection"""
+    global _catalog, _catalog_db
+    _catalog = _catalog_db = None
+    get_catalog()
+
+
+def recommend_chunk(rows, limit):
+    """JSON Lines for one chunk of preference rows, each echoing its input"""
+    profiles, lines = [], [None] * len(rows)
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            lines[i] = {"input": row, "error": "not a JSON object"}
+            continue
+        try:
+            profiles.append((i, parse_preferences(row)[:4]))
+        except ValueError as e:
+            lines[i] = {"input": row, "error": str(e)}
+    results = recommend_many([profile for _, profile in profiles], limit)
+    for (i, _), result in zip(profiles, results):
+        add_annual_costs(result['recommendations'] + result['eco_picks'])
+        lines[i] = {"input": rows[i], **result}
+    return [json.dumps(line, ensure_ascii=False) for line in lines]
+
+
+def recommend_bulk(input_path, output, workers=None, limit=DEFAULT_PAGE_SIZE, chunk_size=BULK_CHUNK_SIZE):
+    """Recommend for every row of a preferences file, writing JSON Lines in input order
+
+    Rows are read lazily and at most two chunks per worker are in flight, so
+    memory stays flat however large the input is. Returns the row count.
+    """
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    with multiprocessing.Pool(workers, initializer=_init_bulk_worker) as pool:
+        pending = collections.deque()
+
+        def drain(keep):
+            nonlocal count
+            while len(pending) > keep:
+                lines = pending.popleft().get()
+                output.write('\n'.join(lines) + '\n')
+                count += len(lines)
+
+        for chunk in _chunks(read_records(input_path), chunk_size):
+            pending.append(pool.apply_async(recommend_chunk, (chunk, limit)))
+            drain(2 * workers - 1)
+        drain(0)
+    return count
+
+
+# Synthetic catalogs and bulk loading
+APPLIANCE_COLUMNS = ('id', 'name', 'brand', 'price', 'energy_rating', 'annual_consumption', 'features',
+                     'image_url', 'category_id', 'subcategory_id')
+CATEGORY_COLUMN = APPLIANCE_COLUMNS.index('category_id')
+SUBCATEGORY_COLUMN = APPLIANCE_COLUMNS.index('subcategory_id')
+BULK_LOAD_BATCH = 50_000
+GENERATE_BLOCK = 65_536
+MODEL_LETTERS = 'ABCDEFGHKLMNPRSTXZ'
+# Durability is pointless mid-load: the whole load is one transaction either way
+BULK_LOAD_PRAGMAS = ('PRAGMA synchronous = OFF', 'PRAGMA cache_size = -524288', 'PRAGMA temp_store = MEMORY')
+# catalog_changes entry telling snapshots to reload in full instead of patching rows
+FULL_RELOAD_MARKER = -1
+
+
+def generate_appliances(count, seed=0):
+    """Synthetic appliance records shaped like the seed catalog
+
+    Each record starts from a random seed appliance, so the category and
+    subcategory mix, brands, rating mix and images follow the sample; price
+    and consumption are jittered around it and features are drawn from the
+    subcategory's pool. Random draws are made with NumPy a block at a time.
+    """
+    import seed_data
+
+    rng = np.random.default_rng(seed)
+    templates = seed_data.APPLIANCES
+    keys = [(template[8], template[9]) for template in templates]
+    pools = {}
+    for key, template in zip(keys, templates):
+        pools.setdefault(key, set()).update(parse_features(template[6]))
+    pools = {key: sorted(pool) for key, pool in pools.items()}
+    # Templates grouped by subcategory, so a rating can be borrowed from a sibling
+    order = np.array(sorted(range(len(templates)), key=lambda i: keys[i]))
+    sorted_keys = [keys[i] for i in order]
+    group_start = np.array([sorted_keys.index(key) for key in keys])
+    group_size = np.array([sorted_keys.count(key) for key in keys])
+    base_price = np.array([template[3] for template in templates], dtype=np.float64)
+    base_kwh = np.array([parse_annual_kwh(template[5]) or np.nan for template in templates])
+    feature_lists = {}
+
+    for start in range(0, count, GENERATE_BLOCK):
+        size = min(GENERATE_BLOCK, count - start)
+        picks = rng.integers(len(templates), size=size)
+        # Retail-style prices (..990) spread log-normally around the template's
+        prices = np.maximum(90, np.round(base_price[picks] * rng.lognormal(0, 0.35, size), -2) - 10)
+        siblings = order[group_start[picks] + (rng.random(size) * group_size[picks]).astype(np.int64)]
+        rating_from = np.where(rng.random(size) < 0.3, siblings, picks)
+        kwh = np.maximum(1, np.round(base_kwh[picks] * rng.uniform(0.8, 1.2, size)))
+        models = rng.integers(10, 1000, size=size).tolist()
+        letters = rng.integers(len(MODEL_LETTERS), size=size).tolist()
+        offsets = rng.integers(1 << 30, size=size).tolist()
+        feature_counts = rng.integers(1, 4, size=size).tolist()
+
+        for i, pick, price, rating_pick, annual_kwh in zip(
+                range(size), picks.tolist(), prices.tolist(), rating_from.tolist(), kwh.tolist()):
+            _, name, brand, _, _, consumption, _, image_url, category_id, subcategory_id = templates[pick]
+            pool = pools[keys[pick]]
+            window = min(len(pool), feature_counts[i])
+            feature_key = keys[pick], offsets[i] % len(pool), window
+            if feature_key not in feature_lists:
+                feature_lists[feature_key] = json.dumps(
+                    [pool[(feature_key[1] + j) % len(pool)] for j in range(window)])
+            yield {
+                "id": f'SYN{start + i:08d}',
+                "name": f'{name} {MODEL_LETTERS[letters[i]]}{models[i]}',
+                "brand": brand,
+                "price": price,
+                "energy_rating": templates[rating_pick][4],
+                # NaN (no parsable kWh in the template) keeps the template's text
+                "annual_consumption": f'{annual_kwh:.0f} kWh' if annual_kwh == annual_kwh else consumption,
+                "features": feature_lists[feature_key],
+                "image_url": image_url,
+                "category_id": category_id,
+                "subcategory_id": subcategory_id,
+            }
+
+
+def write_records(records, output, path):
+    """Write dicts as CSV when `path` ends in .csv, JSON Lines otherwise; returns the count"""
+    count = 0
+    if path.lower().endswith('.csv'):
+        writer = csv.DictWriter(output, APPLIANCE_COLUMNS)
+        writer.writeheader()
+        for count, record in enumerate(records, 1):
+            writer.writerow(record)
+    else:
+        for count, record in enumerate(records, 1):
+            output.write(json.dumps(record) + '\n')
+    return count
+
+
+# Ratings, consumption strings and feature lists repeat heavily across a catalog
+_cached_energy_tier = functools.lru_cache(maxsize=1 << 16)(parse_energy_tier)
+_cached_annual_kwh = functools.lru_cache(maxsize=1 << 16)(parse_annual_kwh)
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _cached_features_json(features):
+    return json.dumps(parse_features(features))
+
+
+def _appliance_row(record):
+    """INSERT parameters for one appliance record, parsed columns included"""
+    features = record.get('features')
+    if not isinstance(features, str):
+        features = json.dumps(features or [])
+    rating = record['energy_rating']
+    consumption = record.get('annual_consumption')
+    return (record['id'], record['name'], record['brand'], float(record['price']), rating, consumption,
+            features, record.get('image_url'), int(record['category_id']), int(record['subcategory_id']),
+            _cached_energy_tier(rating), _cached_annual_kwh(consumption), _cached_features_json(features))
+
+
+def bulk_load_appliances(path, db_path=None, replace=False):
+    """Insert (or replace) every appliance in a CSV/JSON Lines file in one transaction
+
+    Indexes and change-log/search triggers on `appliances` are dropped for the
+    load and recreated from their stored SQL afterwards, so each index is
+    built once in bulk and no per-row trigger work is done. A FULL_RELOAD_MARKER
+    tells running servers to reload their snapshot. Returns the row count.
+    """
+    db_path = db_path or DB_PATH
+    init_db(db_path)
+    with closing(sqlite3.connect(db_path, timeout=30, isolation_level=None)) as db:
+        for pragma in BULK_LOAD_PRAGMAS:
+            db.execute(pragma)
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            deferred = db.execute('''
+                SELECT type, name, sql FROM sqlite_master
+                WHERE tbl_name = 'appliances' AND type IN ('index', 'trigger') AND sql IS NOT NULL
+            ''').fetchall()
+            for kind, name, _ in deferred:
+                db.execute(f'DROP {kind.upper()} {name}')
+            if replace:
+                db.execute('DELETE FROM appliances')
+            # The catalog only lists appliances whose category and subcategory exist
+            categories = {category_id for category_id, in db.execute('SELECT id FROM categories')}
+            subcategories = {subcategory_id for subcategory_id, in db.execute('SELECT id FROM subcategories')}
+
+            count = 0
+            for chunk in _chunks(read_records(path), BULK_LOAD_BATCH):
+                try:
+                    rows = [_appliance_row(record) for record in chunk]
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    raise ValueError(f'bad appliance record near row {count + 1}: {e!r}') from e
+                for offset, row in enumerate(rows):
+                    if row[CATEGORY_COLUMN] not in categories:
+                        raise ValueError(f'bad appliance record near row {count + offset + 1}: '
+                                         f'unknown category_id {row[CATEGORY_COLUMN]}')
+                    if row[SUBCATEGORY_COLUMN] not in subcategories:
+                        raise ValueError(f'bad appliance record near row {count + offset + 1}: '
+                                         f'unknown subcategory_id {row[SUBCATEGORY_COLUMN]}')
+                db.executemany(f'''
+                    INSERT OR REPLACE INTO appliances
+                    ({", ".join(APPLIANCE_COLUMNS + tuple(name for name, _ in PARSED_COLUMNS))})
+                    VALUES ({", ".join("?" * (len(APPLIANCE_COLUMNS) + len(PARSED_COLUMNS)))})
+                ''', rows)
+                count += len(rows)
+
+            # Indexes before triggers, matching the order they were first created in
+            for kind, _, sql in sorted(deferred, key=lambda item: item[0] != 'index'):
+                db.execute(sql)
+            # The search index's triggers were dropped with the rest, so re-read it from the table
+            rebuild_search_index(db)
+            db.execute('INSERT INTO catalog_changes (appliance_rowid) VALUES (?)', (FULL_RELOAD_MARKER,))
+            db.execute('COMMIT')
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    return count
 
 
 # HTML Template remains the same
@@ -1049,8 +3288,14 @@ HTML_TEMPLATE = """
 <html>
 <head>
     <title>EcoSmart Appliance Finder</title>
+    {% if assets %}
+    <style>{{ assets.critical_css|safe }}</style>
+    <link rel="stylesheet" href="{{ assets.stylesheet }}" media="print" onload="this.media='all'">
+    <noscript><link rel="stylesheet" href="{{ assets.stylesheet }}"></noscript>
+    {% else %}
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/css/bootstrap.min.css" rel="stylesheet">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.2.0/css/all.min.css">
+    {% endif %}
     <style>
         :root {
             --primary-green: #27ae60;
@@ -1061,7 +3306,7 @@ HTML_TEMPLATE = """
         
         body {
             background: linear-gradient(rgba(255, 255, 255, 0.92), rgba(255, 255, 255, 0.92)), 
-                        url('https://images.unsplash.com/photo-1476231682828-37e571bc172f?ixlib=rb-1.2.1&auto=format&fit=crop&w=1350&q=80');
+                        url('{{ assets.background.jpeg if assets else "https://images.unsplash.com/photo-1476231682828-37e571bc172f?ixlib=rb-1.2.1&auto=format&fit=crop&w=1350&q=80" }}');
             background-size: cover;
             background-attachment: fixed;
             background-position: center;
@@ -1070,6 +3315,13 @@ HTML_TEMPLATE = """
             cursor: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24"><path fill="%2327ae60" d="M12,2C6.48,2,2,6.48,2,12s4.48,10,10,10s10-4.48,10-10S17.52,2,12,2z M12,20c-4.42,0-8-3.58-8-8s3.58-8,8-8s8,3.58,8,8S16.42,20,12,20z"/></svg>'), auto;
             overflow-x: hidden;
         }
+        {% if assets and assets.background.webp %}
+        body {
+            background-image: linear-gradient(rgba(255, 255, 255, 0.92), rgba(255, 255, 255, 0.92)),
+                              image-set(url('{{ assets.background.webp }}') type('image/webp'),
+                                        url('{{ assets.background.jpeg }}') type('image/jpeg'));
+        }
+        {% endif %}
         
         /* Leaf animation elements */
         .leaf {
@@ -1220,7 +3472,7 @@ HTML_TEMPLATE = """
         }
         
         .feature-list li:before {
-            content: "\f00c";
+            content: "\\f00c";
             font-family: "Font Awesome 6 Free";
             font-weight: 900;
             position: absolute;
@@ -1272,6 +3524,32 @@ HTML_TEMPLATE = """
             margin-bottom: 1rem;
         }
         
+        .suggestions {
+            position: absolute;
+            left: calc(var(--bs-gutter-x) * 0.5);
+            right: calc(var(--bs-gutter-x) * 0.5);
+            z-index: 1000;
+        }
+        
+        .suggestions:empty {
+            display: none;
+        }
+        
+        .facet-group:empty {
+            display: none;
+        }
+        
+        .facet-count {
+            color: #7f8c8d;
+            font-size: 0.85em;
+        }
+        
+        .pareto-chart {
+            width: 100%;
+            height: auto;
+            font-size: 11px;
+        }
+        
         @media (max-width: 768px) {
             .appliance-img {
                 height: 150px;
@@ -1299,6 +3577,12 @@ HTML_TEMPLATE = """
                 <h2 class="h4 mb-4"><i class="fas fa-search header-icon"></i> Find Your Perfect Appliance</h2>
                 <form id="search-form">
                     <div class="row g-3">
+                        <div class="col-12 position-relative">
+                            <label class="form-label" for="query">Search</label>
+                            <input type="search" id="query" class="form-control" autocomplete="off"
+                                   placeholder="e.g. inverter 1.5 ton LG">
+                            <div id="suggestions" class="list-group suggestions shadow-sm"></div>
+                        </div>
                         <div class="col-md-4">
                             <label class="form-label">Category</label>
                             <select id="category" class="form-select">
@@ -1324,6 +3608,29 @@ HTML_TEMPLATE = """
                                 <small>Eco Focus</small>
                             </div>
                         </div>
+                        <div class="col-md-4">
+                            <label class="form-label" for="min-price">Min Price (₹)</label>
+                            <input type="number" id="min-price" class="form-control" min="0" placeholder="Any">
+                        </div>
+                        <div class="col-md-4">
+                            <label class="form-label" for="min-energy-tier">Energy Rating</label>
+                            <select id="min-energy-tier" class="form-select">
+                                <option value="">Any rating</option>
+                                <option value="5">5 stars</option>
+                                <option value="4">4 stars &amp; up</option>
+                                <option value="3">3 stars &amp; up</option>
+                                <option value="2">2 stars &amp; up</option>
+                                <option value="1">1 star &amp; up</option>
+                            </select>
+                        </div>
+                        <div class="col-md-4">
+                            <label class="form-label" for="features">Features</label>
+                            <input type="text" id="features" class="form-control" placeholder="e.g. inverter, wifi">
+                        </div>
+                        <div class="col-12">
+                            <div id="brand-facets" class="facet-group mb-2"></div>
+                            <div id="price-facets" class="facet-group d-flex flex-wrap gap-2"></div>
+                        </div>
                     </div>
                     <button type="submit" class="btn btn-primary mt-3 w-100">
                         <i class="fas fa-search"></i> Find Recommendations
@@ -1349,6 +3656,19 @@ HTML_TEMPLATE = """
             </div>
         </div>
 
+        <!-- Price vs. Energy Trade-off -->
+        <div id="pareto-section" class="card mb-4 d-none">
+            <div class="card-body">
+                <h2 class="card-title"><i class="fas fa-chart-line header-icon"></i> Price vs. Energy Trade-off</h2>
+                <p class="text-muted mb-3">
+                    Appliances no other option beats on price, yearly consumption and star rating
+                    (<span id="pareto-count">0</span> shown)
+                </p>
+                <svg id="pareto-chart" class="pareto-chart" viewBox="0 0 640 260" role="img"
+                     aria-label="Price against annual energy use of the non-dominated appliances"></svg>
+            </div>
+        </div>
+
         <!-- Top Eco Picks -->
         <div class="card mb-4">
             <div class="card-body">
@@ -1370,11 +3690,20 @@ HTML_TEMPLATE = """
                         <p>Use the search form above to get recommendations</p>
                     </div>
                 </div>
+                <div id="results-sentinel"></div>
+            </div>
+        </div>
+
+        <!-- Similar Appliances -->
+        <div id="similar-section" class="card mt-4 d-none">
+            <div class="card-body">
+                <h2 class="card-title"><i class="fas fa-clone header-icon"></i> Similar Appliances</h2>
+                <p id="similar-to" class="text-muted mb-4"></p>
+                <div id="similar-results" class="row row-cols-1 row-cols-md-3 g-4"></div>
             </div>
         </div>
     </div>
 
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/js/bootstrap.bundle.min.js"></script>
     <script>
         // Leaf images (using emoji as background images)
         const leafImages = [
@@ -1448,20 +3777,25 @@ HTML_TEMPLATE = """
             document.getElementById('energy-tip').textContent =
                 tips[Math.floor(Math.random() * tips.length)];
 
-            // Load categories
-            fetch('/api/categories')
+            // Load the whole category -> subcategory tree once
+            const subcategoriesByCategory = {};
+            fetch('/api/taxonomy')
                 .then(response => response.json())
                 .then(categories => {
                     const select = document.getElementById('category');
                     categories.forEach(category => {
+                        subcategoriesByCategory[category.id] = category.subcategories;
                         const option = document.createElement('option');
                         option.value = category.id;
                         option.textContent = category.name;
                         select.appendChild(option);
                     });
+                })
+                .catch(error => {
+                    console.error('Error loading categories:', error);
                 });
 
-            // When category changes, load subcategories
+            // When category changes, fill subcategories from the tree
 document.getElementById('category').addEventListener('change', function() {
     const categoryId = this.value;
     const subcategorySelect = document.getElementById('subcategory');
@@ -1472,20 +3806,13 @@ document.getElementById('category').addEventListener('change', function() {
 
     if (categoryId) {
         subcategorySelect.disabled = false;
-        fetch(`/api/subcategories/${categoryId}`)
-            .then(response => response.json())
-            .then(subcategories => {
-                // Add new options only for defined subcategories
-                subcategories.forEach(subcategory => {
-                    const option = document.createElement('option');
-                    option.value = subcategory.id;
-                    option.textContent = subcategory.name;
-                    subcategorySelect.appendChild(option);
-                });
-            })
-            .catch(error => {
-                console.error('Error loading subcategories:', error);
-            });
+        // Add new options only for defined subcategories
+        (subcategoriesByCategory[categoryId] || []).forEach(subcategory => {
+            const option = document.createElement('option');
+            option.value = subcategory.id;
+            option.textContent = subcategory.name;
+            subcategorySelect.appendChild(option);
+        });
     }
 });
 
@@ -1506,14 +3833,318 @@ document.getElementById('category').addEventListener('change', function() {
                 }
             });
 
+            // As-you-type suggestions: wait for a pause in typing, and drop answers to older keystrokes
+            const SUGGEST_DELAY_MS = 150;
+            const queryInput = document.getElementById('query');
+            const suggestionList = document.getElementById('suggestions');
+            let suggestTimer = null;
+            let suggestRequest = null;
+
+            function hideSuggestions() {
+                suggestionList.replaceChildren();
+            }
+
+            function pickSuggestion(suggestion) {
+                hideSuggestions();
+                if (suggestion.kind === 'subcategory') {
+                    const categorySelect = document.getElementById('category');
+                    categorySelect.value = suggestion.category_id;
+                    categorySelect.dispatchEvent(new Event('change'));
+                    document.getElementById('subcategory').value = suggestion.subcategory_id;
+                    queryInput.value = '';
+                } else {
+                    queryInput.value = suggestion.text;
+                }
+                document.getElementById('search-form').requestSubmit();
+            }
+
+            function showSuggestions(suggestions) {
+                hideSuggestions();
+                suggestions.forEach(suggestion => {
+                    const item = document.createElement('button');
+                    item.type = 'button';
+                    item.className = 'list-group-item list-group-item-action d-flex justify-content-between';
+                    const text = document.createElement('span');
+                    text.textContent = suggestion.text;
+                    const kind = document.createElement('small');
+                    kind.className = 'text-muted';
+                    kind.textContent = suggestion.kind;
+                    item.append(text, kind);
+                    item.addEventListener('click', () => pickSuggestion(suggestion));
+                    suggestionList.appendChild(item);
+                });
+            }
+
+            queryInput.addEventListener('input', function() {
+                clearTimeout(suggestTimer);
+                if (suggestRequest) suggestRequest.abort();
+                const text = this.value;
+                if (!text.trim()) {
+                    hideSuggestions();
+                    return;
+                }
+                suggestTimer = setTimeout(() => {
+                    suggestRequest = new AbortController();
+                    fetch(`/api/suggest?${new URLSearchParams({ q: text })}`, { signal: suggestRequest.signal })
+                        .then(response => response.json())
+                        .then(data => showSuggestions(data.suggestions))
+                        .catch(error => {
+                            if (error.name !== 'AbortError') console.error('Error loading suggestions:', error);
+                        });
+                }, SUGGEST_DELAY_MS);
+            });
+
+            queryInput.addEventListener('keydown', function(e) {
+                if (e.key === 'Escape') hideSuggestions();
+            });
+
+            document.addEventListener('click', function(e) {
+                if (!suggestionList.contains(e.target) && e.target !== queryInput) hideSuggestions();
+            });
+
+            // Responsive card image: WebP/JPEG derivatives when the image build has run
+            const IMAGE_SIZES = '(max-width: 768px) 100vw, 360px';
+            function applianceImage(product) {
+                if (!product.image_srcset) {
+                    return `<img src="${product.image_url}" class="card-img-top appliance-img" loading="lazy">`;
+                }
+                return `
+                    <picture>
+                        <source type="image/webp" srcset="${product.image_webp_srcset}" sizes="${IMAGE_SIZES}">
+                        <img src="${product.image_url}" srcset="${product.image_srcset}" sizes="${IMAGE_SIZES}"
+                             class="card-img-top appliance-img" loading="lazy" decoding="async">
+                    </picture>
+                `;
+            }
+
+            // Recommendation card markup
+            function recommendationCard(product) {
+                return `
+                    <div class="col">
+                        <div class="card h-100 appliance-card">
+                            <div class="position-relative">
+                                <div class="energy-badge">${product.energy_rating}</div>
+                                ${applianceImage(product)}
+                            </div>
+                            <div class="card-body">
+                                <h5 class="mb-2">${product.name}</h5>
+                                <p class="brand-text mb-2">${product.brand}</p>
+                                <div class="price-display text-primary">₹${product.price.toLocaleString('en-IN')}</div>
+                                ${product.annual_cost ? `<p class="annual-cost mb-3"><i class="fas fa-rupee-sign"></i> ${product.annual_cost}/year</p>` : ''}
+                                <span class="subcategory-badge">${product.subcategory_name}</span>
+                                <ul class="feature-list mt-3 ps-0">
+                                    ${product.features.map(f => `<li>${f}</li>`).join('')}
+                                </ul>
+                                <button type="button" class="btn btn-link btn-sm p-0 similar-link"
+                                        data-appliance-id="${product.id}">More like this</button>
+                            </div>
+                        </div>
+                    </div>
+                `;
+            }
+
+            // Trade-off chart: the Pareto frontier as price against annual kWh, coloured by star rating
+            const TIER_COLORS = { 5: '#27ae60', 4: '#2ecc71', 3: '#f1c40f', 2: '#e67e22', 1: '#e74c3c', 0: '#95a5a6' };
+
+            function drawParetoChart(points) {
+                const svg = document.getElementById('pareto-chart');
+                const width = 640, height = 260, left = 60, right = 20, top = 10, bottom = 40;
+                const plotted = points.filter(point => point.annual_kwh !== null);
+                svg.replaceChildren();
+                document.getElementById('pareto-count').textContent = plotted.length;
+                if (!plotted.length) return;
+                const maxPrice = Math.max(...plotted.map(point => point.price)) || 1;
+                const maxKwh = Math.max(...plotted.map(point => point.annual_kwh)) || 1;
+                const x = price => left + (price / maxPrice) * (width - left - right);
+                const y = kwh => height - bottom - (kwh / maxKwh) * (height - top - bottom);
+                const node = (name, attributes, text) => {
+                    const element = document.createElementNS('http://www.w3.org/2000/svg', name);
+                    Object.entries(attributes).forEach(([key, value]) => element.setAttribute(key, value));
+                    if (text !== undefined) element.textContent = text;
+                    svg.appendChild(element);
+                    return element;
+                };
+                node('line', { x1: left, y1: height - bottom, x2: width - right, y2: height - bottom, stroke: '#7f8c8d' });
+                node('line', { x1: left, y1: top, x2: left, y2: height - bottom, stroke: '#7f8c8d' });
+                node('text', { x: (left + width - right) / 2, y: height - 8, 'text-anchor': 'middle' }, 'Price (₹)');
+                node('text', { x: 12, y: (top + height - bottom) / 2, 'text-anchor': 'middle',
+                               transform: `rotate(-90 12 ${(top + height - bottom) / 2})` }, 'kWh / year');
+                node('text', { x: width - right, y: height - bottom + 16, 'text-anchor': 'end' },
+                     `₹${maxPrice.toLocaleString('en-IN')}`);
+                node('text', { x: left - 6, y: top + 10, 'text-anchor': 'end' }, maxKwh.toLocaleString('en-IN'));
+                plotted.forEach(point => {
+                    const dot = node('circle', { cx: x(point.price), cy: y(point.annual_kwh), r: 5,
+                                                 fill: TIER_COLORS[point.energy_tier] || TIER_COLORS[0] });
+                    const title = document.createElementNS('http://www.w3.org/2000/svg', 'title');
+                    title.textContent = `${point.name} (${point.brand}): ₹${point.price.toLocaleString('en-IN')}, ` +
+                        `${point.annual_kwh} kWh/year, ${point.energy_rating}`;
+                    dot.appendChild(title);
+                });
+            }
+
+            function loadParetoChart(query) {
+                const params = new URLSearchParams({ budget: query.budget });
+                if (query.category_id) params.set('category_id', query.category_id);
+                if (query.subcategory_id) params.set('subcategory_id', query.subcategory_id);
+                fetch(`/api/pareto?${params}`)
+                    .then(response => response.json())
+                    .then(data => {
+                        if (query !== currentQuery) return;
+                        drawParetoChart(data.frontier);
+                        document.getElementById('pareto-section').classList.remove('d-none');
+                    })
+                    .catch(error => console.error('Error loading trade-offs:', error));
+            }
+
+            // "More like this": neighbors of one appliance within its subcategory
+            document.addEventListener('click', function(e) {
+                const link = e.target.closest('.similar-link');
+                if (!link) return;
+                const name = link.closest('.card-body').querySelector('h5').textContent;
+                fetch(`/api/appliances/${encodeURIComponent(link.dataset.applianceId)}/similar`)
+                    .then(response => response.json())
+                    .then(data => {
+                        document.getElementById('similar-to').textContent = `Closest matches to ${name}`;
+                        document.getElementById('similar-results').innerHTML = data.similar.length
+                            ? data.similar.map(recommendationCard).join('')
+                            : '<div class="col-12 text-center py-4 text-muted">No similar appliances found</div>';
+                        const section = document.getElementById('similar-section');
+                        section.classList.remove('d-none');
+                        section.scrollIntoView({ behavior: 'smooth' });
+                    })
+                    .catch(error => console.error('Error loading similar appliances:', error));
+            });
+
+            // Facet sidebar: counts come with the first page of every recommendation search
+            const selectedBrands = new Set();
+            const tierSelect = document.getElementById('min-energy-tier');
+            Array.from(tierSelect.options).forEach(option => { option.dataset.label = option.textContent; });
+
+            function facetCount(count) {
+                const span = document.createElement('span');
+                span.className = 'facet-count';
+                span.textContent = `(${count.toLocaleString('en-IN')})`;
+                return span;
+            }
+
+            function renderFacets(facets) {
+                const brandFacets = document.getElementById('brand-facets');
+                brandFacets.replaceChildren();
+                facets.brands.forEach(({ brand, count }) => {
+                    const wrapper = document.createElement('div');
+                    wrapper.className = 'form-check form-check-inline';
+                    const checkbox = document.createElement('input');
+                    checkbox.type = 'checkbox';
+                    checkbox.className = 'form-check-input';
+                    checkbox.id = `brand-${brand}`;
+                    checkbox.checked = selectedBrands.has(brand);
+                    checkbox.addEventListener('change', () => {
+                        if (checkbox.checked) selectedBrands.add(brand); else selectedBrands.delete(brand);
+                        document.getElementById('search-form').requestSubmit();
+                    });
+                    const label = document.createElement('label');
+                    label.className = 'form-check-label';
+                    label.htmlFor = checkbox.id;
+                    label.append(`${brand} `, facetCount(count));
+                    wrapper.append(checkbox, label);
+                    brandFacets.appendChild(wrapper);
+                });
+
+                // A tier's count covers that exact rating; the option keeps every rating at or above it
+                const tierCounts = Object.fromEntries(facets.energy_tiers.map(({ tier, count }) => [tier, count]));
+                Array.from(tierSelect.options).forEach(option => {
+                    if (!option.value) return;
+                    const count = Object.entries(tierCounts)
+                        .filter(([tier]) => Number(tier) >= Number(option.value))
+                        .reduce((total, [, tierCount]) => total + tierCount, 0);
+                    option.textContent = `${option.dataset.label} (${count.toLocaleString('en-IN')})`;
+                });
+
+                const priceFacets = document.getElementById('price-facets');
+                priceFacets.replaceChildren();
+                facets.price_bands.forEach(({ min, max, count }) => {
+                    if (!count) return;
+                    const band = document.createElement('button');
+                    band.type = 'button';
+                    band.className = 'btn btn-sm btn-outline-secondary';
+                    const text = max === null ? `₹${min.toLocaleString('en-IN')}+`
+                        : `₹${min.toLocaleString('en-IN')}–${max.toLocaleString('en-IN')}`;
+                    band.append(`${text} `, facetCount(count));
+                    band.addEventListener('click', () => {
+                        document.getElementById('min-price').value = min;
+                        if (max !== null) document.getElementById('budget').value = max;
+                        document.getElementById('search-form').requestSubmit();
+                    });
+                    priceFacets.appendChild(band);
+                });
+            }
+
+            // Infinite scroll: the ranking is fetched a page at a time
+            const PAGE_SIZE = 12;
+            let currentQuery = null;
+            let nextCursor = null;
+            let loadingPage = false;
+
+            function fetchRecommendations(cursor) {
+                if (currentQuery.q) {
+                    // Text searches come back as a single page shaped like a recommendation page
+                    const params = new URLSearchParams({ q: currentQuery.q, budget: currentQuery.budget,
+                                                         eco_priority: currentQuery.eco_priority, limit: 4 * PAGE_SIZE });
+                    if (currentQuery.category_id) params.set('category_id', currentQuery.category_id);
+                    if (currentQuery.subcategory_id) params.set('subcategory_id', currentQuery.subcategory_id);
+                    return fetch(`/api/search?${params}`).then(response => response.json());
+                }
+                return fetch('/api/recommend', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ ...currentQuery, limit: PAGE_SIZE, cursor: cursor })
+                }).then(response => response.json());
+            }
+
+            function loadNextPage() {
+                if (!nextCursor || loadingPage) return;
+                loadingPage = true;
+                const query = currentQuery;
+                fetchRecommendations(nextCursor)
+                    .then(data => {
+                        // Ignore pages for a search the user has since replaced
+                        if (query !== currentQuery) return;
+                        document.getElementById('results').insertAdjacentHTML(
+                            'beforeend', data.recommendations.map(recommendationCard).join(''));
+                        nextCursor = data.next_cursor;
+                        watchSentinel();
+                    })
+                    .catch(error => console.error('Error loading more recommendations:', error))
+                    .finally(() => { loadingPage = false; });
+            }
+
+            const sentinel = document.getElementById('results-sentinel');
+            const pageObserver = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting)) loadNextPage();
+            }, { rootMargin: '400px' });
+
+            // Re-observing reports the current state, so a short page still pulls the next one
+            function watchSentinel() {
+                pageObserver.unobserve(sentinel);
+                pageObserver.observe(sentinel);
+            }
+
             // Form submission
             document.getElementById('search-form').addEventListener('submit', function(e) {
                 e.preventDefault();
+                clearTimeout(suggestTimer);
+                if (suggestRequest) suggestRequest.abort();
+                hideSuggestions();
 
                 const categoryId = document.getElementById('category').value || null;
                 const subcategoryId = document.getElementById('subcategory').value || null;
                 const budget = document.getElementById('budget').value;
                 const ecoPriority = document.getElementById('eco-priority').value / 100;
+                const text = document.getElementById('query').value.trim();
+                const minPrice = document.getElementById('min-price').value;
+                const minEnergyTier = tierSelect.value;
+                const features = document.getElementById('features').value
+                    .split(',').map(feature => feature.trim()).filter(Boolean);
 
                 // Show loading state
                 document.getElementById('results').innerHTML = `
@@ -1523,18 +4154,27 @@ document.getElementById('category').addEventListener('change', function() {
                     </div>
                 `;
 
-                fetch('/api/recommend', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        category_id: categoryId,
-                        subcategory_id: subcategoryId,
-                        budget: parseFloat(budget),
-                        eco_priority: parseFloat(ecoPriority)
-                    })
-                })
-                .then(response => response.json())
+                currentQuery = {
+                    q: text || null,
+                    category_id: categoryId,
+                    subcategory_id: subcategoryId,
+                    budget: parseFloat(budget),
+                    eco_priority: parseFloat(ecoPriority),
+                    brands: Array.from(selectedBrands),
+                    min_energy_tier: minEnergyTier ? parseInt(minEnergyTier) : null,
+                    min_price: minPrice ? parseFloat(minPrice) : null,
+                    features: features
+                };
+                nextCursor = null;
+                const query = currentQuery;
+                loadParetoChart(query);
+
+                fetchRecommendations(null)
                 .then(data => {
+                    if (query !== currentQuery) return;
+                    nextCursor = data.next_cursor;
+                    if (data.facets) renderFacets(data.facets);
+
                     // Update energy info
                     document.getElementById('energy-price').textContent =
                         `₹${data.energy_data.price_per_kwh}/kWh`;
@@ -1550,7 +4190,7 @@ document.getElementById('category').addEventListener('change', function() {
                                     <div class="card h-100 appliance-card">
                                         <div class="position-relative">
                                             <div class="energy-badge">${product.energy_rating}</div>
-                                            <img src="${product.image_url}" class="card-img-top appliance-img">
+                                            ${applianceImage(product)}
                                         </div>
                                         <div class="card-body">
                                             <h5 class="mb-2">${product.name}</h5>
@@ -1570,28 +4210,7 @@ document.getElementById('category').addEventListener('change', function() {
                     // Display recommendations
                     let resultsHtml = '';
                     if (data.recommendations && data.recommendations.length > 0) {
-                        data.recommendations.forEach(product => {
-                            resultsHtml += `
-                                <div class="col">
-                                    <div class="card h-100 appliance-card">
-                                        <div class="position-relative">
-                                            <div class="energy-badge">${product.energy_rating}</div>
-                                            <img src="${product.image_url}" class="card-img-top appliance-img">
-                                        </div>
-                                        <div class="card-body">
-                                            <h5 class="mb-2">${product.name}</h5>
-                                            <p class="brand-text mb-2">${product.brand}</p>
-                                            <div class="price-display text-primary">₹${product.price.toLocaleString('en-IN')}</div>
-                                            ${product.annual_cost ? `<p class="annual-cost mb-3"><i class="fas fa-rupee-sign"></i> ${product.annual_cost}/year</p>` : ''}
-                                            <span class="subcategory-badge">${product.subcategory_name}</span>
-                                            <ul class="feature-list mt-3 ps-0">
-                                                ${product.features.map(f => `<li>${f}</li>`).join('')}
-                                            </ul>
-                                        </div>
-                                    </div>
-                                </div>
-                            `;
-                        });
+                        resultsHtml = data.recommendations.map(recommendationCard).join('');
                     } else {
                         resultsHtml = `
                             <div class="col-12 text-center py-5">
@@ -1602,6 +4221,7 @@ document.getElementById('category').addEventListener('change', function() {
                         `;
                     }
                     document.getElementById('results').innerHTML = resultsHtml;
+                    watchSentinel();
                 })
                 .catch(error => {
                     document.getElementById('results').innerHTML = `
@@ -1620,6 +4240,96 @@ document.getElementById('category').addEventListener('change', function() {
 </html>
 """
 
-if __name__ == '__main__':
-    port = int(os.environ.get("PORT", 5000))
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='EcoSmart Appliance Finder')
+    commands = parser.add_subparsers(dest='command')
+
+    serve = commands.add_parser('serve', help='run the web app (default)')
+    serve.add_argument('--port', type=int, default=int(os.environ.get("PORT", 5000)))
+
+    commands.add_parser('check-plans', help='fail if any app query plan scans a table it should search')
+
+    build_images = commands.add_parser('build-images', help='generate resized JPEG/WebP image derivatives')
+    build_images.add_argument('--source', default=IMAGE_DIR)
+    build_images.add_argument('--widths', type=int, nargs='+', default=list(IMAGE_WIDTHS))
+    recommend_bulk_command = commands.add_parser('recommend-bulk',
+                                                 help='recommend for a CSV/JSONL file of preference rows')
+    recommend_bulk_command.add_argument('input', help='.csv with a header row, or JSON Lines')
+    recommend_bulk_command.add_argument('--output', default='-', help='JSON Lines output (default stdout)')
+    recommend_bulk_command.add_argument('--workers', type=int, default=os.cpu_count())
+    recommend_bulk_command.add_argument('--limit', type=int, default=DEFAULT_PAGE_SIZE)
+    recommend_bulk_command.add_argument('--chunk-size', type=int, default=BULK_CHUNK_SIZE)
+    generate_catalog = commands.add_parser('generate-catalog', help='write synthetic appliances as CSV/JSONL')
+    generate_catalog.add_argument('--count', type=int, default=100_000)
+    generate_catalog.add_argument('--seed', type=int, default=0)
+    generate_catalog.add_argument('--output', default='-', help='.csv or JSON Lines (default stdout)')
+    load_catalog = commands.add_parser('load-catalog', help='bulk load appliances from a CSV/JSONL file')
+    load_catalog.add_argument('input')
+    load_catalog.add_argument('--db', default=DB_PATH)
+    load_catalog.add_argument('--replace', action='store_true', help='delete existing appliances first')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'check-plans':
+        with db_pool.connection() as db:
+            for name, plan in explain_query_plans(db).items():
+                print(f'{name}:')
+                for detail in plan:
+                    print(f'    {detail}')
+            problems = check_query_plans(db)
+        for name, detail in problems:
+            print(f'SCAN regression in {name}: {detail}', file=sys.stderr)
+        return 1 if problems else 0
+
+    if args.command == 'build-images':
+        stats = build_image_derivatives(args.source, tuple(sorted(args.widths)))
+        print(f"{stats['sources']} images ({stats['rebuilt']} rebuilt, {stats['skipped']} skipped): "
+              f"{stats['source_bytes'] / 1e6:.1f} MB of sources -> "
+              f"{stats['derived_bytes'] / 1e6:.1f} MB of derivatives in {DERIVED_IMAGE_DIR}")
+        return 0
+
+    if args.command == 'recommend-bulk':
+        started = time.perf_counter()
+        if args.output == '-':
+            count = recommend_bulk(args.input, sys.stdout, args.workers, max(args.limit, 1), args.chunk_size)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as output:
+                count = recommend_bulk(args.input, output, args.workers, max(args.limit, 1), args.chunk_size)
+        elapsed = time.perf_counter() - started
+        print(f'{count} rows in {elapsed:.1f}s ({count / elapsed:.0f} rows/sec) with {args.workers} workers',
+              file=sys.stderr)
+        return 0
+
+    if args.command == 'generate-catalog':
+        started = time.perf_counter()
+        records = generate_appliances(args.count, args.seed)
+        if args.output == '-':
+            count = write_records(records, sys.stdout, args.output)
+        else:
+            with open(args.output, 'w', newline='', encoding='utf-8') as output:
+                count = write_records(records, output, args.output)
+        elapsed = time.perf_counter() - started
+        print(f'{count} appliances in {elapsed:.1f}s ({count / elapsed:.0f} rows/sec)', file=sys.stderr)
+        return 0
+
+    if args.command == 'load-catalog':
+        started = time.perf_counter()
+        try:
+            count = bulk_load_appliances(args.input, args.db, args.replace)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - started
+        print(f'{count} appliances loaded into {args.db} in {elapsed:.1f}s ({count / elapsed:.0f} rows/sec)',
+              file=sys.stderr)
+        return 0
+
+    port = args.port if args.command == 'serve' else int(os.environ.get("PORT", 5000))
+    with app.app_context():
+        get_index_page()
     app.run(debug=False, host='0.0.0.0', port=port)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
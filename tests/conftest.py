@@ -0,0 +1,40 @@
+import os
+import sqlite3
+import sys
+import tempfile
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+# dtbs migrates and seeds APPLIANCES_DB on import, so point it at a scratch file first
+os.environ['APPLIANCES_DB'] = os.path.join(tempfile.mkdtemp(prefix='dtbs-tests-'), 'appliances.db')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dtbs  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return dtbs.app.test_client()
+
+
+@pytest.fixture
+def write_db():
+    """Read-write connection to the test database; rows it inserts are removed afterwards"""
+    with closing(sqlite3.connect(dtbs.DB_PATH, timeout=30)) as db:
+        before = db.execute('SELECT IFNULL(MAX(rowid), 0) FROM appliances').fetchone()[0]
+        yield db
+        db.rollback()
+        db.execute('DELETE FROM appliances WHERE rowid > ?', (before,))
+        db.commit()
+
+
+def insert_appliance(db, appliance_id, **columns):
+    """Copy of the first seeded appliance under a new id, with `columns` overridden"""
+    names = [row[1] for row in db.execute('PRAGMA table_info(appliances)')]
+    row = dict(zip(names, db.execute('SELECT * FROM appliances ORDER BY rowid LIMIT 1').fetchone()))
+    row.update(id=appliance_id, **columns)
+    db.execute(f'INSERT INTO appliances ({", ".join(row)}) VALUES ({", ".join("?" * len(row))})',
+               list(row.values()))
+    db.commit()
@@ -0,0 +1,33 @@
+import argparse
+
+import pytest
+
+import bench
+import dtbs
+
+
+def test_summarize_leaves_failures_out_of_the_latencies():
+    summary = bench.summarize([0.001, 0.002, 0.003, 0.004], elapsed=2, errors=3)
+    assert (summary["requests"], summary["errors"], summary["rps"]) == (4, 3, 2.0)
+    assert summary["p50_ms"] == 2.5 and summary["max_ms"] == 4.0
+    assert bench.summarize([], elapsed=1, errors=5) == {"requests": 0, "errors": 5}
+
+
+def test_parse_mix():
+    assert bench.parse_mix('recommend=3, image') == {"recommend": 3.0, "image": 1.0}
+    with pytest.raises(argparse.ArgumentTypeError):
+        bench.parse_mix('recommend=1,upload=2')
+
+
+def test_load_generator_only_requests_urls_the_server_serves():
+    process, port = bench.start_server(dtbs.DB_PATH, 'flask', 1)
+    try:
+        target = bench.Target(port)
+        assert target.category_ids and target.images
+        assert all(path.startswith('/appliance_images/') and target.status(path) == 200 for path in target.images)
+        samples, elapsed = bench.generate_load(target, bench.DEFAULT_MIX, concurrency=2, duration=0.5, seed=1)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    assert all(ok for values in samples.values() for _, ok in values)
+    assert sum(map(len, samples.values())) > 0
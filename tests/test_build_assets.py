@@ -0,0 +1,56 @@
+import json
+
+import build_assets
+import dtbs
+from build_assets import css_codepoints, tree_shake_css
+
+VENDOR_CSS = (
+    ':root{--used:1px;--unused:2px}.card{padding:var(--used)}.modal{display:none}'
+    '.spin{animation:spin 1s}@keyframes spin{to{transform:rotate(360deg)}}@keyframes fade{to{opacity:0}}'
+    '@media (min-width:768px){.card{margin:0}.modal{margin:0}}'
+    '.fa-check:before{content:"\\f00c"}.fa-bolt:before{content:"\\f0e7"}.fa-star:before{content:"\\f005"}'
+)
+
+
+def test_tree_shake_keeps_only_what_the_page_uses():
+    css = tree_shake_css(VENDOR_CSS, {'card', 'spin', 'fa-check', 'fa-bolt'}, set(), {'div'})
+    assert '.card{padding:var(--used)}' in css and '@media (min-width:768px){.card{margin:0}}' in css
+    assert '@keyframes spin' in css and '--used:1px' in css
+    for dropped in ('.modal', '@keyframes fade', '--unused', '.fa-star'):
+        assert dropped not in css
+    assert css_codepoints(css) == {0xf00c, 0xf0e7}
+
+
+def test_build_writes_hashed_files_the_page_and_server_use(tmp_path, monkeypatch):
+    from PIL import Image
+    from flask import render_template_string
+
+    vendor = tmp_path / 'vendor'
+    vendor.mkdir()
+    (vendor / 'bootstrap.min.css').write_text('.container{width:100%}.card{padding:1rem}.modal{display:none}')
+    (vendor / 'fontawesome.min.css').write_text('.fa-leaf:before{content:"\\f06c"}.fa-zzz:before{content:"\\e100"}')
+    (vendor / 'fa-solid-900.woff2').write_bytes(b'wOF2 font')
+    Image.new('RGB', (2000, 1000), 'white').save(vendor / 'background.jpg')
+    # Subsetting needs a real font; here it only has to see the code points the CSS still names
+    seen = []
+    monkeypatch.setattr(build_assets, 'subset_font', lambda data, codepoints: seen.append(codepoints) or data)
+    manifest_path = tmp_path / 'assets' / 'manifest.json'
+
+    stats = build_assets.build_frontend_assets(str(vendor), str(manifest_path))
+    manifest = json.loads(manifest_path.read_text())
+    assert 0xf06c in seen[0] and 0xe100 not in seen[0]
+    assert stats["css_bytes"] < stats["vendor_css_bytes"]
+    for name, entry in manifest["files"].items():
+        assert (manifest_path.parent / name).stat().st_size == entry["size"]
+        for variant in entry["variants"].values():
+            assert (manifest_path.parent / variant["file"]).stat().st_size == variant["size"]
+    stylesheet = manifest["stylesheet"].rsplit('/', 1)[1]
+    assert 'gzip' in manifest["files"][stylesheet]["variants"]
+    assert '.modal' not in (manifest_path.parent / stylesheet).read_text()
+
+    assets = dtbs.frontend_static_assets(manifest)
+    assert set(assets) == set(manifest["files"])
+    with dtbs.app.app_context():
+        page = render_template_string(dtbs.HTML_TEMPLATE, assets=manifest)
+    assert f'<style>{manifest["critical_css"]}</style>' in page
+    assert manifest["stylesheet"] in page and 'cdn.jsdelivr.net' not in page
@@ -0,0 +1,780 @@
+import bisect
+import collections
+import gzip
+import io
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import dtbs
+from conftest import insert_appliance
+
+
+def test_appliance_without_subcategory_is_not_recommended(client, write_db):
+    insert_appliance(write_db, 'ORPHAN1', name='Orphan Cooler', price=100, subcategory_id=99)
+
+    response = client.post('/api/recommend', json={"budget": 1e9, "eco_priority": 0.5, "limit": 50})
+    assert response.status_code == 200
+    assert 'ORPHAN1' not in [p['id'] for p in response.get_json()['recommendations']]
+
+    response = client.post('/api/recommend/batch', json={"profiles": [{"budget": 1e9, "eco_priority": 0}]})
+    assert response.status_code == 200
+
+    response = client.get('/api/search?q=orphan')
+    assert response.status_code == 200
+    assert response.get_json()['recommendations'] == []
+
+
+def _found(client, name):
+    response = client.get(f'/api/search?q={name}&budget=1e9')
+    assert response.status_code == 200
+    [product] = response.get_json()['recommendations']
+    return product
+
+
+def test_appliances_written_after_seeding_are_ingested(client, write_db):
+    insert_appliance(write_db, 'RAW1', name='Zyxwv Cooler', energy_rating='5 Star', annual_consumption='90 kWh/year',
+                     features='["Turbo Mode"]', energy_tier=None, annual_kwh=None, features_json=None)
+    product = _found(client, 'zyxwv')
+    assert (product['energy_tier'], product['annual_kwh'], product['features']) == (5, 90.0, ['Turbo Mode'])
+
+    write_db.execute("UPDATE appliances SET energy_rating = '3 Star', features = '[\"Quiet\"]' WHERE id = 'RAW1'")
+    write_db.commit()
+    product = _found(client, 'zyxwv')
+    assert (product['energy_tier'], product['features']) == (3, ['Quiet'])
+
+
+def test_query_plans_only_scan_allowed_tables():
+    with dtbs.db_pool.connection() as db:
+        assert dtbs.check_query_plans(db) == []
+
+
+def test_malformed_recommend_input_is_rejected(client):
+    for preferences in ({"budget": "lots"}, {"category_id": "kitchen"}, {"category_id": "3.0"},
+                        {"category_id": True}, {"subcategory_id": [1]}, {"subcategory_id": -1},
+                        {"eco_priority": None}, {"limit": "many"}, {"cursor": ["x"]}, {"cursor": "bogus"},
+                        {"min_energy_tier": "high"}, {"brands": 5}, [1, 2]):
+        response = client.post('/api/recommend', json=preferences)
+        assert response.status_code == 400, preferences
+        assert 'error' in response.get_json()
+
+
+def test_ids_may_be_numbers_or_decimal_strings(client):
+    expected = client.post('/api/recommend', json={"category_id": 1, "budget": 1e9}).get_json()
+    for category_id in ("1", " 1 ", 1.0):
+        response = client.post('/api/recommend', json={"category_id": category_id, "budget": 1e9})
+        assert response.get_json() == expected, category_id
+
+
+def test_unknown_static_sendfile_is_rejected_at_startup():
+    result = subprocess.run([sys.executable, '-c', 'import dtbs'], cwd=Path(dtbs.__file__).parent,
+                            env={**os.environ, 'STATIC_SENDFILE': 'x-lighttpd-send-file'},
+                            capture_output=True, text=True)
+    assert result.returncode != 0
+    assert "STATIC_SENDFILE must be empty, x-sendfile or x-accel-redirect, not 'x-lighttpd-send-file'" \
+        in result.stderr
+
+
+def test_bulk_load_rejects_unknown_category_or_subcategory(tmp_path):
+    db_path = str(tmp_path / 'bulk.db')
+    dtbs.init_db(db_path)
+    with closing(sqlite3.connect(db_path)) as db:
+        category_id, subcategory_id = db.execute('SELECT category_id, id FROM subcategories LIMIT 1').fetchone()
+        before = db.execute('SELECT COUNT(*) FROM appliances').fetchone()[0]
+    record = {'name': 'Bulk Fan', 'brand': 'Acme', 'price': 100, 'energy_rating': '4 Star',
+              'annual_consumption': '50 kWh/year', 'features': [],
+              'category_id': category_id, 'subcategory_id': subcategory_id}
+    for bad in ({'category_id': 99}, {'subcategory_id': 99}):
+        path = tmp_path / 'appliances.jsonl'
+        path.write_text(''.join(json.dumps(dict(record, id=f'BULK{n}', **(bad if n == 2 else {}))) + '\n'
+                                for n in (1, 2, 3)))
+        with pytest.raises(ValueError, match=f'near row 2: unknown {next(iter(bad))} 99'):
+            dtbs.bulk_load_appliances(str(path), db_path)
+    with closing(sqlite3.connect(db_path)) as db:
+        assert db.execute('SELECT COUNT(*) FROM appliances').fetchone()[0] == before
+
+
+def test_pareto_skips_appliances_that_cannot_be_shown(client, write_db, monkeypatch):
+    # The cheapest appliance is always on the frontier
+    insert_appliance(write_db, 'ORPHAN2', name='Orphan Heater', price=1, subcategory_id=99)
+    response = client.get('/api/pareto?budget=1e9')
+    assert response.status_code == 200
+    frontier = response.get_json()['frontier']
+    assert frontier and 'ORPHAN2' not in [point['id'] for point in frontier]
+
+    # Rows deleted after the snapshot was taken are missing from the hydration query
+    fetch_product_rows = dtbs.fetch_product_rows
+    monkeypatch.setattr(dtbs, 'fetch_product_rows',
+                        lambda catalog, positions: fetch_product_rows(catalog, positions[1:]))
+    response = client.get('/api/pareto?budget=1e9')
+    assert response.status_code == 200
+    assert [point['id'] for point in response.get_json()['frontier']] == [point['id'] for point in frontier[1:]]
+
+
+def test_batch_names_the_malformed_profile(client):
+    for bad, field in (({"category_id": "abc"}, 'category_id'), ({"subcategory_id": [1]}, 'subcategory_id'),
+                       ({"budget": "lots"}, 'budget'), ("not a profile", 'object')):
+        response = client.post('/api/recommend/batch', json={"profiles": [{"budget": 20000}, bad]})
+        assert response.status_code == 400, bad
+        error = response.get_json()['error']
+        assert error.startswith('profile 1: ') and field in error, error
+
+
+def test_recommend_bulk_reports_bad_rows_and_keeps_going(tmp_path):
+    path = tmp_path / 'preferences.csv'
+    path.write_text('category_id,budget,eco_priority\n'
+                    '1,20000,0.5\nkitchen,20000,0.5\n3.0,20000,0.5\n2,30000,0.9\n,40000,abc\n,40000,0.1\n')
+    output = io.StringIO()
+    assert dtbs.recommend_bulk(str(path), output, workers=2, chunk_size=2) == 6
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line['input'].get('category_id') for line in lines] == ['1', 'kitchen', '3.0', '2', None, None]
+    assert ['error' in line for line in lines] == [False, True, True, False, True, False]
+    assert all(line['recommendations'] for line in lines if 'error' not in line)
+
+
+def test_pareto_rejects_malformed_filters(client):
+    for query in ('category_id=abc', 'subcategory_id=1.5', 'budget=lots', 'limit=many'):
+        response = client.get(f'/api/pareto?{query}')
+        assert response.status_code == 400, query
+        assert 'error' in response.get_json()
+    assert client.get('/api/pareto?category_id=1').status_code == 200
+
+
+def test_out_of_range_budget_and_eco_priority_are_rejected(client):
+    bad = (('budget', 0), ('budget', -100), ('budget', 'nan'), ('budget', 'inf'), ('budget', '-inf'),
+           ('eco_priority', -0.25), ('eco_priority', 1.5), ('eco_priority', 'nan'))
+    for field, value in bad:
+        response = client.post('/api/recommend', json={field: value})
+        assert response.status_code == 400, (field, value)
+        assert field in response.get_json()['error']
+        response = client.post('/api/recommend/batch', json={"profiles": [{field: value}]})
+        assert response.status_code == 400, (field, value)
+        for path in (f'/api/search?q=star&{field}={value}', f'/api/pareto?{field}={value}'):
+            response = client.get(path)
+            assert response.status_code == 400, path
+    for eco_priority in (0, 1):
+        response = client.get(f'/api/search?q=star&eco_priority={eco_priority}')
+        assert response.status_code == 200
+        json.loads(response.get_data(as_text=True), parse_constant=pytest.fail)
+
+
+# Ranking
+def baseline_ranking(db, category_id, subcategory_id, budget, eco_priority):
+    """The original SQL + Python scorer (tiers read case-insensitively since user-002), ties in table order"""
+    query = '''
+    SELECT a.id, a.price, a.energy_rating, a.annual_consumption FROM appliances a
+    JOIN categories c ON a.category_id = c.id
+    JOIN subcategories s ON a.subcategory_id = s.id
+    WHERE a.price <= ?
+    '''
+    params = [budget]
+    if subcategory_id:
+        query += ' AND a.subcategory_id = ?'
+        params.append(subcategory_id)
+    elif category_id:
+        query += ' AND a.category_id = ?'
+        params.append(category_id)
+    products = []
+    for appliance_id, price, rating, consumption in db.execute(query + ' ORDER BY a.rowid', params):
+        rating = rating.lower()
+        energy_score = (5 if '5 star' in rating else 4 if '4 star' in rating else 3 if '3 star' in rating
+                        else 2 if 'na' in rating else 1)
+        score = energy_score * eco_priority + (1 - min(price / budget, 1)) * (1 - eco_priority)
+        eco = '5 star' in rating or float(consumption.split()[0]) < 200
+        products.append((appliance_id, score, eco))
+    products.sort(key=lambda product: product[1], reverse=True)
+    return products
+
+
+def test_ranking_matches_the_baseline_scorer():
+    with closing(sqlite3.connect(dtbs.DB_PATH)) as db:
+        for category_id, subcategory_id in ((None, None), (1, None), (3, None), (None, 1), (2, 4)):
+            for budget in (5000, 30000, 100000):
+                for eco_priority in (0, 0.3, 0.5, 1):
+                    expected = baseline_ranking(db, category_id, subcategory_id, budget, eco_priority)
+                    result = dtbs.recommend_appliances(category_id, subcategory_id, budget, eco_priority, 50)
+                    got = [(p['id'], p['score']) for p in result['recommendations']]
+                    assert [i for i, _ in got] == [i for i, _, _ in expected[:50]]
+                    assert [s for _, s in got] == pytest.approx([s for _, s, _ in expected[:50]])
+                    assert [p['id'] for p in result['eco_picks']] == [i for i, _, eco in expected if eco][:3]
+
+
+# Typed columns
+def test_raw_appliance_strings_are_parsed_once_into_typed_columns():
+    assert [dtbs.parse_energy_tier(r) for r in ('5 Star', '4 star', '3Star', 'NA', '', None)] == [5, 4, 3, 0, 0, 0]
+    assert [dtbs.parse_annual_kwh(c) for c in ('180 kWh', ' 52.5 kWh/year', 'NA', None)] == [180.0, 52.5, None, None]
+    assert dtbs.parse_features('["Smart Inverter", "Wi-Fi"]') == ['Smart Inverter', 'Wi-Fi']
+    assert dtbs.parse_features("['Smart Inverter', 'Wi-Fi']") == ['Smart Inverter', 'Wi-Fi']
+    assert dtbs.parse_features('["55" 4K Panel", "Wi-Fi"]') == ['55" 4K Panel', 'Wi-Fi']
+    assert dtbs.parse_features(None) == []
+    with closing(sqlite3.connect(dtbs.DB_PATH)) as db:
+        assert db.execute(f'SELECT COUNT(*) FROM appliances WHERE {dtbs.PENDING_INGEST}').fetchone()[0] == 0
+        for rating, consumption, features, tier, kwh, features_json in db.execute(
+                'SELECT energy_rating, annual_consumption, features, energy_tier, annual_kwh, features_json '
+                'FROM appliances'):
+            assert (tier, kwh) == (dtbs.parse_energy_tier(rating), dtbs.parse_annual_kwh(consumption))
+            assert json.loads(features_json) == dtbs.parse_features(features)
+
+
+# Migrations
+def test_init_db_migrates_without_touching_existing_data(tmp_path):
+    db_path = str(tmp_path / 'fresh.db')
+    dtbs.init_db(db_path)
+    with closing(sqlite3.connect(db_path)) as db:
+        assert dtbs.get_schema_version(db.cursor()) == dtbs.SCHEMA_VERSION
+        seeded = db.execute('SELECT COUNT(*) FROM appliances').fetchone()[0]
+        insert_appliance(db, 'KEEP1', name='Kept Kettle')
+    dtbs.init_db(db_path)
+    with closing(sqlite3.connect(db_path)) as db:
+        assert db.execute('SELECT COUNT(*) FROM appliances').fetchone()[0] == seeded + 1
+
+    # A database created by the original drop-and-reseed init_db, with a row added by hand since
+    legacy_path = str(tmp_path / 'legacy.db')
+    with closing(sqlite3.connect(legacy_path)) as db:
+        db.executescript('''
+        CREATE TABLE categories (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL);
+        CREATE TABLE subcategories (id INTEGER PRIMARY KEY AUTOINCREMENT, category_id INTEGER NOT NULL,
+                                    name TEXT NOT NULL);
+        CREATE TABLE appliances (id TEXT PRIMARY KEY, name TEXT NOT NULL, brand TEXT NOT NULL,
+                                 price REAL NOT NULL, energy_rating TEXT NOT NULL, annual_consumption TEXT,
+                                 features TEXT, image_url TEXT, category_id INTEGER NOT NULL,
+                                 subcategory_id INTEGER NOT NULL);
+        INSERT INTO categories (name) VALUES ('Kitchen Appliances');
+        INSERT INTO subcategories (category_id, name) VALUES (1, 'Kettle');
+        INSERT INTO appliances VALUES ('LEGACY1', 'Old Kettle', 'Acme', 999, '4 Star', '40 kWh',
+                                       '["Auto Off"]', NULL, 1, 1);
+        ''')
+    dtbs.init_db(legacy_path)
+    with closing(sqlite3.connect(legacy_path)) as db:
+        assert dtbs.get_schema_version(db.cursor()) == dtbs.SCHEMA_VERSION
+        assert db.execute("SELECT name, energy_tier, annual_kwh, features_json FROM appliances "
+                          "WHERE id = 'LEGACY1'").fetchone() == ('Old Kettle', 4, 40.0, '["Auto Off"]')
+
+
+# Connection pool
+def test_pool_reuses_read_only_connections():
+    pool = dtbs.ConnectionPool(dtbs.DB_PATH, size=2)
+    with pool.connection() as first:
+        with pool.connection() as second:
+            assert first is not second
+        with pytest.raises(sqlite3.OperationalError, match='readonly'):
+            first.execute("UPDATE categories SET name = name")
+    for _ in range(3):
+        with pool.connection() as db:
+            assert db in (first, second)
+            assert db.execute('SELECT COUNT(*) FROM categories').fetchone()[0] > 0
+    assert pool.metrics() == {**pool.stats, "size": 2, "open": 2, "idle": 2}
+    assert pool.stats["opened"] == 2 and pool.stats["reused"] == 3
+
+
+# Snapshot refresh
+def _live_rows(catalog):
+    alive = np.flatnonzero(catalog.alive)
+    return {rowid: (price, tier, category_id, subcategory_id, catalog.brands[brand])
+            for rowid, price, tier, category_id, subcategory_id, brand in zip(
+                *(column[alive].tolist() for column in (catalog.rowid, catalog.price, catalog.energy_tier,
+                                                        catalog.category_id, catalog.subcategory_id,
+                                                        catalog.brand_code)))}
+
+
+def _top(catalog, category_id, subcategory_id, budget, eco_priority, eco_only=False):
+    positions, scores = catalog.top(category_id, subcategory_id, budget, eco_priority, 20, eco_only)
+    return list(zip(catalog.rowid[positions].tolist(), np.round(scores, 9).tolist()))
+
+
+def test_incremental_refresh_matches_a_full_reload(write_db):
+    with closing(dtbs.db_pool.connect()) as db:
+        before = dtbs.CatalogSnapshot.load(db)
+        insert_appliance(write_db, 'REFRESH1', name='Refresh Fan', brand='Zephyr', price=10, energy_rating='5 Star')
+        insert_appliance(write_db, 'REFRESH2', name='Refresh Heater', price=20)
+        insert_appliance(write_db, 'REFRESH3', name='Refresh Iron', price=30)
+        inserted = before.refreshed(db, None)
+        write_db.execute("UPDATE appliances SET price = 15000, energy_rating = '2 Star', category_id = 2, "
+                         "subcategory_id = (SELECT MIN(id) FROM subcategories WHERE category_id = 2) "
+                         "WHERE id = 'REFRESH1'")
+        write_db.execute("DELETE FROM appliances WHERE id = 'REFRESH2'")
+        write_db.execute("UPDATE appliances SET subcategory_id = 99 WHERE id = 'REFRESH3'")
+        write_db.commit()
+        dtbs.ingest_pending(db)
+        changed = inserted.refreshed(db, None)
+        full = dtbs.CatalogSnapshot.load(db)
+    # Patched rather than reloaded: positions only ever grow, deleted rows stay as dead entries
+    assert len(inserted) == len(before) + 3 and len(changed) == len(inserted)
+    assert _live_rows(changed) == _live_rows(full)
+    for category_id, subcategory_id in ((None, None), (1, None), (2, None), (None, 1)):
+        for budget, eco_priority in ((1000, 0.5), (20000, 0.2), (100000, 0.9), (50000, 1)):
+            for eco_only in (False, True):
+                assert (_top(changed, category_id, subcategory_id, budget, eco_priority, eco_only)
+                        == _top(full, category_id, subcategory_id, budget, eco_priority, eco_only))
+
+
+# Result cache
+def test_recommend_responses_are_cached_until_the_catalog_changes(client, write_db):
+    stats = dtbs.result_cache.stats
+    preferences = {"budget": 23456, "eco_priority": 0.5, "limit": 5}
+    first = client.post('/api/recommend', json=preferences).get_data()
+    hits = stats["hits"]
+    # Nearby eco priorities share a cache entry
+    assert client.post('/api/recommend', json={**preferences, "eco_priority": 0.501}).get_data() == first
+    assert stats["hits"] == hits + 1
+
+    insert_appliance(write_db, 'CACHED1', name='Cache Buster', price=1, energy_rating='5 Star')
+    response = client.post('/api/recommend', json=preferences).get_json()
+    assert stats["hits"] == hits + 1
+    assert response['recommendations'][0]['id'] == 'CACHED1'
+
+
+def test_result_cache_is_shared_through_its_file(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    writer, reader = dtbs.ResultCache(shared_path=path), dtbs.ResultCache(shared_path=path)
+    writer.put(('all', 0), (1, 'v1'), b'{"cached": true}')
+    assert reader.get(('all', 0), (1, 'v1')) == b'{"cached": true}'
+    assert reader.stats["shared_hits"] == 1
+    assert reader.get(('all', 0), (2, 'v1')) is None
+
+
+# Pagination
+def _walk(client, preferences):
+    ids, cursor = [], None
+    while True:
+        response = client.post('/api/recommend', json={**preferences, "cursor": cursor})
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page['recommendations']) <= preferences['limit']
+        if cursor is not None:
+            assert page['eco_picks'] == [] and page['facets'] is None
+        ids += [p['id'] for p in page['recommendations']]
+        cursor = page['next_cursor']
+        if cursor is None:
+            return ids
+
+
+def test_cursor_walk_covers_the_ranking_without_duplicates_or_gaps(client):
+    with closing(sqlite3.connect(dtbs.DB_PATH)) as db:
+        for category_id, budget, eco_priority in ((None, 1e9, 0.3), (1, 40000, 0.7), (3, 20000, 1)):
+            preferences = {"category_id": category_id, "budget": budget, "eco_priority": eco_priority, "limit": 7}
+            ids = _walk(client, preferences)
+            assert len(ids) == len(set(ids))
+            assert ids == [i for i, _, _ in baseline_ranking(db, category_id, None, budget, eco_priority)]
+
+    first = client.post('/api/recommend', json={"budget": 1e9, "limit": 7}).get_json()
+    assert len(first['recommendations']) == 7
+    # A cursor only resumes the query it came from
+    response = client.post('/api/recommend', json={"budget": 5000, "limit": 7, "cursor": first['next_cursor']})
+    assert response.status_code == 400
+
+
+# Taxonomy
+def test_taxonomy_matches_the_per_category_endpoints_and_answers_304(client):
+    response = client.get('/api/taxonomy')
+    assert response.status_code == 200 and response.cache_control.max_age == dtbs.TAXONOMY_MAX_AGE
+    tree = response.get_json()
+    assert [{"id": c["id"], "name": c["name"]} for c in tree] == client.get('/api/categories').get_json()
+    for category in tree:
+        assert category["subcategories"] == client.get(f'/api/subcategories/{category["id"]}').get_json()
+    assert client.get('/api/subcategories/9999').get_json() == []
+
+    etag = response.headers['ETag']
+    assert client.get('/api/taxonomy', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/api/taxonomy', headers={'If-None-Match': '"stale"'}).status_code == 200
+
+
+# Image derivatives
+def test_image_derivatives_are_built_once_per_source(tmp_path, monkeypatch):
+    from PIL import Image
+
+    source_dir, manifest_path = tmp_path / 'images', tmp_path / 'derived' / 'manifest.json'
+    source_dir.mkdir()
+    Image.new('RGBA', (1000, 500), (0, 128, 0, 128)).save(source_dir / 'WIDE.PNG')
+    Image.new('RGB', (300, 200), 'red').save(source_dir / 'small.jpg')
+    stats = dtbs.build_image_derivatives(str(source_dir), (240, 480, 720), str(manifest_path))
+    assert (stats["sources"], stats["rebuilt"]) == (2, 2)
+
+    images = json.loads(manifest_path.read_text())['images']
+    assert sorted(images) == ['small.jpg', 'wide.png']
+    assert [width for width, _, _ in images['wide.png']['jpeg']] == [240, 480, 720]
+    # Never upscaled past the source width
+    assert [width for width, _, _ in images['small.jpg']['webp']] == [240, 300]
+    for entry in images.values():
+        for file, size in dtbs._derived_files(entry):
+            assert (manifest_path.parent / file).stat().st_size == size
+
+    assert dtbs.build_image_derivatives(str(source_dir), (240, 480, 720), str(manifest_path))["rebuilt"] == 0
+    (source_dir / 'small.jpg').unlink()
+    dtbs.build_image_derivatives(str(source_dir), (240, 480, 720), str(manifest_path))
+    assert sorted(os.listdir(manifest_path.parent)) == sorted(
+        ['manifest.json'] + [file for file, _ in dtbs._derived_files(images['wide.png'])])
+
+    monkeypatch.setattr(dtbs, 'image_manifest', images)
+    jpeg, webp = dtbs.image_srcsets('appliance_images/WIDE.png')
+    assert jpeg.split(', ')[0] == f'/{dtbs.DERIVED_IMAGE_DIR}/{images["wide.png"]["jpeg"][0][1]} 240w'
+    assert webp.endswith(' 720w')
+    assert dtbs.image_srcsets('appliance_images/missing.jpg') == (None, None)
+
+
+# Static delivery
+def test_hashed_images_are_immutable_with_304_and_range(client, tmp_path, monkeypatch):
+    path = tmp_path / 'RF001.jpg'
+    path.write_bytes(bytes(range(256)) * 4)
+    asset = dtbs.StaticAsset(str(path), 1024, 'abc123', 'image/jpeg')
+    monkeypatch.setattr(dtbs, 'image_assets', {'RF001.abc123.jpg': asset})
+
+    response = client.get('/appliance_images/RF001.abc123.jpg')
+    assert response.status_code == 200 and response.get_data() == path.read_bytes()
+    assert response.headers['ETag'] == '"abc123"' and response.accept_ranges == 'bytes'
+    assert response.cache_control.immutable and response.cache_control.max_age == dtbs.STATIC_MAX_AGE
+    assert client.get('/appliance_images/RF001.abc123.jpg',
+                      headers={'If-None-Match': '"abc123"'}).status_code == 304
+    response = client.get('/appliance_images/RF001.abc123.jpg', headers={'Range': 'bytes=10-19'})
+    assert response.status_code == 206 and response.get_data() == bytes(range(10, 20))
+    response = client.get('/appliance_images/RF001.abc123.jpg',
+                          headers={'Range': 'bytes=10-19', 'If-Range': '"stale"'})
+    assert response.status_code == 200
+
+    monkeypatch.setattr(dtbs, 'STATIC_SENDFILE', 'x-sendfile')
+    response = client.get('/appliance_images/RF001.abc123.jpg')
+    assert response.headers['X-Sendfile'] == str(path) and response.get_data() == b''
+    assert response.headers['ETag'] == '"abc123"'
+
+
+# Index page
+def test_index_page_is_served_precompressed_with_etag(client):
+    identity = client.get('/', headers={'Accept-Encoding': 'identity'})
+    assert identity.status_code == 200 and identity.content_encoding is None
+    assert b'EcoSmart Appliance Finder' in identity.get_data()
+    assert 'Accept-Encoding' in identity.headers['Vary']
+
+    gzipped = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.content_encoding == 'gzip'
+    assert gzip.decompress(gzipped.get_data()) == identity.get_data()
+    assert gzipped.headers['ETag'] != identity.headers['ETag']
+    if dtbs.brotli is not None:
+        response = client.get('/', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.content_encoding == 'br'
+        assert dtbs.brotli.decompress(response.get_data()) == identity.get_data()
+
+    assert client.get('/', headers={'Accept-Encoding': 'gzip',
+                                    'If-None-Match': gzipped.headers['ETag']}).status_code == 304
+    assert dtbs.get_index_page() is dtbs.get_index_page()
+
+
+# Batch recommendations
+def test_batch_results_match_single_recommendations(client):
+    profiles = [{"budget": 30000, "eco_priority": 0.2}, {"budget": 30000, "eco_priority": 0.9},
+                {"category_id": 1, "budget": 50000, "eco_priority": 0.5},
+                {"category_id": 1, "budget": 8000, "eco_priority": 0}, {"subcategory_id": 2, "budget": 1e6},
+                {"category_id": 3, "budget": 20000, "eco_priority": 1}]
+    response = client.post('/api/recommend/batch', json={"profiles": profiles, "limit": 10})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert len(results) == len(profiles)
+    for profile, result in zip(profiles, results):
+        single = client.post('/api/recommend', json={**profile, "limit": 10}).get_json()
+        assert result['recommendations'] == single['recommendations']
+        assert result['eco_picks'] == single['eco_picks']
+
+
+def test_recommend_bulk_keeps_input_order_across_workers(tmp_path):
+    rows = [{"category_id": category_id, "budget": budget, "eco_priority": eco_priority}
+            for category_id in (None, 1, 2) for budget in (10000, 40000) for eco_priority in (0.1, 0.8)]
+    path = tmp_path / 'preferences.jsonl'
+    path.write_text(''.join(json.dumps(row) + '\n' for row in rows))
+    output = io.StringIO()
+    assert dtbs.recommend_bulk(str(path), output, workers=3, limit=5, chunk_size=2) == len(rows)
+    expected = dtbs.recommend_many([dtbs.parse_preferences(row)[:4] for row in rows], 5)
+    for line, row, result in zip(output.getvalue().splitlines(), rows, expected):
+        line = json.loads(line)
+        assert line['input'] == row
+        assert [p['id'] for p in line['recommendations']] == [p['id'] for p in result['recommendations']]
+
+
+# Synthetic catalogs and bulk loading
+def test_generated_catalog_round_trips_through_the_bulk_loader(tmp_path):
+    records = list(dtbs.generate_appliances(500, seed=7))
+    assert records == list(dtbs.generate_appliances(500, seed=7))
+    path = tmp_path / 'catalog.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        assert dtbs.write_records(iter(records), output, str(path)) == 500
+
+    db_path = str(tmp_path / 'bulk.db')
+    dtbs.init_db(db_path)
+    schema_query = "SELECT type, name, sql FROM sqlite_master WHERE tbl_name = 'appliances' ORDER BY name"
+    with closing(sqlite3.connect(db_path)) as db:
+        schema = db.execute(schema_query).fetchall()
+    assert dtbs.bulk_load_appliances(str(path), db_path, replace=True) == 500
+    with closing(sqlite3.connect(db_path)) as db:
+        assert db.execute(schema_query).fetchall() == schema
+        assert db.execute('SELECT COUNT(*) FROM appliances').fetchone()[0] == 500
+        assert db.execute(f'SELECT COUNT(*) FROM appliances WHERE {dtbs.PENDING_INGEST}').fetchone()[0] == 0
+        assert db.execute('SELECT COUNT(*) FROM appliances_fts').fetchone()[0] == 500
+        assert db.execute('SELECT appliance_rowid FROM catalog_changes ORDER BY seq DESC LIMIT 1').fetchone()[0] \
+            == dtbs.FULL_RELOAD_MARKER
+        first = records[0]
+        assert db.execute('SELECT name, price, category_id FROM appliances WHERE id = ?', (first['id'],)).fetchone() \
+            == (first['name'], float(first['price']), int(first['category_id']))
+
+
+# Request metrics
+def test_server_timing_and_prometheus_metrics(client):
+    response = client.post('/api/recommend', json={"budget": 34567, "eco_priority": 0.4})
+    timings = dict(part.split(';dur=') for part in response.headers['Server-Timing'].split(', '))
+    assert {'snapshot', 'rank', 'total'} <= set(timings)
+    assert all(float(ms) >= 0 for ms in timings.values())
+
+    metrics = client.get('/metrics')
+    assert metrics.content_type.startswith('text/plain; version=0.0.4')
+    text = metrics.get_data(as_text=True)
+    assert 'dtbs_requests_total{endpoint="api_recommend",method="POST",status="200"}' in text
+    assert 'dtbs_request_duration_seconds_count{endpoint="api_recommend"}' in text
+    assert 'dtbs_stage_duration_seconds_bucket{stage="rank",le="+Inf"}' in text
+    assert 'dtbs_catalog_rows ' in text and 'dtbs_db_pool_acquired ' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = dtbs.Histogram('h', 'Test.', 'stage', buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.5, 5):
+        histogram.observe(seconds, 'a')
+    assert histogram.render()[2:] == ['h_bucket{stage="a",le="0.1"} 1', 'h_bucket{stage="a",le="1.0"} 3',
+                                      'h_bucket{stage="a",le="+Inf"} 4', 'h_sum{stage="a"} 6.05',
+                                      'h_count{stage="a"} 4']
+
+
+# Request profiling
+def test_only_requests_with_the_token_are_profiled(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(dtbs, 'PROFILE_DIR', str(tmp_path))
+    monkeypatch.setattr(dtbs, 'PROFILE_TOKEN', 'secret')
+    assert 'X-Profile-File' not in client.get('/api/categories', headers={'X-Profile': 'guess'}).headers
+
+    response = client.get('/api/categories?profile=secret')
+    name = response.headers['X-Profile-File']
+    assert name.startswith('get_categories-') and name.endswith('.prof')
+    summary = (tmp_path / name).with_suffix('.txt').read_text()
+    assert summary.startswith('GET /api/categories?profile=secret') and 'get_categories' in summary
+
+    monkeypatch.setattr(dtbs, 'PROFILE_TOKEN', '')
+    assert 'X-Profile-File' not in client.get('/api/categories?profile=').headers
+
+
+def test_collapse_stack_is_root_first():
+    def inner():
+        return dtbs.collapse_stack(sys._getframe())
+
+    stack = inner().split(';')
+    assert stack[-1].startswith('inner (test_dtbs.py:')
+    assert stack[-2].startswith('test_collapse_stack_is_root_first (test_dtbs.py:')
+
+
+# Slow query log
+def test_slow_queries_are_logged_with_plan_and_parameter_shapes(client, monkeypatch):
+    monkeypatch.setattr(dtbs, 'SLOW_QUERY_SECONDS', 0)
+    monkeypatch.setattr(dtbs, 'slow_queries', collections.deque(maxlen=10))
+    with closing(dtbs.db_pool.connect()) as db:
+        db.execute('SELECT id FROM appliances WHERE id = ? AND price < ?', ('RF001', 1e9)).fetchall()
+    entry = dtbs.slow_queries[-1]
+    assert entry["sql"] == 'SELECT id FROM appliances WHERE id = ? AND price < ?'
+    assert entry["params"] == ['str[5]', 'float'] and 'RF001' not in json.dumps(entry)
+    assert any('USING INDEX' in detail for detail in entry["plan"])
+
+    assert client.get('/admin/slow-queries').status_code == 404
+    monkeypatch.setattr(dtbs, 'ADMIN_TOKEN', 'secret')
+    assert client.get('/admin/slow-queries', headers={'X-Admin-Token': 'wrong'}).status_code == 404
+    response = client.get('/admin/slow-queries', headers={'X-Admin-Token': 'secret'})
+    queries = response.get_json()['queries']
+    assert [q["seconds"] for q in queries] == sorted((q["seconds"] for q in queries), reverse=True)
+    assert any(q["sql"] == entry["sql"] for q in queries)
+
+
+# Search
+def test_fts_query_quotes_every_term():
+    assert dtbs.fts_query('LG 1.5 ton') == '"lg" "1.5" "ton"*'
+    assert dtbs.fts_query('a" OR name:b', any_term=True) == '"a" OR "or" OR "name" OR "b"*'
+    assert dtbs.fts_query(' -*" ') is None
+
+
+def test_search_finds_matches_within_the_filters(client):
+    results = client.get('/api/search?q=sams&budget=40000&eco_priority=0.5&limit=100').get_json()
+    recommendations = results['recommendations']
+    assert recommendations and all('samsung' in (p['brand'] + p['name']).lower() for p in recommendations)
+    assert all(p['price'] <= 40000 for p in recommendations)
+    assert all(0 <= p['score'] <= 1 for p in recommendations)
+    assert [p['score'] for p in recommendations] == sorted((p['score'] for p in recommendations), reverse=True)
+    assert all(p['id'] in {r['id'] for r in recommendations} for p in results['eco_picks'])
+
+    in_category = client.get('/api/search?q=samsung&category_id=1&budget=1e9').get_json()['recommendations']
+    assert in_category and all(p['category_id'] == 1 for p in in_category)
+    # No row has every term, so rows matching some of them are ranked instead
+    partial = client.get('/api/search?q=samsung+zzqqxx&budget=1e9').get_json()['recommendations']
+    assert {p['id'] for p in partial} == {p['id'] for p in client.get(
+        '/api/search?q=samsung&budget=1e9').get_json()['recommendations']}
+    assert client.get('/api/search?q=').status_code == 400
+
+
+# Suggestions
+def test_suggest_completions_match_a_full_scan():
+    # Enough entries that the common prefixes are served from the precomputed trie
+    appliances = [(f'Brand{i % 7}', f'Model {i % 250}') for i in range(600)]
+    index = dtbs.SuggestIndex(appliances, [(1, 1, 'Refrigerators')], {1: 5})
+    assert 'model 1' in index.top
+    for prefix in {key[:n] for key in index.keys for n in range(1, 10)}:
+        matches = [i for i, key in enumerate(index.keys) if key.startswith(prefix)]
+        expected = sorted(matches, key=lambda i: (-index.entries[i][2], len(index.keys[i]), i))
+        assert index.complete(prefix, 5) == expected[:5], prefix
+
+
+def test_suggest_corrects_typos_and_endpoint(client):
+    index = dtbs.SuggestIndex([('Samsung', 'Bespoke 500'), ('Whirlpool', 'Pro 300')],
+                              [(2, 1, 'Refrigerators')], {2: 4})
+    assert [(s['text'], s['corrected']) for s in index.suggest('sams')] == [('Samsung', False)]
+    assert [(s['text'], s['corrected']) for s in index.suggest('smasung ')] == [('Samsung', True)]
+    assert index.suggest('refrig')[0] == {"text": 'Refrigerators', "kind": 'subcategory', "count": 4,
+                                          "corrected": False, "subcategory_id": 2, "category_id": 1}
+    assert index.suggest('   ') == [] and index.suggest('qqqq') == []
+
+    suggestions = client.get('/api/suggest?q=sam&limit=3').get_json()['suggestions']
+    assert 0 < len(suggestions) <= 3 and all(s['text'].lower().startswith('sam') for s in suggestions)
+    assert client.get('/api/suggest?q=sam&limit=x').status_code == 400
+
+
+# Facets
+def test_facet_filters_and_counts_match_a_full_scan(client):
+    catalog = dtbs.get_catalog()
+    with closing(dtbs.db_pool.connect()) as db:
+        ids = dict(db.execute('SELECT rowid, id FROM appliances'))
+        features = dict(db.execute('SELECT id, features_json FROM appliances'))
+    rows = {ids[rowid]: row for rowid, row in _live_rows(catalog).items() if row[2] == 1}
+    body = {"category_id": 1, "budget": 60000, "eco_priority": 0.5, "limit": 100,
+            "brands": ['LG', 'Samsung'], "min_energy_tier": 4, "min_price": 20000}
+
+    def passes(row, brand=True, tier=True, price=True):
+        return ((not brand or row[4] in body["brands"]) and (not tier or row[1] >= body["min_energy_tier"])
+                and (not price or body["min_price"] <= row[0] <= body["budget"]))
+
+    results = client.post('/api/recommend', json=body).get_json()
+    expected = {appliance_id for appliance_id, row in rows.items() if passes(row)}
+    assert 0 < len(expected) < 100
+    assert {p['id'] for p in results['recommendations']} == expected
+    scores = [p['score'] for p in results['recommendations']]
+    assert scores == sorted(scores, reverse=True)
+
+    # Each facet is counted under every filter except its own
+    facets = results['facets']
+    brand_counts = collections.Counter(row[4] for row in rows.values() if passes(row, brand=False))
+    assert {f['brand']: f['count'] for f in facets['brands'] if f['count']} == brand_counts
+    tier_counts = collections.Counter(row[1] for row in rows.values() if passes(row, tier=False))
+    assert {f['tier']: f['count'] for f in facets['energy_tiers']} == tier_counts
+    band_counts = collections.Counter(
+        bisect.bisect_left(dtbs.PRICE_BANDS, row[0]) for row in rows.values() if passes(row, price=False))
+    assert [f['count'] for f in facets['price_bands']] == [band_counts[i] for i in range(len(dtbs.PRICE_BANDS) + 1)]
+
+    body["features"] = ['inverter']
+    results = client.post('/api/recommend', json=body).get_json()
+    with_feature = {appliance_id for appliance_id in expected
+                    if 'inverter' in re.findall(r'\w+', features[appliance_id].lower())}
+    assert 0 < len(with_feature) < len(expected)
+    assert {p['id'] for p in results['recommendations']} == with_feature
+
+    assert client.post('/api/recommend', json=dict(body, min_energy_tier='four')).status_code == 400
+
+
+# Similar appliances
+def _similar_rows(rng, rowids, subcategory_id=1):
+    words = ['inverter', 'smart', 'frost', 'free', 'steam', 'wifi', 'turbo', 'quiet']
+    return [(rowid, subcategory_id, float(rng.integers(5000, 90000)), int(rng.integers(0, 6)),
+             float(rng.integers(50, 900)) if rowid % 7 else None,
+             json.dumps([' '.join(rng.choice(words, 2)) for _ in range(rng.integers(0, 4))]))
+            for rowid in rowids]
+
+
+def _brute_force_neighbors(index, rowid):
+    dense = index._dense(np.arange(len(index)))
+    row = index.local[rowid]
+    scores = dense @ dense[row] + index.numbers @ index.numbers[row]
+    candidates = [i for i in range(len(index)) if index.alive[i] and i != row]
+    candidates.sort(key=lambda i: (-round(scores[i], 9), index.rowid[i]))
+    return index.rowid[candidates[:dtbs.MAX_SIMILAR_LIMIT]].tolist()
+
+
+def test_neighbor_lists_match_a_full_scan_after_updates(monkeypatch):
+    rng = np.random.default_rng(7)
+    rows = _similar_rows(rng, range(1, 81))
+    for precompute_rows in (dtbs.SIMILAR_PRECOMPUTE_ROWS, 0):
+        monkeypatch.setattr(dtbs, 'SIMILAR_PRECOMPUTE_ROWS', precompute_rows)
+        index = dtbs.NeighborIndex(1, rows, change_seq=0)
+        assert np.allclose((index.weights ** 2).sum(axis=1) + (index.numbers ** 2).sum(axis=1), 1)
+        for rowid in (1, 40, 80):
+            assert index.similar(rowid, dtbs.MAX_SIMILAR_LIMIT)[0].tolist() == _brute_force_neighbors(index, rowid)
+
+        # Rows 3 and 4 change, 5 moves to another subcategory, 6 is deleted and 81, 82 are inserted
+        changed = [3, 4, 5, 6, 81, 82]
+        updated = _similar_rows(rng, [3, 4, 81, 82]) + _similar_rows(rng, [5], subcategory_id=2)
+        index.update(changed, updated, change_seq=1, data_version=None)
+        for rowid in range(1, 83):
+            if rowid in (5, 6):
+                assert len(index.similar(rowid)[0]) == 0
+            else:
+                neighbors, similarity = index.similar(rowid, dtbs.MAX_SIMILAR_LIMIT)
+                assert neighbors.tolist() == _brute_force_neighbors(index, rowid), rowid
+                assert list(similarity) == sorted(similarity, reverse=True)
+
+
+def test_similar_endpoint(client):
+    with closing(dtbs.db_pool.connect()) as db:
+        appliance_id, subcategory_id = db.execute('SELECT id, subcategory_id FROM appliances LIMIT 1').fetchone()
+        subcategory = {row[0] for row in db.execute('SELECT id FROM appliances WHERE subcategory_id = ?',
+                                                    (subcategory_id,))}
+    similar = client.get(f'/api/appliances/{appliance_id}/similar?limit=4').get_json()['similar']
+    assert 0 < len(similar) <= 4
+    assert all(p['id'] in subcategory and p['id'] != appliance_id for p in similar)
+    assert [p['score'] for p in similar] == sorted((p['score'] for p in similar), reverse=True)
+    assert client.get('/api/appliances/NOPE/similar').status_code == 404
+    assert client.get(f'/api/appliances/{appliance_id}/similar?limit=x').status_code == 400
+
+
+# Pareto frontier
+def _brute_force_skyline(price, annual_kwh, energy_tier):
+    kwh = np.where(np.isnan(annual_kwh), np.inf, annual_kwh)
+    rows = list(zip(price.tolist(), kwh.tolist(), energy_tier.tolist()))
+    return {i for i, (p, k, t) in enumerate(rows)
+            if not any(q <= p and l <= k and u >= t and (q, l, u) != (p, k, t) for q, l, u in rows)}
+
+
+def test_skyline_matches_a_brute_force_frontier():
+    rng = np.random.default_rng(3)
+    for size in (0, 1, 50, 400):
+        # Coarse values so equal prices, consumptions and identical rows all occur
+        price = rng.integers(1, 40, size).astype(np.float64) * 1000
+        annual_kwh = rng.integers(1, 30, size).astype(np.float64) * 10
+        annual_kwh[rng.random(size) < 0.1] = np.nan
+        energy_tier = rng.integers(0, 6, size)
+        frontier = dtbs.skyline(price, annual_kwh, energy_tier)
+        assert set(frontier.tolist()) == _brute_force_skyline(price, annual_kwh, energy_tier)
+        assert len(set(frontier.tolist())) == len(frontier)
+        assert np.all(np.diff(price[frontier]) >= 0)
+
+
+def test_pareto_endpoint_is_the_frontier_under_the_budget(client):
+    catalog = dtbs.get_catalog()
+    positions = catalog.select(1, None, 40000)
+    expected = {int(catalog.rowid[positions[i]]) for i in _brute_force_skyline(
+        catalog.price[positions], catalog.annual_kwh[positions], catalog.energy_tier[positions])}
+    with closing(dtbs.db_pool.connect()) as db:
+        ids = dict(db.execute('SELECT id, rowid FROM appliances'))
+
+    results = client.get('/api/pareto?category_id=1&budget=40000').get_json()
+    frontier = results['frontier']
+    assert {ids[p['id']] for p in frontier} == expected and results['frontier_size'] == len(expected)
+    assert all(p['price'] <= 40000 for p in frontier)
+    assert [p['price'] for p in frontier] == sorted(p['price'] for p in frontier)
+
+    # A limit samples the frontier evenly, keeping both ends
+    sampled = client.get('/api/pareto?category_id=1&budget=40000&limit=3').get_json()
+    assert len(sampled['frontier']) == 3 and sampled['frontier_size'] == len(expected)
+    assert [sampled['frontier'][i]['id'] for i in (0, -1)] == [frontier[i]['id'] for i in (0, -1)]